@@ -0,0 +1,73 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+
+Measure the time to import `dqrobotics_extensions.pyplot` and to use some of its names, each in a fresh interpreter,
+and which of the heavy dependencies were imported. Run it with
+
+    python benchmarks/import_time.py
+"""
+import subprocess
+import sys
+import json
+import statistics
+
+# The statements timed after `import dqrobotics_extensions.pyplot as dqp`, each in its own interpreter.
+_CASES = {
+    "import": "",
+    "TrajectoryFile": "dqp.TrajectoryFile",
+    "fkm_all": "dqp.fkm_all",
+    "plot": "dqp.plot",
+}
+
+_CHILD = """
+import sys, time, json
+start = time.perf_counter()
+import dqrobotics_extensions.pyplot as dqp
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"time": elapsed,
+                  "dqrobotics": "dqrobotics" in sys.modules,
+                  "matplotlib.pyplot": "matplotlib.pyplot" in sys.modules}}))
+"""
+
+
+def _measure(statement: str, repeat: int) -> list:
+    """
+    Run the import and the statement in `repeat` fresh interpreters.
+    :return: The outputs of each interpreter.
+    """
+    outputs = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", _CHILD.format(statement=statement)],
+                                   check=True, capture_output=True, text=True)
+        outputs.append(json.loads(completed.stdout))
+    return outputs
+
+
+def main(repeat: int = 5):
+    print(f"{'case':<16}{'median':>12}{'min':>12}{'dqrobotics':>14}{'matplotlib.pyplot':>20}")
+    for name, statement in _CASES.items():
+        outputs = _measure(statement, repeat)
+        times = [1e3 * output["time"] for output in outputs]
+        print(f"{name:<16}{statistics.median(times):>9.1f} ms{min(times):>9.1f} ms"
+              f"{str(outputs[0]['dqrobotics']):>14}{str(outputs[0]['matplotlib.pyplot']):>20}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+
+Time each plot primitive and whole-frame renders of the gallery scenes with the Agg backend, and save the results as
+JSON so that they can be compared between commits. For instance
+
+    python benchmarks/suite.py --output before.json
+    git checkout my-branch
+    python benchmarks/suite.py --output after.json
+    python benchmarks/suite.py --compare before.json after.json
+
+Each benchmark is a function, registered with `@benchmark`, that sets up its inputs and returns the callable to be
+timed, in the same spirit of the setup of asv. Only benchmarks whose names contain `--filter` are run.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from math import pi, sin, cos
+from importlib.metadata import version, PackageNotFoundError
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib import pyplot as plt
+
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+import numpy as np
+
+import dqrobotics_extensions.pyplot as dqp
+from dqrobotics_extensions.pyplot import _pyplot
+from dqrobotics_extensions.pyplot.gallery._output_poses import output_poses
+from dqrobotics_extensions.pyplot.gallery._output_lines import output_lines
+from dqrobotics_extensions.pyplot.gallery._output_planes import output_planes
+from dqrobotics_extensions.pyplot.gallery._output_spheres import output_spheres
+from dqrobotics_extensions.pyplot.gallery._utils import _set_plot_labels, _set_plot_limits
+
+# The registered benchmarks, by name, in the order in which they are run.
+_benchmarks = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark. The decorated function takes no arguments, sets up the inputs, and returns the callable
+    whose time is measured.
+    :param name: The name of the benchmark, used as its key in the JSON output.
+    """
+    def register(setup):
+        _benchmarks[name] = setup
+        return setup
+    return register
+
+
+def _new_axes():
+    """
+    A new figure with 3D Axes, with the size used by the gallery.
+    :return: The figure and the Axes.
+    """
+    fig = plt.figure(figsize=(12, 10))
+    return fig, plt.axes(projection='3d')
+
+
+def _removing_artists(ax, function):
+    """
+    Call `function` and then remove the artists it added to `ax`, so that repeated calls do not make the Axes grow.
+    :param ax: The Axes in which `function` draws.
+    :param function: The function to be called.
+    :return: A callable for the benchmark.
+    """
+    def call():
+        function()
+        for artist in list(ax.lines) + list(ax.collections):
+            artist.remove()
+    return call
+
+
+@benchmark("primitive.pose")
+def _bench_pose():
+    fig, ax = _new_axes()
+    x = normalize(1 + i_ + j_) * (1 + 0.5 * E_ * (0.1 * i_ + 0.2 * k_))
+    return _removing_artists(ax, lambda: _pyplot._plot_pose(x, ax=ax))
+
+
+@benchmark("primitive.line")
+def _bench_line():
+    fig, ax = _new_axes()
+    l_dq = k_ + E_ * cross(0.1 * i_, k_)
+    return _removing_artists(ax, lambda: _pyplot._plot_line(l_dq, length=1.0, ax=ax))
+
+
+@benchmark("primitive.lines")
+def _bench_lines():
+    fig, ax = _new_axes()
+    directions = np.random.default_rng(0).normal(size=(200, 3))
+    ls_dq = [normalize(DQ(direction)) + E_ * cross(0.1 * i_, normalize(DQ(direction))) for direction in directions]
+    return _removing_artists(ax, lambda: _pyplot._plot_lines(ls_dq, length=1.0, ax=ax))
+
+
+@benchmark("primitive.plane")
+def _bench_plane():
+    fig, ax = _new_axes()
+    pi_dq = normalize(i_ + j_ + k_) + E_ * 0.1
+    return _removing_artists(ax, lambda: _pyplot._plot_plane(pi_dq,
+                                                             length_x=1.0,
+                                                             length_y=1.0,
+                                                             color="r",
+                                                             alpha=0.5,
+                                                             ax=ax))
+
+
+@benchmark("primitive.planes")
+def _bench_planes():
+    fig, ax = _new_axes()
+    rng = np.random.default_rng(0)
+    pis_dq = [normalize(DQ(normal)) + E_ * distance for normal, distance in zip(rng.normal(size=(200, 3)),
+                                                                                rng.uniform(-0.5, 0.5, size=200))]
+    return _removing_artists(ax, lambda: _pyplot._plot_planes(pis_dq,
+                                                              length_x=1.0,
+                                                              length_y=1.0,
+                                                              color="r",
+                                                              alpha=0.5,
+                                                              ax=ax))
+
+
+@benchmark("primitive.sphere")
+def _bench_sphere():
+    fig, ax = _new_axes()
+    p = 0.1 * i_ + 0.2 * j_
+    return _removing_artists(ax, lambda: _pyplot._plot_sphere(p, radius=0.1, ax=ax))
+
+
+@benchmark("primitive.spheres")
+def _bench_spheres():
+    fig, ax = _new_axes()
+    rng = np.random.default_rng(0)
+    centres = rng.uniform(-0.5, 0.5, size=(50, 3))
+    radii = rng.uniform(0.02, 0.05, size=50)
+    return _removing_artists(ax, lambda: _pyplot._plot_spheres(centres, radii, ax=ax))
+
+
+@benchmark("primitive.cylinder")
+def _bench_cylinder():
+    fig, ax = _new_axes()
+    x = normalize(1 + i_) * (1 + 0.5 * E_ * 0.1 * k_)
+    plot_cylinder = getattr(_pyplot, "__plot_cylinder")
+    return _removing_artists(ax, lambda: plot_cylinder(x,
+                                                       height_z=0.07,
+                                                       radius=0.02,
+                                                       color="b",
+                                                       alpha=0.8,
+                                                       ax=ax))
+
+
+@benchmark("primitive.dq_adjoint_grid")
+def _bench_dq_adjoint_grid():
+    x = normalize(1 + i_) * (1 + 0.5 * E_ * 0.1 * k_)
+    x_grid, y_grid, z_grid = np.meshgrid(np.linspace(-1, 1, 20), np.linspace(-1, 1, 20), np.zeros(1))
+    dq_adjoint_grid = getattr(_pyplot, "__dq_adjoint_grid")
+    return lambda: dq_adjoint_grid(x, x_grid, y_grid, z_grid)
+
+
+@benchmark("primitive.serial_manipulator")
+def _bench_serial_manipulator():
+    fig, ax = _new_axes()
+    robot = KukaLw4Robot.kinematics()
+    q = np.deg2rad([0, 45, 0, -45, 0, 45, 0])
+    return _removing_artists(ax, lambda: _pyplot._plot_serial_manipulator(robot, q, ax=ax))
+
+
+@benchmark("primitive.serial_manipulator_update")
+def _bench_serial_manipulator_update():
+    fig, ax = _new_axes()
+    robot = KukaLw4Robot.kinematics()
+    qs = np.random.default_rng(0).uniform(-pi, pi, size=(64, 7))
+    handle = dqp.plot(robot, q=qs[0], ax=ax)
+    frames = iter(range(sys.maxsize))
+    return lambda: handle.update(qs[next(frames) % len(qs)])
+
+
+@benchmark("primitive.serial_manipulators_update")
+def _bench_serial_manipulators_update():
+    fig, ax = _new_axes()
+    robots = [KukaLw4Robot.kinematics() for _ in range(10)]
+    for k, robot in enumerate(robots):
+        robot.set_reference_frame(1 + 0.5 * E_ * (0.5 * (k % 5) * i_ + 0.5 * (k // 5) * j_))
+    qs = np.random.default_rng(0).uniform(-pi, pi, size=(64, 10, 7))
+    handle = dqp.plot(list(zip(robots, qs[0])), ax=ax)
+    frames = iter(range(sys.maxsize))
+    return lambda: handle.update(qs[next(frames) % len(qs)])
+
+
+@benchmark("primitive.workspace_sampling")
+def _bench_workspace_sampling():
+    robot = KukaLw4Robot.kinematics()
+    return lambda: dqp.sample_workspace(robot, 100000, bins=48, seed=0)
+
+
+@benchmark("primitive.workspace_voxels")
+def _bench_workspace_voxels():
+    fig, ax = _new_axes()
+    histogram = dqp.sample_workspace(KukaLw4Robot.kinematics(), 100000, bins=48, seed=0)
+    return _removing_artists(ax, lambda: dqp.plot_workspace(histogram, ax=ax))
+
+
+def _gallery_scene(output_function):
+    """
+    A benchmark of a static gallery scene, drawn and saved as PNG in a temporary directory.
+    :param output_function: The function of `gallery` that draws and saves the scene.
+    :return: A callable for the benchmark.
+    """
+    directory = tempfile.mkdtemp()
+
+    def call():
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            output_function()
+        finally:
+            os.chdir(cwd)
+            plt.close("all")
+    return call
+
+
+@benchmark("gallery.poses")
+def _bench_gallery_poses():
+    return _gallery_scene(output_poses)
+
+
+@benchmark("gallery.lines")
+def _bench_gallery_lines():
+    return _gallery_scene(output_lines)
+
+
+@benchmark("gallery.planes")
+def _bench_gallery_planes():
+    return _gallery_scene(output_planes)
+
+
+@benchmark("gallery.spheres")
+def _bench_gallery_spheres():
+    return _gallery_scene(output_spheres)
+
+
+@benchmark("gallery.moving_primitives_frame")
+def _bench_gallery_moving_primitives_frame():
+    # One frame of `output_moving_primitives`, cleared, plotted, and drawn as in the gallery
+    fig, ax = _new_axes()
+    r = cos(5 * 0.5) + j_ * sin(5 * 0.5)
+    x = r + 0.5 * E_ * 0.1 * (i_ + j_ + k_) * sin(0.5) * r
+    ls_dq = [Ad(x, l_dq) for l_dq in [i_, j_, k_]]
+    pis_dq = [Adsharp(x, pi_dq) for pi_dq in [k_, normalize(i_ + j_), normalize(i_ + j_ + k_)]]
+
+    def call():
+        plt.cla()
+        _set_plot_limits()
+        _set_plot_labels()
+        plt.title('Animation time=0.50 s out of 1.00 s')
+        dqp.plot(x)
+        for l_dq, color in zip(ls_dq, ['r+-', 'k.-', 'g+-']):
+            dqp.plot(l_dq, line=True, scale=1, color=color)
+        for pi_dq, color in zip(pis_dq, ['r', 'k', 'g']):
+            dqp.plot(pi_dq, plane=True, scale=1, color=color, alpha=0.2)
+        fig.canvas.draw()
+    return call
+
+
+@benchmark("gallery.moving_manipulators_frame")
+def _bench_gallery_moving_manipulators_frame():
+    # One frame of `output_moving_manipulators`, cleared, plotted, and drawn as in the gallery
+    fig, ax = _new_axes()
+    R1 = KukaLw4Robot.kinematics()
+    R1.set_reference_frame(cos(pi / 2) + k_ * sin(pi / 2))
+    R2 = KukaLw4Robot.kinematics()
+    R2.set_reference_frame(1 + 0.5 * E_ * (0.75 * i_ + 0.75 * j_))
+    q = np.deg2rad([0, 45, 0, -45, 0, 45, 0])
+
+    def call():
+        plt.cla()
+        _set_plot_limits(-0, 1.0)
+        _set_plot_labels()
+        plt.title('Joint control time=0.50 s out of 1.00 s')
+        dqp.plot(R1, q=q,
+                 line_color='r',
+                 line_width=5,
+                 cylinder_color="k",
+                 cylinder_alpha=0.9,
+                 cylinder_radius=0.035,
+                 cylinder_height=0.1)
+        dqp.plot(R2, q=q,
+                 line_color='b',
+                 cylinder_color="c",
+                 cylinder_alpha=0.3)
+        fig.canvas.draw()
+    return call
+
+
+def _time(function, repeat: int, min_time: float) -> dict:
+    """
+    Time a callable as `timeit` does, choosing the number of calls per repetition so that each one takes at least
+    `min_time` seconds.
+    :param function: The callable.
+    :param repeat: The number of repetitions.
+    :param min_time: The minimum duration of each repetition in seconds.
+    :return: The statistics of the time per call in seconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "number": number,
+            "repeat": repeat}
+
+
+def _commit() -> str:
+    """
+    The current git commit of the repository, or None if it is not available.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version(package: str) -> str:
+    """
+    The installed version of a package, or None if it is not available.
+    """
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def run(names: list, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Run benchmarks.
+    :param names: The names of the benchmarks to run.
+    :param repeat: The number of repetitions of each benchmark.
+    :param min_time: The minimum duration of each repetition in seconds.
+    :return: The results, as saved in the JSON output.
+    """
+    results = {}
+    for name in names:
+        function = _benchmarks[name]()
+        results[name] = _time(function, repeat=repeat, min_time=min_time)
+        plt.close("all")
+        print(f"{name:<45}{1e3 * results[name]['min']:>12.3f} ms", flush=True)
+
+    return {"commit": _commit(),
+            "machine": {"platform": platform.platform(),
+                        "processor": platform.processor(),
+                        "cpu_count": os.cpu_count(),
+                        "python": platform.python_version()},
+            "versions": {package: _version(package) for package in ("numpy", "matplotlib", "dqrobotics")},
+            "benchmarks": results}
+
+
+def compare(before: dict, after: dict, threshold: float = 1.1) -> bool:
+    """
+    Print the ratio between the minimum times of two JSON outputs.
+    :param before: The results of the reference commit.
+    :param after: The results of the new commit.
+    :param threshold: The ratio above which a benchmark is reported as a regression.
+    :return: True if any benchmark regressed.
+    """
+    regressed = False
+    print(f"{'benchmark':<45}{'before':>12}{'after':>12}{'ratio':>9}")
+    for name, result in after["benchmarks"].items():
+        if name not in before["benchmarks"]:
+            continue
+        ratio = result["min"] / before["benchmarks"][name]["min"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  regression"
+            regressed = True
+        print(f"{name:<45}{1e3 * before['benchmarks'][name]['min']:>9.3f} ms"
+              f"{1e3 * result['min']:>9.3f} ms{ratio:>9.2f}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of dqrobotics-pyplot.")
+    parser.add_argument("--output", help="The JSON file in which the results are saved.")
+    parser.add_argument("--filter", default="", help="Only run the benchmarks whose names contain this text.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of repetitions of each benchmark.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="The minimum duration of each repetition in s.")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two JSON outputs.")
+    parser.add_argument("--threshold", type=float, default=1.1, help="The ratio reported as a regression.")
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        with open(args.compare[0]) as before_file, open(args.compare[1]) as after_file:
+            regressed = compare(json.load(before_file), json.load(after_file), threshold=args.threshold)
+        sys.exit(1 if regressed else 0)
+
+    results = run([name for name in _benchmarks if args.filter in name], repeat=args.repeat, min_time=args.min_time)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+
+Compare the time spent in plot calls with each validation policy. The artists are given to a null Axes that ignores
+them, so that only the work done by `dqrobotics-pyplot`, including the validation of the inputs, is timed and not the
+drawing done by `matplotlib`. Run it with
+
+    python benchmarks/validation.py
+"""
+import timeit
+
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+
+_POLICIES = ("strict", "once-per-batch", "off")
+
+
+class _NullAxes:
+    """
+    Stands for both the Axes and the artists. Every method accepts any arguments and returns this object, which also
+    unpacks as a single artist, e.g., `line, = ax.plot3D(...)`.
+    """
+    def __getattr__(self, name):
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __iter__(self):
+        return iter((self,))
+
+
+def _time_per_call(function, repeat: int = 7, number: int = 5) -> float:
+    """
+    The best time of a function call, in milliseconds.
+    """
+    return 1e3 * min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = np.random.default_rng(0)
+    ax = _NullAxes()
+
+    robot = KukaLw4Robot.kinematics()
+    qs = rng.uniform(-np.pi, np.pi, size=(100, 7))
+    handle = dqp.plot(robot, q=qs[0], ax=ax)
+
+    directions = [normalize(DQ(rng.normal(size=3))) for _ in range(200)]
+    lines = [l + E_ * cross(l, DQ(rng.normal(size=3))) for l in directions]
+    planes = [n + E_ * rng.normal() for n in directions]
+    poses = [normalize(DQ(rng.normal(size=4))) * (1 + 0.5 * E_ * DQ(rng.normal(size=3))) for _ in range(200)]
+    # As an array, the poses skip the conversion from DQs, so the checks are a larger part of the call
+    poses_array = np.array([(normalize(DQ(rng.normal(size=4))) * (1 + 0.5 * E_ * DQ(rng.normal(size=3)))).vec8()
+                            for _ in range(5000)])
+
+    benchmarks = {"manipulator, 100 updates": lambda validation: [handle.update(q, validation=validation) for q in qs],
+                  "manipulator, 10 plots": lambda validation: [dqp.plot(robot, q=q, validation=validation, ax=ax)
+                                                               for q in qs[:10]],
+                  "200 poses": lambda validation: dqp.plot(poses, validation=validation, ax=ax),
+                  "200 lines": lambda validation: dqp.plot(lines, line=True, validation=validation, ax=ax),
+                  "200 planes": lambda validation: dqp.plot(planes, plane=True, validation=validation, ax=ax),
+                  "5000 poses, array": lambda validation: dqp.plot(poses_array, validation=validation, ax=ax),
+                  "200 planes, one per call": lambda validation: [dqp.plot(plane, plane=True, validation=validation, ax=ax)
+                                                                  for plane in planes]}
+
+    # The fkm cache would hide the cost of the kinematics, which is the same for all policies
+    dqp.set_options(fkm_cache_size=0)
+
+    print(f"{'benchmark':<28}" + "".join(f"{policy:>18}" for policy in _POLICIES))
+    for name, benchmark in benchmarks.items():
+        times = [_time_per_call(lambda: benchmark(policy)) for policy in _POLICIES]
+        print(f"{name:<28}" + "".join(f"{time:>10.2f} ms ({times[0] / time:.1f}x)" for time in times))
+
+
+if __name__ == "__main__":
+    main()
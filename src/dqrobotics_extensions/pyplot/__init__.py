@@ -1,10 +1,87 @@
-from dqrobotics_extensions.pyplot._pyplot import plot
+from typing import TYPE_CHECKING
+import importlib
+
+# The public names and the submodule defining each of them. The submodules, and with them `dqrobotics` and
+# `matplotlib.pyplot`, are only imported when one of their names is first used, see `__getattr__`. This keeps
+# `import dqrobotics_extensions.pyplot` cheap, e.g., for processes that only use `TrajectoryFile` or `fkm_all`.
+_LAZY_ATTRIBUTES = {
+    "plot": "_pyplot",
+    "SerialManipulatorHandle": "_pyplot",
+    "SerialManipulatorsHandle": "_pyplot",
+    "mesh_cache_info": "_pyplot",
+    "mesh_cache_clear": "_pyplot",
+    "fkm_all": "_kinematics",
+    "fkm_cache_precompute": "_kinematics",
+    "fkm_cache_invalidate": "_kinematics",
+    "fkm_cache_info": "_kinematics",
+    "set_options": "_options",
+    "get_options": "_options",
+    "save_animation": "_export",
+    "OffscreenRenderer": "_offscreen",
+    "animate_stream": "_animation",
+    "TrajectoryWriter": "_trajectory_file",
+    "TrajectoryFile": "_trajectory_file",
+    "profile": "_profiling",
+    "Scene": "_scene",
+    "Trail": "_trail",
+    "WorkspaceHistogram": "_workspace",
+    "sample_workspace": "_workspace",
+    "plot_workspace": "_workspace",
+    "LiveView": "_live",
+    "StreamServer": "_stream",
+    "StreamClient": "_stream",
+    "encode_message": "_stream",
+    "frame_times": "_resample",
+    "frame_indices": "_resample",
+    "resample": "_resample",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from dqrobotics_extensions.pyplot._pyplot import (plot, SerialManipulatorHandle, SerialManipulatorsHandle,
+                                                      mesh_cache_info, mesh_cache_clear)
+    from dqrobotics_extensions.pyplot._kinematics import fkm_all, fkm_cache_precompute, fkm_cache_invalidate, fkm_cache_info
+    from dqrobotics_extensions.pyplot._options import set_options, get_options
+    from dqrobotics_extensions.pyplot._export import save_animation
+    from dqrobotics_extensions.pyplot._offscreen import OffscreenRenderer
+    from dqrobotics_extensions.pyplot._animation import animate_stream
+    from dqrobotics_extensions.pyplot._trajectory_file import TrajectoryWriter, TrajectoryFile
+    from dqrobotics_extensions.pyplot._profiling import profile
+    from dqrobotics_extensions.pyplot._scene import Scene
+    from dqrobotics_extensions.pyplot._trail import Trail
+    from dqrobotics_extensions.pyplot._workspace import WorkspaceHistogram, sample_workspace, plot_workspace
+    from dqrobotics_extensions.pyplot._live import LiveView
+    from dqrobotics_extensions.pyplot._stream import StreamServer, StreamClient, encode_message
+    from dqrobotics_extensions.pyplot._resample import frame_times, frame_indices, resample
 #from . import gallery
 
-# https://setuptools-git-versioning.readthedocs.io/en/stable/runtime_version.html
-from importlib.metadata import version, PackageNotFoundError
-try:
-    __version__ = version("dqrobotics-pyplot")
-except PackageNotFoundError:
-    # package is not installed
-    pass
\ No newline at end of file
+
+def __getattr__(name: str):
+    """
+    Import the submodule of a public name when it is first used and keep the name in this module, so that this is
+    only called once per name.
+    :param name: The name of the attribute.
+    :return: The attribute.
+    :raises AttributeError: If the attribute does not exist.
+    """
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}"), name)
+    elif name == "__version__":
+        # Looking up the metadata of the installed packages is also slow, so it is deferred as well
+        # https://setuptools-git-versioning.readthedocs.io/en/stable/runtime_version.html
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            value = version("dqrobotics-pyplot")
+        except PackageNotFoundError:
+            # package is not installed
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
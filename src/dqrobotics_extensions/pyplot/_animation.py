@@ -0,0 +1,127 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import itertools
+
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulator
+
+from dqrobotics_extensions.pyplot._pyplot import _plot_serial_manipulator, _plot_pose, _update_poses
+from dqrobotics_extensions.pyplot._trail import Trail
+
+from matplotlib import pyplot as plt
+import matplotlib.animation as anm # Matplotlib animation
+
+import numpy as np
+
+
+def animate_stream(samples,
+                   robot: DQ_SerialManipulator = None,
+                   fig=None,
+                   ax=None,
+                   trail_length: int = 0,
+                   trail_color = "k",
+                   interval: float = 10,
+                   save_count: int = None,
+                   **kwargs) -> anm.FuncAnimation:
+    """
+    Animate samples as they arrive from an iterator or generator, without storing the whole trajectory. Each sample is
+    a tuple `(time, q)`, with the joint configurations of `robot`, or `(time, x)`, with a unit DQ when `robot` is None.
+
+    The artists are created with the first sample and only updated afterwards. The optional trail of the end effector,
+    or of the pose, keeps only the last `trail_length` positions, so the memory is constant in the number of samples.
+
+    The first sample is taken from `samples` when this is called and drawn by the `init_func` of the animation, so the
+    figure shows the initial state before the first frame and no sample is consumed only to initialize the animation.
+    The samples can be iterated only once, so the animation is created with `repeat=False` and cannot be shown or
+    saved a second time.
+
+        def simulation():
+            q = q_init
+            for time in np.arange(0, time_final + tau, tau):
+                yield time, q
+                q = q + u * tau
+
+        fig = plt.figure()
+        plt.axes(projection='3d')
+        anim = dqp.animate_stream(simulation(), robot=robot, trail_length=100)
+        plt.show()
+
+    :param samples: An iterable of `(time, q)` or `(time, x)` tuples.
+    :param robot: The DQ_SerialManipulator of the joint configurations, or None if the samples are poses.
+    :param fig: The figure of the animation or plt.gcf() if None.
+    :param ax: Figure Axes or fig.gca() if None.
+    :param trail_length: The number of past positions drawn as a trail. No trail is drawn if 0.
+    :param trail_color: A suitable color for the trail.
+    :param interval: The delay between frames in milliseconds.
+    :param save_count: The number of frames rendered if the animation is saved, as in `FuncAnimation`.
+    :param kwargs: The style arguments of `_plot_serial_manipulator` or of `_plot_pose`.
+    :return: The `FuncAnimation`. As with any animation, a reference to it must be kept until it finishes.
+    """
+    if fig is None:
+        fig = plt.gcf()
+    if ax is None:
+        ax = fig.gca()
+
+    # The artists are created with the first sample
+    state = {"handle": None, "pose": None, "trail": None, "drawn": None}
+    samples = iter(samples)
+    first = next(samples, None)
+
+    def update(sample):
+        # The first sample is drawn by `init` and again as the first frame, but is added to the trail only once
+        if sample is state["drawn"]:
+            return
+        state["drawn"] = sample
+        time, value = sample
+
+        if robot is not None:
+            if state["handle"] is None:
+                state["handle"] = _plot_serial_manipulator(robot, value, ax=ax, **kwargs)
+            else:
+                state["handle"].update(value)
+            x = state["handle"].x_effector
+        else:
+            x = value if isinstance(value, DQ) else DQ(value)
+            if state["pose"] is None:
+                state["pose"] = _plot_pose(x, ax=ax, **kwargs)
+            else:
+                _update_poses([state["pose"]], [x], **kwargs)
+
+        if trail_length > 0:
+            if state["trail"] is None:
+                state["trail"] = Trail(ax, color=trail_color, max_points=max(trail_length, 2))
+            state["trail"].append(translation(x))
+
+        ax.set_title(f'time={time:.2f} s')
+
+    def init():
+        if first is not None:
+            update(first)
+
+    # The samples are consumed as the frames are drawn and are not cached by the animation
+    return anm.FuncAnimation(fig,
+                             update,
+                             frames=samples if first is None else itertools.chain([first], samples),
+                             init_func=init,
+                             interval=interval,
+                             save_count=save_count,
+                             cache_frame_data=False,
+                             repeat=False)
+
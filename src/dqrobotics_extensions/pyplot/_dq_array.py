@@ -0,0 +1,175 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import numpy as np
+
+
+def _as_vec8_array(xs) -> np.ndarray:
+    """
+    Convert a sequence of DQs, or an array-like of shape (N, 8), into an array of shape (N, 8) with the coefficients of
+    each DQ in the same order as `DQ.vec8()`.
+    :param xs: A sequence of DQs or an array-like of shape (N, 8).
+    :return: An array of shape (N, 8).
+    :raises RuntimeError: If `xs` cannot be interpreted as N dual quaternions.
+    """
+    if isinstance(xs, np.ndarray):
+        xs_array = np.asarray(xs, dtype=float)
+    else:
+        xs_array = np.array([x.vec8() if isinstance(x, DQ) else x for x in xs], dtype=float)
+    if xs_array.size == 0:
+        xs_array = xs_array.reshape(0, 8)
+    if xs_array.ndim != 2 or xs_array.shape[1] != 8:
+        raise RuntimeError(f"The input of shape {xs_array.shape} cannot be interpreted as N dual quaternions.")
+    return xs_array
+
+
+def _is_unit(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `is_unit`.
+    :param xs: An array of shape (..., 8) with dual quaternions.
+    :return: A boolean array of shape (...) that is True for each unit dual quaternion.
+    """
+    primary_norm = np.linalg.norm(xs[..., :4], axis=-1)
+    # The norm of a dual quaternion is ||P|| + E_ <P, D>/||P||
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dual_norm = np.sum(xs[..., :4] * xs[..., 4:], axis=-1) / primary_norm
+    return (np.abs(primary_norm - 1.0) < DQ_threshold) & (np.abs(dual_norm) < DQ_threshold)
+
+
+def _is_pure_quaternion(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `is_pure(x) and is_quaternion(x)`.
+    :param xs: An array of shape (..., 8) with dual quaternions.
+    :return: A boolean array of shape (...) that is True for each pure quaternion.
+    """
+    return (np.abs(xs[..., 0]) < DQ_threshold) & np.all(np.abs(xs[..., 4:]) < DQ_threshold, axis=-1)
+
+
+def _is_line(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `is_line`, i.e., of unit and pure dual quaternions.
+    :param xs: An array of shape (..., 8) with dual quaternions.
+    :return: A boolean array of shape (...) that is True for each line.
+    """
+    return _is_unit(xs) & (np.abs(xs[..., 0]) < DQ_threshold) & (np.abs(xs[..., 4]) < DQ_threshold)
+
+
+def _is_plane(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `is_plane`, i.e., of unit dual quaternions with a pure primary part and a real dual part.
+    :param xs: An array of shape (..., 8) with dual quaternions.
+    :return: A boolean array of shape (...) that is True for each plane.
+    """
+    return (_is_unit(xs) & (np.abs(xs[..., 0]) < DQ_threshold)
+            & np.all(np.abs(xs[..., 5:]) < DQ_threshold, axis=-1))
+
+
+def _conj(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `conj` for quaternions of shape (..., 4) or dual quaternions of shape (..., 8).
+    :param xs: The (dual) quaternions.
+    :return: The conjugates, with the same shape as `xs`.
+    """
+    xs_conj = -xs
+    xs_conj[..., 0] = xs[..., 0]
+    if xs.shape[-1] == 8:
+        xs_conj[..., 4] = xs[..., 4]
+    return xs_conj
+
+
+def _translation(xs: np.ndarray) -> np.ndarray:
+    """
+    The vectorized version of `translation` for unit dual quaternions.
+    :param xs: An array of shape (..., 8) with unit dual quaternions.
+    :return: An array of shape (..., 3) with the translations.
+    """
+    return 2.0 * _quaternion_multiply(xs[..., 4:], _conj(xs[..., :4]))[..., 1:4]
+
+
+def _quaternion_to_rotation_matrix(r: np.ndarray) -> np.ndarray:
+    """
+    Calculate the rotation matrices equivalent to the unit quaternions `r`, so that the rotation can be applied to many
+    points at once with NumPy. The columns of each matrix are the same as `Ad(r, i_)`, `Ad(r, j_)`, and `Ad(r, k_)`.
+    :param r: An array of shape (..., 4) with the coefficients of unit quaternions.
+    :return: An array of shape (..., 3, 3) with the rotation matrices.
+    """
+    w, a, b, c = r[..., 0], r[..., 1], r[..., 2], r[..., 3]
+    return np.stack((
+        np.stack((1 - 2 * (b * b + c * c), 2 * (a * b - w * c), 2 * (a * c + w * b)), axis=-1),
+        np.stack((2 * (a * b + w * c), 1 - 2 * (a * a + c * c), 2 * (b * c - w * a)), axis=-1),
+        np.stack((2 * (a * c - w * b), 2 * (b * c + w * a), 1 - 2 * (a * a + b * b)), axis=-1)
+    ), axis=-2)
+
+
+def _quaternion_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    The Hamilton product of quaternions stored as arrays of shape (..., 4).
+    :param a: The left-hand side quaternions.
+    :param b: The right-hand side quaternions.
+    :return: An array of shape (..., 4) with the products.
+    """
+    a0, a1, a2, a3 = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    b0, b1, b2, b3 = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack((a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3,
+                     a0 * b1 + a1 * b0 + a2 * b3 - a3 * b2,
+                     a0 * b2 - a1 * b3 + a2 * b0 + a3 * b1,
+                     a0 * b3 + a1 * b2 - a2 * b1 + a3 * b0), axis=-1)
+
+
+def _dq_multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    The product of dual quaternions stored as arrays of shape (..., 8), in the same order as `DQ.vec8()`.
+    :param a: The left-hand side dual quaternions.
+    :param b: The right-hand side dual quaternions.
+    :return: An array of shape (..., 8) with the products.
+    """
+    primary = _quaternion_multiply(a[..., :4], b[..., :4])
+    dual = _quaternion_multiply(a[..., :4], b[..., 4:]) + _quaternion_multiply(a[..., 4:], b[..., :4])
+    return np.concatenate((primary, dual), axis=-1)
+
+
+def _dq_multiply_components(a, b) -> np.ndarray:
+    """
+    The same as `_dq_multiply`, but with the 8 coefficients along the first axis, i.e. of shape (8, ...). Each
+    coefficient is then a contiguous array, which is several times faster for many dual quaternions.
+    :param a: The left-hand side dual quaternions.
+    :param b: The right-hand side dual quaternions.
+    :return: An array of shape (8, ...) with the products.
+    """
+    primary = _quaternion_multiply_components(a[0:4], b[0:4])
+    dual = [ab + ba for ab, ba in zip(_quaternion_multiply_components(a[0:4], b[4:8]),
+                                      _quaternion_multiply_components(a[4:8], b[0:4]))]
+    return np.stack(primary + dual)
+
+
+def _quaternion_multiply_components(a, b) -> list:
+    """
+    The same as `_quaternion_multiply`, but with the 4 coefficients along the first axis.
+    :param a: The left-hand side quaternions.
+    :param b: The right-hand side quaternions.
+    :return: A list with the 4 coefficients of the products.
+    """
+    a0, a1, a2, a3 = a
+    b0, b1, b2, b3 = b
+    return [a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3,
+            a0 * b1 + a1 * b0 + a2 * b3 - a3 * b2,
+            a0 * b2 - a1 * b3 + a2 * b0 + a3 * b1,
+            a0 * b3 + a1 * b2 - a2 * b1 + a3 * b0]
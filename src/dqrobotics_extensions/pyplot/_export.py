@@ -0,0 +1,184 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import contextlib
+import io
+import os
+import subprocess
+import multiprocessing
+from math import ceil
+
+from dqrobotics_extensions.pyplot._resample import frame_indices
+
+import matplotlib
+from matplotlib import pyplot as plt
+
+# The figure and animation function of each worker process, set by `_initialize_worker`.
+_worker_state = {}
+
+
+def save_animation(filename: str,
+                   animate,
+                   frames,
+                   fps: float = 5,
+                   figure_kwargs: dict = None,
+                   processes: int = None,
+                   chunksize: int = None,
+                   codec: str = "h264",
+                   start_method: str = None,
+                   times=None):
+    """
+    Save an animation as a video, rendering its frames in parallel. This is a replacement for `anim.save(filename)`,
+    where `anim` is a `FuncAnimation`, that splits the frames across a pool of processes. Each worker draws its frames
+    with the Agg backend into PNG buffers, which are then written, in order, into a single `ffmpeg` process.
+
+    The animation function has the same signature used with `FuncAnimation`, i.e., it receives the frame number `n` and
+    draws on the current Axes. For example
+
+        dqp.save_animation("output.mp4",
+                           partial(animate_robot, robot=robot, stored_q=stored_q, stored_time=stored_time),
+                           frames=len(stored_q),
+                           figure_kwargs=dict(dpi=200, figsize=(12, 10)))
+
+    Each worker creates its own figure with `plt.figure(**figure_kwargs)` and 3D Axes, so `animate` must not depend on
+    a figure created by the caller. The workers are started with the default start method of `multiprocessing`, so
+    `animate` is sent to them with `pickle` unless that method is "fork". `DQ` and `DQ_SerialManipulator` cannot be
+    pickled, so a portable `animate` is a module-level function, or a `partial` of one, whose arguments are, e.g., the
+    `vec8()` of the DQs, and which creates its robots in the worker, see the gallery of moving manipulators.
+
+    Samples are often much denser than the frames of a video, e.g. a controller at 100 Hz and a video at 30 fps. With
+    `times`, the timestamps of the samples, only the samples shown in a real-time video at `fps` are rendered, see
+    `frame_indices`, so the export time depends on the duration of the motion and not on the number of samples.
+
+        dqp.save_animation("output.mp4",
+                           partial(animate_robot, robot=robot, stored_q=stored_q, stored_time=stored_time),
+                           frames=len(stored_q),
+                           times=stored_time,
+                           fps=30)
+
+    :param filename: The output video file.
+    :param animate: The animation function, called as `animate(n)` for each frame `n`.
+    :param frames: The number of frames or an iterable of frame numbers.
+    :param fps: The frames per second of the video. The default is the same of `anim.save` with the default
+        `FuncAnimation` interval of 200 ms.
+    :param figure_kwargs: The arguments of `plt.figure` for the figure of each worker.
+    :param processes: The number of worker processes or `os.cpu_count()` if None.
+    :param chunksize: The number of consecutive frames given to a worker at a time. If None, the frames are split into
+        about four chunks per worker.
+    :param codec: The video codec used by `ffmpeg`.
+    :param start_method: The `multiprocessing` start method, or None for its default.
+    :param times: The timestamps of the samples given by `frames`, or None to render all of them.
+    :raises RuntimeError: If `ffmpeg` fails to encode the video, e.g., it exits before all frames are written because
+        of an unknown codec or an unwritable file, or if `times` does not have one timestamp per frame.
+    """
+    frames = range(frames) if isinstance(frames, int) else list(frames)
+    if times is not None:
+        if len(times) != len(frames):
+            raise RuntimeError(f"There must be one timestamp per frame, not {len(times)} for {len(frames)} frames.")
+        frames = [frames[i] for i in frame_indices(times, fps)]
+    if figure_kwargs is None:
+        figure_kwargs = {}
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, ceil(len(frames) / (4 * processes)))
+
+    command = [matplotlib.rcParams["animation.ffmpeg_path"],
+               "-y",
+               "-loglevel", "error",
+               "-f", "image2pipe",
+               "-framerate", str(fps),
+               "-c:v", "png",
+               "-i", "pipe:",
+               "-c:v", codec,
+               # h264 needs even dimensions and a widely supported pixel format
+               "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+               "-pix_fmt", "yuv420p",
+               filename]
+
+    context = multiprocessing.get_context(start_method)
+    ffmpeg = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        with context.Pool(processes,
+                          initializer=_initialize_worker,
+                          initargs=(animate, figure_kwargs)) as pool:
+            # imap returns the frames in order while they are rendered, so they are streamed into ffmpeg
+            for png in pool.imap(_render_frame, frames, chunksize):
+                try:
+                    ffmpeg.stdin.write(png)
+                except OSError as error:
+                    # ffmpeg exited early, so the frames still being rendered are discarded
+                    pool.terminate()
+                    raise _ffmpeg_error(ffmpeg, filename) from error
+        try:
+            ffmpeg.stdin.close()
+        except OSError as error:
+            raise _ffmpeg_error(ffmpeg, filename) from error
+    except BaseException:
+        if ffmpeg.poll() is None:
+            ffmpeg.kill()
+        ffmpeg.wait()
+        # The frames left in the buffer cannot be written anymore
+        with contextlib.suppress(OSError):
+            ffmpeg.stdin.close()
+        raise
+
+    if ffmpeg.wait() != 0:
+        raise _ffmpeg_error(ffmpeg, filename)
+    ffmpeg.stderr.close()
+
+
+def _ffmpeg_error(ffmpeg: subprocess.Popen, filename: str) -> RuntimeError:
+    """
+    Wait for a failed `ffmpeg` process of `save_animation` and describe its failure.
+    :param ffmpeg: The process.
+    :param filename: The output video file.
+    :return: The error with the messages of `ffmpeg`.
+    """
+    ffmpeg.wait()
+    error = ffmpeg.stderr.read().decode(errors="replace").strip()
+    ffmpeg.stderr.close()
+    return RuntimeError(f"ffmpeg failed to write {filename} (exit code {ffmpeg.returncode}): {error}")
+
+
+def _initialize_worker(animate, figure_kwargs: dict):
+    """
+    Create the figure of a worker process of `save_animation`.
+    :param animate: The animation function.
+    :param figure_kwargs: The arguments of `plt.figure`.
+    """
+    plt.switch_backend("Agg")
+    _worker_state["figure"] = plt.figure(**figure_kwargs)
+    plt.axes(projection='3d')
+    _worker_state["animate"] = animate
+
+
+def _render_frame(n) -> bytes:
+    """
+    Draw the frame `n` in a worker process of `save_animation`.
+    :param n: The frame number.
+    :return: The frame encoded as PNG.
+    """
+    figure = _worker_state["figure"]
+    plt.figure(figure.number)
+    _worker_state["animate"](n)
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=figure.dpi)
+    return buffer.getvalue()
@@ -0,0 +1,322 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulator, DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH
+
+from dqrobotics_extensions.pyplot._dq_array import _dq_multiply, _dq_multiply_components
+from dqrobotics_extensions.pyplot._options import _options
+
+from collections import OrderedDict, namedtuple
+import weakref
+
+import numpy as np
+
+# Joint types as returned by `get_types()`, following DQ_JointType in dqrobotics.
+_REVOLUTE = 0
+_PRISMATIC = 1
+
+# The poses of all joints for each (id of the robot, frame bytes, q bytes), from the least to the most recently used,
+# see `_fkm_all_cached`. Robots are kept by id so that the cache does not keep them alive.
+_fkm_cache = OrderedDict()
+# The finalizer of each robot id in the cache, which removes its poses when the robot is garbage collected.
+_fkm_cache_finalizers = {}
+_fkm_cache_stats = {"hits": 0, "misses": 0}
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+# The parameters of a DQ_SerialManipulatorDH or DQ_SerialManipulatorMDH, see `_dh_parameters`.
+_DHParameters = namedtuple("_DHParameters",
+                           ["thetas", "ds", "as_", "alphas", "types", "reference_frame", "effector", "modified"])
+
+
+def fkm_all(robot: DQ_SerialManipulator, q: np.ndarray) -> list:
+    """
+    Calculate the poses of all joints of a serial manipulator in a single forward sweep. The i-th element of the
+    output is the same as `robot.fkm(q, i)`. That is, all poses include the reference frame and the last one also
+    includes the end effector, so it is the same as `robot.fkm(q)`.
+
+    For `DQ_SerialManipulatorDH` and `DQ_SerialManipulatorMDH`, each link transformation is calculated once from the
+    (modified) DH parameters and the poses are accumulated from the base, which is O(n) instead of the O(n^2) of calling
+    `robot.fkm(q, i)` for each joint. Other subclasses of `DQ_SerialManipulator` fall back to `robot.fkm(q, i)`.
+
+        x_joints = dqp.fkm_all(robot, q)
+
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param q: The joint configurations.
+    :return: A list with the pose of each joint as a unit DQ.
+    """
+    if not isinstance(robot, (DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH)):
+        return [robot.fkm(q, i) for i in range(0, robot.get_dim_configuration_space())]
+
+    return [DQ(x) for x in _fkm_all_vec8(robot, q)]
+
+
+def fkm_cache_precompute(robot: DQ_SerialManipulator, qs):
+    """
+    Fill the kinematics cache with the poses of all joints for every joint configuration of a trajectory, e.g., before
+    playing an animation. Drawing the manipulator at any of these configurations then skips the forward kinematics,
+    which matters because `FuncAnimation` draws the same frames again on loops, resizes, and saves.
+
+    For `DQ_SerialManipulatorDH` and `DQ_SerialManipulatorMDH`, the whole trajectory is calculated at once with NumPy.
+
+        dqp.fkm_cache_precompute(robot, stored_q)
+
+    The cache holds at most the global option "fkm_cache_size" configurations and is keyed on the robot instance, its
+    reference frame and effector, and the values of q. Poses calculated before `set_reference_frame` or `set_effector`
+    are therefore not reused afterwards. Any other change of the robot requires `fkm_cache_invalidate`.
+
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param qs: An array-like of shape (N, n) with the joint configurations.
+    """
+    qs = np.asarray(qs, dtype=float).reshape(len(qs), -1)
+    if isinstance(robot, (DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH)):
+        poses = _fkm_all_vec8(robot, qs)
+    else:
+        poses = [_fkm_all_array(robot, q) for q in qs]
+
+    frames = _fkm_cache_frames(robot)
+    for q, x_joints in zip(qs, poses):
+        _fkm_cache_store(robot, (id(robot), frames, q.tobytes()), np.array(x_joints))
+
+
+def fkm_cache_invalidate(robot: DQ_SerialManipulator = None):
+    """
+    Remove poses from the kinematics cache. The reference frame and effector are part of the key, so this is only
+    needed if a cached robot changes in any other way, e.g., a subclass whose parameters can be changed, otherwise the
+    manipulator is drawn with its old poses. The poses of a robot are also removed when it is garbage collected.
+
+        dqp.fkm_cache_invalidate(robot)
+
+    :param robot: The robot whose poses are removed, or None to remove all poses and reset the statistics.
+    """
+    if robot is None:
+        _fkm_cache.clear()
+        _fkm_cache_stats.update(hits=0, misses=0)
+        for finalizer in list(_fkm_cache_finalizers.values()):
+            finalizer.detach()
+        _fkm_cache_finalizers.clear()
+        return
+
+    _fkm_cache_remove(id(robot))
+
+
+def fkm_cache_info():
+    """
+    Statistics of the kinematics cache, in the same format of `functools.lru_cache`.
+
+        info = dqp.fkm_cache_info()
+        print(info.hits, info.misses)
+
+    :return: A named tuple with the hits, misses, maxsize, and currsize of the cache.
+    """
+    return _CacheInfo(_fkm_cache_stats["hits"],
+                      _fkm_cache_stats["misses"],
+                      _options["fkm_cache_size"],
+                      len(_fkm_cache))
+
+
+def _fkm_all_cached(robot: DQ_SerialManipulator, q: np.ndarray) -> list:
+    """
+    The same as `fkm_all`, but using the kinematics cache. See `fkm_cache_precompute`.
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param q: The joint configurations.
+    :return: A list with the pose of each joint as a unit DQ.
+    """
+    if _options["fkm_cache_size"] <= 0:
+        return fkm_all(robot, q)
+
+    key = (id(robot), _fkm_cache_frames(robot), np.asarray(q, dtype=float).reshape(-1).tobytes())
+    x_joints = _fkm_cache.get(key)
+    if x_joints is None:
+        _fkm_cache_stats["misses"] += 1
+        x_joints = _fkm_all_array(robot, q)
+        _fkm_cache_store(robot, key, x_joints)
+    else:
+        _fkm_cache_stats["hits"] += 1
+        _fkm_cache.move_to_end(key)
+
+    return [DQ(x) for x in x_joints]
+
+
+def _fkm_cache_frames(robot: DQ_SerialManipulator) -> bytes:
+    """
+    The part of the key of the kinematics cache that changes with `set_reference_frame` and `set_effector`.
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :return: The bytes of the reference frame followed by those of the effector.
+    """
+    return robot.get_reference_frame().vec8().tobytes() + robot.get_effector().vec8().tobytes()
+
+
+def _fkm_cache_store(robot: DQ_SerialManipulator, key: tuple, x_joints: np.ndarray):
+    """
+    Add poses to the kinematics cache, removing the least recently used ones beyond the global option "fkm_cache_size".
+    :param robot: The robot of the poses, whose poses are removed when it is garbage collected.
+    :param key: The tuple (id of the robot, frame bytes, q bytes).
+    :param x_joints: An array of shape (n, 8) with the pose of each joint.
+    """
+    if _options["fkm_cache_size"] <= 0:
+        return
+    if key[0] not in _fkm_cache_finalizers:
+        try:
+            _fkm_cache_finalizers[key[0]] = weakref.finalize(robot, _fkm_cache_remove, key[0])
+        except TypeError:
+            # Without a weak reference, the id could be reused by another robot after this one is collected
+            return
+    _fkm_cache[key] = x_joints
+    _fkm_cache.move_to_end(key)
+    _fkm_cache_trim()
+
+
+def _fkm_cache_trim():
+    """
+    Remove the least recently used poses beyond the global option "fkm_cache_size", e.g., after it is lowered.
+    """
+    while len(_fkm_cache) > max(_options["fkm_cache_size"], 0):
+        _fkm_cache.popitem(last=False)
+
+
+def _fkm_cache_remove(robot_id: int):
+    """
+    Remove the poses of a robot from the kinematics cache.
+    :param robot_id: The id of the robot.
+    """
+    for key in [key for key in _fkm_cache if key[0] == robot_id]:
+        del _fkm_cache[key]
+    finalizer = _fkm_cache_finalizers.pop(robot_id, None)
+    if finalizer is not None:
+        finalizer.detach()
+
+
+def _fkm_all_array(robot: DQ_SerialManipulator, q: np.ndarray) -> np.ndarray:
+    """
+    The same as `fkm_all`, but returning a NumPy array.
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param q: The joint configurations.
+    :return: An array of shape (n, 8) with the pose of each joint.
+    """
+    if not isinstance(robot, (DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH)):
+        return np.array([x.vec8() for x in fkm_all(robot, q)])
+
+    return _fkm_all_vec8(robot, q)
+
+
+def _fkm_all_vec8(robot, q: np.ndarray) -> np.ndarray:
+    """
+    The same as `fkm_all` for `DQ_SerialManipulatorDH` and `DQ_SerialManipulatorMDH`, but operating on NumPy arrays.
+    :param robot: A DQ_SerialManipulatorDH or DQ_SerialManipulatorMDH.
+    :param q: The joint configurations as an array of shape (n,) or, for many configurations, of shape (..., n).
+    :return: An array of shape (..., n, 8) with the pose of each joint.
+    """
+    parameters = _dh_parameters(robot)
+    links = _dh_links_vec8(parameters, q)
+
+    poses = np.empty(links.shape)
+    x = parameters.reference_frame
+    for i in range(0, links.shape[-2]):
+        x = _dq_multiply(x, links[..., i, :])
+        poses[..., i, :] = x
+    poses[..., -1, :] = _dq_multiply(poses[..., -1, :], parameters.effector)
+
+    return poses
+
+
+def _fkm_vec8(parameters: _DHParameters, q: np.ndarray) -> np.ndarray:
+    """
+    The same as `robot.fkm(q)` for many joint configurations at once, without keeping the poses of the other joints.
+    The coefficients are kept along the first axis while the links are multiplied, see `_dq_multiply_components`.
+    :param parameters: The parameters of the robot as given by `_dh_parameters`.
+    :param q: The joint configurations as an array of shape (..., n).
+    :return: An array of shape (..., 8) with the pose of the end effector.
+    """
+    # Of shape (n, 8, ...), so that the coefficients of each link are contiguous
+    links = np.ascontiguousarray(np.moveaxis(_dh_links_components(parameters, q), -1, 0))
+
+    x = np.broadcast_to(parameters.reference_frame.reshape((8,) + (1,) * (links.ndim - 2)), links.shape[1:])
+    for link in links:
+        x = _dq_multiply_components(x, link)
+    x = _dq_multiply_components(x, parameters.effector)
+
+    return np.moveaxis(x, 0, -1)
+
+
+def _dh_parameters(robot) -> _DHParameters:
+    """
+    Copy the parameters of a `DQ_SerialManipulatorDH` or `DQ_SerialManipulatorMDH` into plain NumPy arrays. Unlike the
+    robot, these can be sent to other processes.
+    :param robot: A DQ_SerialManipulatorDH or DQ_SerialManipulatorMDH.
+    :return: The parameters of the robot.
+    """
+    return _DHParameters(np.array(robot.get_thetas(), dtype=float),
+                         np.array(robot.get_ds(), dtype=float),
+                         np.array(robot.get_as(), dtype=float),
+                         np.array(robot.get_alphas(), dtype=float),
+                         np.array(robot.get_types()),
+                         np.array(robot.get_reference_frame().vec8()),
+                         np.array(robot.get_effector().vec8()),
+                         isinstance(robot, DQ_SerialManipulatorMDH))
+
+
+def _dh_links_vec8(parameters: _DHParameters, q: np.ndarray) -> np.ndarray:
+    """
+    Calculate the transformation of each link of a `DQ_SerialManipulatorDH` or `DQ_SerialManipulatorMDH`. This is the
+    same as dh2dq of dqrobotics, vectorized over the links.
+    :param parameters: The parameters of the robot as given by `_dh_parameters`.
+    :param q: The joint configurations as an array of shape (n,) or, for many configurations, of shape (..., n).
+    :return: An array of shape (..., n, 8) with the transformation of each link.
+    """
+    return np.moveaxis(_dh_links_components(parameters, q), 0, -1)
+
+
+def _dh_links_components(parameters: _DHParameters, q: np.ndarray) -> np.ndarray:
+    """
+    The same as `_dh_links_vec8`, but with the 8 coefficients along the first axis.
+    :param parameters: The parameters of the robot as given by `_dh_parameters`.
+    :param q: The joint configurations as an array of shape (n,) or, for many configurations, of shape (..., n).
+    :return: An array of shape (8, ..., n) with the transformation of each link.
+    """
+    q = np.asarray(q, dtype=float)
+    prismatic = parameters.types == _PRISMATIC
+
+    theta = parameters.thetas + np.where(prismatic, 0.0, q)
+    d = parameters.ds + np.where(prismatic, q, 0.0)
+    a = parameters.as_
+    alpha = parameters.alphas
+
+    ct = np.cos(theta / 2.0)
+    st = np.sin(theta / 2.0)
+    ca = np.cos(alpha / 2.0)
+    sa = np.sin(alpha / 2.0)
+
+    if parameters.modified:
+        return np.stack((ca * ct,
+                         sa * ct,
+                         -sa * st,
+                         ca * st,
+                         -(a * sa * ct) / 2.0 - (d * ca * st) / 2.0,
+                         (a * ca * ct) / 2.0 - (d * sa * st) / 2.0,
+                         -(a * ca * st) / 2.0 - (d * sa * ct) / 2.0,
+                         (d * ca * ct) / 2.0 - (a * sa * st) / 2.0))
+
+    return np.stack((ca * ct,
+                     sa * ct,
+                     sa * st,
+                     ca * st,
+                     -(a * sa * ct) / 2.0 - (d * ca * st) / 2.0,
+                     (a * ca * ct) / 2.0 - (d * sa * st) / 2.0,
+                     (a * ca * st) / 2.0 + (d * sa * ct) / 2.0,
+                     (d * ca * ct) / 2.0 - (a * sa * st) / 2.0))
@@ -0,0 +1,264 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import itertools
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulator
+
+from dqrobotics_extensions.pyplot._pyplot import _plot_serial_manipulator, _plot_pose, _update_poses
+from dqrobotics_extensions.pyplot._profiling import _stage
+
+from matplotlib import pyplot as plt
+
+import numpy as np
+
+_LiveViewStats = namedtuple("LiveViewStats", ["published",
+                                              "rendered",
+                                              "dropped_samples",
+                                              "dropped_frames",
+                                              "latency_ms_mean",
+                                              "latency_ms_max",
+                                              "render_ms_mean",
+                                              "render_ms_max"])
+
+
+class LiveView:
+    """
+    A live plot of a manipulator, or of a pose, fed by a control loop that must never wait for the plot. The control
+    loop calls `publish`, which only replaces the latest sample and returns. The renderer draws the latest sample at
+    most `fps` times per second, so the samples published in between are dropped instead of queued.
+
+        view = dqp.LiveView(robot, fps=30)
+        view.start(thread=False)   # Draws from a timer of the window, see `start`
+
+        def control_loop():
+            while running:
+                q = q + u * tau
+                view.publish(q, time)
+
+        threading.Thread(target=control_loop).start()
+        plt.show()
+        print(view.stats)
+
+    The latest sample is a single attribute holding an immutable tuple. Replacing it is atomic in Python, so neither
+    `publish` nor the renderer take a lock. A renderer thread still shares the interpreter with the control loop, so
+    each step of the loop can be delayed by up to `sys.getswitchinterval()` while a frame is drawn.
+    """
+    def __init__(self,
+                 robot: DQ_SerialManipulator = None,
+                 fig=None,
+                 ax=None,
+                 fps: float = 30.0,
+                 on_frame=None,
+                 **kwargs):
+        """
+        Create the view. The artists are only created with the first sample rendered.
+        :param robot: The DQ_SerialManipulator of the joint configurations, or None if the samples are poses.
+        :param fig: The figure of the view or plt.gcf() if None.
+        :param ax: Figure Axes or fig.gca() if None.
+        :param fps: The maximum number of frames rendered per second.
+        :param on_frame: If not None, called with the figure after each frame is drawn, e.g., to copy its pixels.
+        :param kwargs: The style arguments of `_plot_serial_manipulator` or of `_plot_pose`. Its `validation`, if any,
+            is also used for every update of the artists.
+        :raises RuntimeError: If `fps` is not positive.
+        """
+        if fps <= 0:
+            raise RuntimeError(f"The fps must be positive, not {fps}.")
+        if ax is not None and fig is None:
+            fig = ax.figure
+        if fig is None:
+            fig = plt.gcf()
+        if ax is None:
+            ax = fig.gca()
+
+        self.robot = robot
+        self.figure = fig
+        self.ax = ax
+        self.fps = fps
+        self.on_frame = on_frame
+        self.kwargs = kwargs
+        self.handle = None
+        self.pose = None
+
+        # The latest sample as the tuple (sequence number, time, value, time published), see `publish`
+        self._latest = None
+        self._sequence = itertools.count(1)
+        self._rendered_sequence = 0
+        self._rendered = 0
+        self._dropped_samples = 0
+        self._dropped_frames = 0
+        self._latency = [0.0, 0.0]
+        self._render_time = [0.0, 0.0]
+
+        self._thread = None
+        self._timer = None
+        self._stop = threading.Event()
+
+    def publish(self, value, time: float = None):
+        """
+        Make `value` the latest sample. This never waits for the renderer. The joint configurations are copied, so
+        the control loop can keep changing its array.
+        :param value: The joint configurations of the robot, or a unit DQ if there is no robot.
+        :param time: The time of the sample, shown in the title, or None.
+        """
+        if not isinstance(value, DQ):
+            value = np.array(value, dtype=float)
+        self._latest = (next(self._sequence), time, value, perf_counter())
+
+    def render(self) -> bool:
+        """
+        Draw the latest sample if it was not drawn yet. This is called by the renderer started with `start`, but it
+        can also be called directly, e.g., from the main loop of a program that owns the window.
+        :return: True if a frame was drawn, False if there was no new sample.
+        """
+        latest = self._latest
+        if latest is None or latest[0] == self._rendered_sequence:
+            return False
+        sequence, time, value, published = latest
+
+        start = perf_counter()
+        if self.robot is not None:
+            if self.handle is None:
+                self.handle = _plot_serial_manipulator(self.robot, value, ax=self.ax, **self.kwargs)
+            else:
+                self.handle.update(value, validation=self.kwargs.get("validation"))
+        else:
+            x = value if isinstance(value, DQ) else DQ(value)
+            if self.pose is None:
+                self.pose = _plot_pose(x, ax=self.ax, **self.kwargs)
+            else:
+                _update_poses([self.pose], [x], **self.kwargs)
+        if time is not None:
+            self.ax.set_title(f'time={time:.2f} s')
+
+        with _stage("draw"):
+            self.figure.canvas.draw()
+        if self.on_frame is not None:
+            self.on_frame(self.figure)
+        end = perf_counter()
+
+        self._dropped_samples += sequence - self._rendered_sequence - 1
+        self._rendered_sequence = sequence
+        self._rendered += 1
+        _accumulate(self._latency, end - published)
+        _accumulate(self._render_time, end - start)
+        return True
+
+    def start(self, thread: bool = True):
+        """
+        Start rendering the latest sample at most `fps` times per second.
+
+        - thread=True: a background thread renders the frames. Only non-interactive canvases, e.g. of the Agg backend
+          or of an `OffscreenRenderer`, can be drawn outside the main thread, and the figure must not be changed by
+          other threads until `stop`.
+        - thread=False: a timer of the canvas calls `render` in the event loop of the window, e.g. during `plt.show()`.
+          The control loop must then run in another thread.
+
+        :param thread: Whether to render in a background thread or from a timer of the canvas.
+        :raises RuntimeError: If the view was already started.
+        """
+        if self._thread is not None or self._timer is not None:
+            raise RuntimeError("The LiveView was already started.")
+
+        self._stop.clear()
+        if thread:
+            self._thread = threading.Thread(target=self.__run, name="LiveView", daemon=True)
+            self._thread.start()
+        else:
+            self._timer = self.figure.canvas.new_timer(interval=1000.0 / self.fps)
+            self._timer.add_callback(self.__tick)
+            self._timer.start()
+
+    def stop(self):
+        """
+        Stop rendering. The latest sample is drawn before the renderer stops, so the view shows the final state.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+            self.render()
+
+    @property
+    def stats(self):
+        """
+        The metrics of the view as a named tuple:
+
+        - published: the number of samples published.
+        - rendered: the number of frames drawn.
+        - dropped_samples: the number of samples replaced by a newer one before being drawn.
+        - dropped_frames: the number of frame periods, at `fps`, that passed without a frame because drawing took too
+          long.
+        - latency_ms_mean, latency_ms_max: the time from `publish` until the sample was drawn.
+        - render_ms_mean, render_ms_max: the time to update the artists and draw the figure.
+        """
+        latest = self._latest
+        published = 0 if latest is None else latest[0]
+        rendered = self._rendered
+        return _LiveViewStats(published,
+                              rendered,
+                              self._dropped_samples,
+                              self._dropped_frames,
+                              1e3 * self._latency[0] / max(rendered, 1),
+                              1e3 * self._latency[1],
+                              1e3 * self._render_time[0] / max(rendered, 1),
+                              1e3 * self._render_time[1])
+
+    def __run(self):
+        """
+        The loop of the background thread, see `start`.
+        """
+        period = 1.0 / self.fps
+        deadline = perf_counter()
+        while not self._stop.wait(max(0.0, deadline - perf_counter())):
+            self.render()
+            deadline += period
+            # The frames whose whole period passed while drawing are dropped, instead of being drawn late in a burst
+            late = perf_counter() - deadline
+            if late > period:
+                skipped = int(late // period)
+                self._dropped_frames += skipped
+                deadline += skipped * period
+        self.render()
+
+    def __tick(self):
+        """
+        The callback of the timer of the canvas, see `start`.
+        """
+        start = perf_counter()
+        self.render()
+        # The timer is not called again until this returns, so the periods that passed while drawing were dropped
+        self._dropped_frames += int((perf_counter() - start) * self.fps)
+
+
+def _accumulate(totals: list, value: float):
+    """
+    Add a value to a running total and maximum.
+    :param totals: The list [total, maximum], changed in place.
+    :param value: The new value.
+    """
+    totals[0] += value
+    totals[1] = max(totals[1], value)
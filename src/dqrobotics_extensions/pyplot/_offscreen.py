@@ -0,0 +1,83 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics_extensions.pyplot._pyplot import plot
+from dqrobotics_extensions.pyplot._profiling import _stage
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import numpy as np
+
+
+class OffscreenRenderer:
+    """
+    Render plots without a window, straight into an RGBA `np.ndarray`. The figure, its 3D Axes, and the image buffer
+    are created once and reused by every call, so a trajectory can be rendered frame by frame without allocating new
+    figures or encoding images. The figure is not managed by `pyplot`, so no GUI backend is needed.
+
+        renderer = dqp.OffscreenRenderer(figsize=(6.4, 4.8), dpi=100)
+        handle = renderer.plot(robot, q=stored_q[0])
+        for q in stored_q:
+            handle.update(q)
+            image = renderer.render()  # An array of shape (480, 640, 4) and dtype uint8
+    """
+    def __init__(self, figsize=(6.4, 4.8), dpi: float = 100):
+        """
+        Create the figure, the 3D Axes, and the image buffer.
+        :param figsize: The figure size in inches.
+        :param dpi: The resolution of the figure in dots per inch.
+        """
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(projection='3d')
+        self._buffer = None
+
+    def plot(self, obj, **kwargs):
+        """
+        The same as `dqp.plot`, drawing on the Axes of this renderer.
+        :param obj: The input to be plotted.
+        :param kwargs: The arguments of `dqp.plot`.
+        :return: The output of `dqp.plot`.
+        """
+        return plot(obj, ax=self.ax, **kwargs)
+
+    def clear(self):
+        """
+        Clear the Axes of this renderer.
+        """
+        self.ax.cla()
+
+    def render(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Draw the figure and copy its pixels into an RGBA image.
+        :param out: If not None, an array of shape (height, width, 4) and dtype uint8 in which the image is written.
+        :return: The image. If `out` is None, this is an internal buffer that is overwritten by the next call, so it
+            must be copied if it is to be kept.
+        """
+        with _stage("draw"):
+            self.canvas.draw()
+        pixels = np.asarray(self.canvas.buffer_rgba())
+
+        if out is None:
+            if self._buffer is None or self._buffer.shape != pixels.shape:
+                self._buffer = np.empty(pixels.shape, dtype=np.uint8)
+            out = self._buffer
+        np.copyto(out, pixels)
+        return out
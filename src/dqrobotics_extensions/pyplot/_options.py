@@ -0,0 +1,124 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from numbers import Integral
+import sys
+
+# The validation policies, see the option "validation".
+_VALIDATION_POLICIES = ("strict", "once-per-batch", "off")
+
+# The global options used when the corresponding argument of a plot function is None.
+_options = {
+    # The mesh resolution of spheres, either a number of points or "auto".
+    "sphere_resolution": 50,
+    # The mesh resolution of the joint cylinders of manipulators, either a number of points or "auto".
+    "cylinder_resolution": 20,
+    # The maximum number of spheres of a single plot drawn as meshes, more are drawn as scatter markers.
+    "sphere_scatter_threshold": 100,
+    # The maximum number of joint configurations in the kinematics cache, see `fkm_cache_precompute`.
+    "fkm_cache_size": 4096,
+    # How the inputs of each plot are validated, one of "strict", "once-per-batch", or "off".
+    "validation": "strict",
+}
+
+
+def set_options(**kwargs):
+    """
+    Change the global options of `dqrobotics-pyplot`. Each option is used whenever the corresponding argument of a plot
+    is not given. For instance, to draw all spheres with a coarser mesh and to let the density of the joint cylinders be
+    chosen from their size in the plot:
+
+        dqp.set_options(sphere_resolution=20, cylinder_resolution="auto")
+
+    The option "validation" sets how the inputs of each plot are checked, e.g., whether a pose is a unit DQ:
+
+    - "strict": each input is checked once, by the function that receives it. This is the default.
+    - "once-per-batch": all inputs of a plot call, e.g., all DQs of a sequence or all frames of a manipulator, are
+      checked at once with NumPy before anything is drawn.
+    - "off": nothing is checked. Invalid inputs may be drawn incorrectly or fail with other errors, e.g., from
+      dqrobotics.
+
+    The same values can be given to a single call, e.g., `dqp.plot(xs, validation="off")`.
+
+    When a sequence of spheres is plotted, up to "sphere_scatter_threshold" spheres are drawn as meshes and more are
+    drawn as scatter markers, see `_plot_spheres`.
+
+    The available options and their current values are given by `get_options()`.
+
+    :param kwargs: The options to be changed.
+    :raises RuntimeError: If an option does not exist.
+    """
+    for name, value in kwargs.items():
+        if name not in _options:
+            raise RuntimeError(f"The option {name} does not exist. Available options are {list(_options)}.")
+        if name.endswith("_resolution"):
+            _check_resolution(value)
+        if name.endswith(("_size", "_threshold")) and (isinstance(value, bool) or not isinstance(value, Integral) or value < 0):
+            raise RuntimeError(f"The option {name} must be a non-negative integer, not {value}.")
+        if name == "validation":
+            _check_validation(value)
+        _options[name] = value
+        if name == "fkm_cache_size":
+            # Only a kinematics module that was already imported can hold cached poses
+            kinematics = sys.modules.get("dqrobotics_extensions.pyplot._kinematics")
+            if kinematics is not None:
+                kinematics._fkm_cache_trim()
+
+
+def get_options() -> dict:
+    """
+    Get the global options of `dqrobotics-pyplot`. See `set_options`.
+    :return: A copy of the dict of options.
+    """
+    return dict(_options)
+
+
+def _check_resolution(resolution):
+    """
+    Check that `resolution` is a valid mesh resolution.
+    :param resolution: A number of points of at least 3, or "auto".
+    :raises RuntimeError: If the resolution is not valid.
+    """
+    if resolution == "auto":
+        return
+    if isinstance(resolution, bool) or not isinstance(resolution, Integral) or resolution < 3:
+        raise RuntimeError(f"The resolution must be an integer of at least 3 or 'auto', not {resolution}.")
+
+
+def _check_validation(validation):
+    """
+    Check that `validation` is a valid validation policy.
+    :param validation: One of "strict", "once-per-batch", or "off".
+    :raises RuntimeError: If the policy is not valid.
+    """
+    if validation not in _VALIDATION_POLICIES:
+        raise RuntimeError(f"The validation must be one of {list(_VALIDATION_POLICIES)}, not {validation}.")
+
+
+def _resolve_validation(validation) -> str:
+    """
+    Choose the validation policy of a plot call.
+    :param validation: A validation policy or None to use the global option.
+    :return: One of "strict", "once-per-batch", or "off".
+    :raises RuntimeError: If the policy is not valid.
+    """
+    if validation is None:
+        return _options["validation"]
+    _check_validation(validation)
+    return validation
@@ -0,0 +1,223 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+
+# The stages recorded inside each primitive:
+# "validation": the checks of the inputs, see the option "validation".
+# "kinematics": the forward kinematics of manipulators.
+# "dq_algebra": the DQ operations, e.g. `translation` and `Ad`, that give the geometry of poses, lines, and planes.
+# "mesh": the generation and transformation of the grids of surfaces, e.g. spheres and cylinders.
+# "artists": the creation and update of matplotlib artists.
+# "draw": the drawing of a figure, e.g. by `OffscreenRenderer.render`.
+
+# The Profile recording the current plots, or None when profiling is disabled.
+_active = None
+
+
+class Profile:
+    """
+    Records the wall time of each primitive plotted, e.g. "pose" or "serial_manipulator", and of the stages inside it,
+    e.g. "kinematics", "mesh", or "artists". Use it through `profile`.
+    """
+    def __init__(self, callback=None):
+        """
+        Not meant to be called directly, see `profile`.
+        :param callback: If not None, called with each event dict when the event ends.
+        """
+        self.events = []
+        self.callback = callback
+        self._primitives = []
+
+    def stage(self, name: str):
+        """
+        Record a stage of the user's code, e.g., to time the drawing of a figure together with the plots.
+
+            with dqp.profile() as prof:
+                handle.update(q)
+                with prof.stage("draw"):
+                    fig.canvas.draw()
+
+        :param name: The name of the stage.
+        :return: A context manager timing its body.
+        """
+        return _Event(self, name, "stage")
+
+    def summary(self) -> list:
+        """
+        The total time and number of calls of each primitive and of each stage inside each primitive. Stages are
+        attributed to the innermost primitive running when they happened.
+        :return: A list of dicts with the keys "primitive", "stage", "calls", and "total_ms". The rows of the primitives
+            themselves have the stage "(total)" and stages outside any primitive, e.g. "draw", have the primitive None.
+        """
+        rows = {}
+        for event in self.events:
+            if event["cat"] == "primitive":
+                key = (event["name"], "(total)")
+            else:
+                key = (event["primitive"], event["name"])
+            row = rows.setdefault(key, {"primitive": key[0], "stage": key[1], "calls": 0, "total_ms": 0.0})
+            row["calls"] += 1
+            row["total_ms"] += event["dur_ns"] / 1e6
+        return sorted(rows.values(), key=lambda row: (str(row["primitive"]), row["stage"] != "(total)", row["stage"]))
+
+    def table(self) -> str:
+        """
+        The summary formatted as a text table.
+        :return: The table, one row per primitive and stage.
+        """
+        lines = [f"{'primitive':<22}{'stage':<14}{'calls':>8}{'total [ms]':>14}{'mean [ms]':>12}"]
+        for row in self.summary():
+            lines.append(f"{row['primitive'] or '-':<22}{row['stage']:<14}{row['calls']:>8}"
+                         f"{row['total_ms']:>14.3f}{row['total_ms'] / row['calls']:>12.4f}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        """
+        The events in the Chrome trace format, which can be opened in chrome://tracing or https://ui.perfetto.dev.
+        :return: The trace as a dict that can be written with `json.dump`.
+        """
+        pid = os.getpid()
+        return {"traceEvents": [{"name": event["name"],
+                                 "cat": event["cat"],
+                                 "ph": "X",
+                                 "ts": event["start_ns"] / 1e3,
+                                 "dur": event["dur_ns"] / 1e3,
+                                 "pid": pid,
+                                 "tid": event["tid"],
+                                 "args": {"primitive": event["primitive"]}} for event in self.events],
+                "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename: str):
+        """
+        Save the events in the Chrome trace format, see `chrome_trace`.
+        :param filename: The output JSON file.
+        """
+        with open(filename, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+class _Event:
+    """
+    A context manager that records one event of a `Profile`.
+    """
+    __slots__ = ("profile", "name", "category", "start")
+
+    def __init__(self, profile: Profile, name: str, category: str):
+        self.profile = profile
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        if self.category == "primitive":
+            self.profile._primitives.append(self.name)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = perf_counter_ns()
+        primitives = self.profile._primitives
+        if self.category == "primitive":
+            primitives.pop()
+        event = {"name": self.name,
+                 "cat": self.category,
+                 "primitive": primitives[-1] if primitives else (self.name if self.category == "primitive" else None),
+                 "start_ns": self.start,
+                 "dur_ns": end - self.start,
+                 "tid": threading.get_ident()}
+        self.profile.events.append(event)
+        if self.profile.callback is not None:
+            self.profile.callback(event)
+
+
+class _NullEvent:
+    """
+    The context manager returned by `_stage` when profiling is disabled. It does nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_EVENT = _NullEvent()
+
+
+@contextmanager
+def profile(callback=None):
+    """
+    Profile the plots made inside a `with` block. The wall time and the number of calls are recorded per primitive,
+    e.g. "pose", "sphere", or "serial_manipulator", and per stage inside it, i.e. "validation", "kinematics",
+    "dq_algebra", "mesh", "artists", and "draw".
+
+        with dqp.profile() as prof:
+            dqp.plot(robot, q=q)
+            with prof.stage("draw"):
+                fig.canvas.draw()
+        print(prof.table())
+        prof.save_chrome_trace("trace.json")
+
+    When no profile is active, the instrumentation of the plots costs a single global lookup per primitive and stage.
+    Profiles are not meant to be used from several threads at once.
+
+    :param callback: If not None, called with the dict of each event when it ends, e.g., to stream the events.
+    :return: A context manager giving the `Profile` with the recorded events.
+    """
+    global _active
+    previous = _active
+    _active = Profile(callback=callback)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def _stage(name: str):
+    """
+    This internal function marks a stage of the plotting pipeline, e.g. `with _stage("mesh"):`.
+    :param name: The name of the stage.
+    :return: A context manager timing its body if profiling is enabled, otherwise one that does nothing.
+    """
+    if _active is None:
+        return _NULL_EVENT
+    return _Event(_active, name, "stage")
+
+
+def _profiled(primitive: str):
+    """
+    This internal decorator records each call of a plot function as the given primitive when profiling is enabled.
+    :param primitive: The name of the primitive, e.g. "pose".
+    """
+    def decorate(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return function(*args, **kwargs)
+            with _Event(_active, primitive, "primitive"):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -20,11 +20,30 @@ Author: Murilo M. Marinho
 from dqrobotics import *
 from dqrobotics.robot_modeling import DQ_SerialManipulator
 
+from dqrobotics_extensions.pyplot._kinematics import _fkm_all_cached
+from dqrobotics_extensions.pyplot._options import _options, _check_resolution, _resolve_validation
+from dqrobotics_extensions.pyplot._profiling import _stage, _profiled
+from dqrobotics_extensions.pyplot._dq_array import (_as_vec8_array, _is_unit, _is_line, _is_plane, _is_pure_quaternion,
+                                                    _translation, _quaternion_to_rotation_matrix)
+
+import matplotlib
 from matplotlib import pyplot as plt
+from matplotlib import colors as mcolors
+from matplotlib import lines as mlines
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+from mpl_toolkits.mplot3d import proj3d
 
 import numpy as np
 
-from math import acos, sin, cos
+import re
+from math import acos, sin, cos, radians
+from functools import lru_cache
+
+# The number of unit meshes of each kind, e.g. of different resolutions, kept by the mesh cache.
+_MESH_CACHE_SIZE = 16
+# The bounds of the resolution chosen when the resolution is "auto".
+_AUTO_RESOLUTION_MIN = 8
+_AUTO_RESOLUTION_MAX = 64
 
 def plot(obj, **kwargs):
     """
@@ -45,6 +64,11 @@ def plot(obj, **kwargs):
 
         dqp.plot(x)
 
+    Plotting many unit DQs at once, given as a sequence `xs` or as an array of shape (N, 8) (See internal function
+    `pyplot._pyplot._plot_poses`):
+
+        dqp.plot(xs)
+
     Plotting a line DQ `l_dq` (See internal function `pyplot._pyplot._plot_line`):
 
         dqp.plot(l_dq, line=True)
@@ -53,12 +77,43 @@ def plot(obj, **kwargs):
 
         dqp.plot(pi_dq, plane=True)
 
+    Plotting a pure quaternion `p` as a sphere of radius `r` (See internal function `pyplot._pyplot._plot_sphere`):
+
+        dqp.plot(p, sphere=True, radius=r)
+
     Plotting a `DQ_SerialManipulator` called `robot` at joint configurations `q` (See internal function `pyplot._pyplot._plot_serial_manipulator`):
 
         dqp.plot(robot, q=q)
 
+    The mesh density of spheres and of the joint cylinders of manipulators is set with `resolution`, either as a number
+    of points or as "auto" to choose it from the size of the object relative to the axes limits. When not given, the
+    global options are used, see `set_options`:
+
+        dqp.plot(p, sphere=True, radius=r, resolution=20)
+        dqp.plot(robot, q=q, resolution="auto")
+
+    The call above returns a `SerialManipulatorHandle`. Moving the same drawing to new joint configurations `q_new`
+    updates the existing artists instead of creating new ones:
+
+        handle = dqp.plot(robot, q=q)
+        dqp.plot(robot, q=q_new, handle=handle)
+
+    Plotting many `DQ_SerialManipulator`s given as a list of `(robot, q)` pairs, either tuples or lists, with the
+    artists of all robots shared and the style given for all robots or as a sequence with the style of each robot (See
+    internal function `pyplot._pyplot._plot_serial_manipulators`):
+
+        handle = dqp.plot([(robot_1, q_1), (robot_2, q_2)], line_color=["r", "b"])
+        handle.update([q_1_new, q_2_new])
+
+    The inputs are validated according to `validation`, one of "strict", "once-per-batch", or "off". When not given,
+    the global option is used, see `set_options`. For instance, to skip all checks of inputs known to be valid:
+
+        dqp.plot(xs, validation="off")
+
     :param obj: The input to be plotted.
     :param kwargs: For arguments depending on the type of plot you need, see the description above.
+    :return: A `SerialManipulatorHandle` if `obj` is a `DQ_SerialManipulator`, a `SerialManipulatorsHandle` if `obj`
+        is a list of `(robot, q)` pairs, otherwise None.
     :raises RuntimeError: If the input instance `obj` has no meaning for function, or if the `obj` is not valid for the input options.
     """
     if isinstance(obj,DQ):
@@ -67,10 +122,148 @@ def plot(obj, **kwargs):
         else:
             _plot_dq(obj, **kwargs)
     elif isinstance(obj,DQ_SerialManipulator):
-        _plot_serial_manipulator(obj, **kwargs)
+        return _plot_serial_manipulator(obj, **kwargs)
+    elif isinstance(obj, (list, tuple)) and any(__has_serial_manipulator(entry) for entry in obj):
+        for entry in obj:
+            if not (__has_serial_manipulator(entry) and len(entry) == 2):
+                raise RuntimeError(f"plot expects many DQ_SerialManipulators as a list of (robot, q) pairs, "
+                                   f"not the entry {entry}.")
+        return _plot_serial_manipulators(obj, **kwargs)
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        _plot_dqs(obj, **kwargs)
     else:
         raise RuntimeError(f"plot not implemented yet for {obj}")
 
+def __has_serial_manipulator(entry) -> bool:
+    """
+    This internal function tells whether an element of a list given to `plot` is meant as a `(robot, q)` pair.
+    :param entry: The element of the list.
+    :return: True if `entry` is a list or tuple whose first element is a DQ_SerialManipulator.
+    """
+    return isinstance(entry, (list, tuple)) and len(entry) > 0 and isinstance(entry[0], DQ_SerialManipulator)
+
+class SerialManipulatorHandle:
+    """
+    Holds the artists of a `DQ_SerialManipulator` drawn by `_plot_serial_manipulator`. Passing it back as the `handle`
+    argument, or calling `update()`, moves the existing artists to new joint configurations by changing their vertex
+    data in place. This is much cheaper than clearing the axes and drawing the manipulator again in every frame of an
+    animation.
+
+        handle = dqp.plot(robot, q=q)
+        handle.update(q_new)
+    """
+    def __init__(self,
+                 robot: DQ_SerialManipulator,
+                 line,
+                 poses: list,
+                 cylinders: list,
+                 cylinder_color,
+                 cylinder_radius: float,
+                 cylinder_height: float,
+                 cylinder_resolution: int,
+                 x_effector: DQ):
+        """
+        Not meant to be called directly, see `_plot_serial_manipulator`.
+        :param robot: The DQ_SerialManipulator that was drawn.
+        :param line: The Line3D connecting all frames.
+        :param poses: The artists of each frame, as returned by `_plot_pose`.
+        :param cylinders: The Poly3DCollection of each joint.
+        :param cylinder_color: The color of the cylinders.
+        :param cylinder_radius: The radius of the cylinders.
+        :param cylinder_height: The height of the cylinders.
+        :param cylinder_resolution: The mesh resolution of the cylinders.
+        :param x_effector: The pose of the end effector as drawn.
+        """
+        self.robot = robot
+        self.line = line
+        self.poses = poses
+        self.cylinders = cylinders
+        self.cylinder_color = cylinder_color
+        self.cylinder_radius = cylinder_radius
+        self.cylinder_height = cylinder_height
+        self.cylinder_resolution = cylinder_resolution
+        self.x_effector = x_effector
+
+    @property
+    def artists(self) -> list:
+        """
+        All artists of the manipulator, e.g., to be returned by a `FuncAnimation` function when `blit=True`.
+        """
+        return [self.line] + [artist for pose in self.poses for artist in pose] + self.cylinders
+
+    def update(self, q: np.ndarray, validation = None):
+        """
+        Move the artists to the joint configurations `q`.
+        :param q: The joint configurations.
+        :param validation: The validation policy or None to use the global option.
+        :return: This handle.
+        """
+        return _plot_serial_manipulator(self.robot, q, validation=validation, handle=self)
+
+    def remove(self):
+        """
+        Remove all artists of the manipulator from their Axes.
+        """
+        for artist in self.artists:
+            artist.remove()
+
+class SerialManipulatorsHandle:
+    """
+    Holds the shared artists of many `DQ_SerialManipulator`s drawn by `_plot_serial_manipulators`. Passing it back as
+    the `handle` argument, or calling `update()`, moves all robots to new joint configurations in place.
+
+        handle = dqp.plot([(robot_1, q_1), (robot_2, q_2)])
+        handle.update([q_1_new, q_2_new])
+    """
+    def __init__(self,
+                 robots: list,
+                 links,
+                 poses: tuple,
+                 cylinders,
+                 cylinder_colors: np.ndarray,
+                 cylinder_scales: np.ndarray,
+                 cylinder_resolution: int):
+        """
+        Not meant to be called directly, see `_plot_serial_manipulators`.
+        :param robots: The DQ_SerialManipulators that were drawn.
+        :param links: The Line3DCollection with the line connecting the frames of each robot.
+        :param poses: The artists of all frames, as returned by `_plot_poses`.
+        :param cylinders: The Poly3DCollection with the cylinders of all joints.
+        :param cylinder_colors: The RGBA color of each polygon of the cylinders before shading.
+        :param cylinder_scales: An array of shape (J, 3) with the radius, radius, and height of each joint cylinder.
+        :param cylinder_resolution: The mesh resolution of the cylinders.
+        """
+        self.robots = robots
+        self.links = links
+        self.poses = poses
+        self.cylinders = cylinders
+        self.cylinder_colors = cylinder_colors
+        self.cylinder_scales = cylinder_scales
+        self.cylinder_resolution = cylinder_resolution
+
+    @property
+    def artists(self) -> list:
+        """
+        All artists of the manipulators, e.g., to be returned by a `FuncAnimation` function when `blit=True`.
+        """
+        return [self.links, *self.poses, self.cylinders]
+
+    def update(self, qs: list, validation = None):
+        """
+        Move the artists to the joint configurations `qs`.
+        :param qs: The joint configurations of each robot, in the order they were drawn.
+        :param validation: The validation policy or None to use the global option.
+        :return: This handle.
+        """
+        return _plot_serial_manipulators(list(zip(self.robots, qs)), validation=validation, handle=self)
+
+    def remove(self):
+        """
+        Remove all artists of the manipulators from their Axes.
+        """
+        for artist in self.artists:
+            artist.remove()
+
 def _plot_dq(dq : DQ,
              scale: float = 0.1,
              line = None,
@@ -79,6 +272,8 @@ def _plot_dq(dq : DQ,
              radius = None,
              color = 'r',
              alpha = 0.8,
+             resolution = None,
+             validation = None,
              ax = None
              ):
     """
@@ -94,36 +289,106 @@ def _plot_dq(dq : DQ,
     :param sphere: If not None, draw the input DQ as a sphere.
     :param color: Define the color of the frame, line, or plane.
     :param alpha: Define the alpha of the plane.
+    :param resolution: Define the mesh resolution of the sphere.
+    :param validation: The validation policy or None to use the global option.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The artists drawn by `_plot_line`, `_plot_plane`, `_plot_sphere`, or `_plot_pose`.
     """
     if line is not None:
-        _plot_line(l_dq=dq,
-                   color=color,
-                   length=scale,
-                   ax=ax)
+        return _plot_line(l_dq=dq,
+                          color=color,
+                          length=scale,
+                          validation=validation,
+                          ax=ax)
     elif plane is not None:
-        _plot_plane(pi_dq=dq,
-                    length_x=scale,
-                    length_y=scale,
+        return _plot_plane(pi_dq=dq,
+                           length_x=scale,
+                           length_y=scale,
+                           color=color,
+                           alpha=alpha,
+                           validation=validation,
+                           ax=ax)
+    elif sphere is not None:
+        return _plot_sphere(p=dq,
+                            radius=radius,
+                            color=color,
+                            alpha=alpha,
+                            resolution=resolution,
+                            validation=validation,
+                            ax=ax)
+    else:
+        return _plot_pose(x=dq,
+                          length=scale,
+                          validation=validation,
+                          ax=ax)
+
+def _plot_dqs(dqs,
+              scale: float = 0.1,
+              line = None,
+              plane = None,
+              sphere = None,
+              radius = None,
+              color = 'r',
+              alpha = 0.8,
+              resolution = None,
+              validation = None,
+              ax = None
+              ):
+    """
+    The same as `_plot_dq`, but for many DQs at once. Poses are drawn in batch by `_plot_poses`, lines by
+    `_plot_lines`, planes by `_plot_planes`, and spheres by `_plot_spheres`. Unless the validation policy is "off", all
+    DQs are checked at once before any of them is drawn.
+
+    :param dqs: A sequence of DQs or an array of shape (N, 8). For spheres, also an array of shape (N, 3) with the
+        centres.
+    :param scale: If not None, defines the size of the frames.
+    :param line: If not None, draw the input DQs as lines.
+    :param plane: If not None, draw the input DQs as planes.
+    :param sphere: If not None, draw the input DQs as spheres.
+    :param radius: The radius of the spheres, or a sequence with the radius of each sphere.
+    :param color: Define the color of the frames, lines, planes, or spheres. For lines, planes, and spheres, it can also
+        be a sequence with the color of each DQ.
+    :param alpha: Define the alpha of the planes or spheres, or a sequence with the alpha of each of them.
+    :param resolution: Define the mesh resolution of the spheres.
+    :param validation: The validation policy or None to use the global option.
+    :param ax: Figure Axes or plt.gca() if None.
+    :raises RuntimeError: If any element of `dqs` is not valid for the input options.
+    """
+    if line is None and plane is None and sphere is None:
+        _plot_poses(xs=dqs,
+                    length=scale,
+                    validation=validation,
+                    ax=ax)
+    elif line is not None:
+        _plot_lines(ls_dq=dqs,
                     color=color,
-                    alpha=alpha,
+                    length=scale,
+                    validation=validation,
                     ax=ax)
-    elif sphere is not None:
-        _plot_sphere(p=dq,
-                     radius=radius,
+    elif plane is not None:
+        _plot_planes(pis_dq=dqs,
+                     length_x=scale,
+                     length_y=scale,
                      color=color,
                      alpha=alpha,
+                     validation=validation,
                      ax=ax)
     else:
-        _plot_pose(x=dq,
-                   length=scale,
-                   ax=ax)
-
+        _plot_spheres(ps=dqs,
+                      radius=radius,
+                      color=color,
+                      alpha=alpha,
+                      resolution=resolution,
+                      validation=validation,
+                      ax=ax)
+
+@_profiled("plane")
 def _plot_plane(pi_dq,
                 length_x: float,
                 length_y: float,
                 color,
                 alpha: float,
+                validation = None,
                 ax=None):
     """
     Draw a plane representing the DQ pi_dq. In this plot, the normal will be represented by the local z-axis of the plane
@@ -133,52 +398,160 @@ def _plot_plane(pi_dq,
     :param length_y: The desired y-axis length.
     :param color: Define the color of the plane.
     :param alpha: Define the alpha of the plane.
+    :param validation: The validation policy or None to use the global option. With "strict", the pose of the plane is
+        also checked to be in the plane.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The Poly3DCollection of the plane.
     :raises RuntimeError: If argument `x` is not a plane.
     """
-
-    if not is_plane(pi_dq):
-        raise RuntimeError(f"The input pi_dq = {pi_dq} is not a plane.")
-    # https://stackoverflow.com/questions/26989131/add-cylinder-to-plot
-    # I modified the code above to use dual quaternion algebra.
+    with _stage("validation"):
+        validation = _resolve_validation(validation)
+        if validation != "off" and not is_plane(pi_dq):
+            raise RuntimeError(f"The input pi_dq = {pi_dq} is not a plane.")
     if ax is None:
         ax = plt.gca()
 
-    # For plotting, we need to align the z-axis of the plot to the normal of the plane.
-    n = P(pi_dq)
-    d = D(pi_dq)
+    x_grid_ad, y_grid_ad, z_grid_ad = __plane_grid(pi_dq, length_x, length_y, validation)
 
-    # Find a rotation that aligns the origin's z-axis with the normal to the plane.
-    if not np.allclose(n.q, k_.q, atol=DQ_threshold):
-        phi: float = acos(dot(k_, n).q[0])
-        v: DQ = cross(k_, n) * (1.0 / sin(phi))
-        r: DQ = cos(phi / 2.0) + v * sin(phi / 2.0)
-    else:
-        r: DQ = DQ([1])
+    with _stage("artists"):
+        return ax.plot_surface(x_grid_ad,
+                               y_grid_ad,
+                               z_grid_ad,
+                               alpha=alpha,
+                               color=color)
 
-    # The translation about z is after the normal is applied.
-    x_dq: DQ = r * (1 + 0.5*E_ * d * k_)
 
-    # Sanity check: is the point in the plane?
-    p = translation(x_dq)
-    if not np.isclose(dot(p, n).q[0], d.q[0], atol=DQ_threshold):
-        raise RuntimeError(f"The point {p} is not in the plane. <p, n> = {dot(p, n).q[0]} != {d.q[0]}.")
+@_profiled("plane_update")
+def _update_plane(plane, pi_dq, length_x: float, length_y: float, color, validation = None):
+    """
+    This internal function moves a plane drawn by `_plot_plane` to the plane `pi_dq` without creating a new artist.
+    :param plane: The Poly3DCollection returned by `_plot_plane`.
+    :param pi_dq: The DQ representation of the plane.
+    :param length_x: The x-axis length. Must be the same used in `_plot_plane`.
+    :param length_y: The y-axis length. Must be the same used in `_plot_plane`.
+    :param color: The color of the plane, needed to update its shading.
+    :param validation: The validation policy or None to use the global option.
+    :raises RuntimeError: If argument `x` is not a plane.
+    """
+    with _stage("validation"):
+        validation = _resolve_validation(validation)
+        if validation != "off" and not is_plane(pi_dq):
+            raise RuntimeError(f"The input pi_dq = {pi_dq} is not a plane.")
 
-    # Cylindrical points start at zero
-    x = np.linspace(-length_x / 2.0, length_x / 2.0, 2)
-    y = np.linspace(-length_y / 2.0, length_y / 2.0, 2)
+    x_grid_ad, y_grid_ad, z_grid_ad = __plane_grid(pi_dq, length_x, length_y, validation)
+
+    with _stage("mesh"):
+        polygons = __surface_polygons(x_grid_ad, y_grid_ad, z_grid_ad)
+
+    with _stage("artists"):
+        plane.set_verts(polygons)
+        plane.set_facecolor(_shade_colors(color, polygons))
+
+
+@_profiled("planes")
+def _plot_planes(pis_dq,
+                 length_x: float,
+                 length_y: float,
+                 color,
+                 alpha,
+                 validation = None,
+                 ax=None):
+    """
+    Draw many planes at once as a single Poly3DCollection, instead of one surface per plane of `_plot_plane`. The
+    rectangles of all planes are computed at once from the normals `P(pi_dq)` and distances `D(pi_dq)`.
+    :param pis_dq: the planes as a sequence of DQs or as an array of shape (N, 8).
+    :param length_x: The desired x-axis length.
+    :param length_y: The desired y-axis length.
+    :param color: The color of all planes or a sequence with the color of each plane.
+    :param alpha: The alpha of all planes or a sequence with the alpha of each plane.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", all planes are
+        checked at once.
+    :param ax: Figure Axes or plt.gca() if None.
+    :return: The Poly3DCollection of the planes.
+    :raises RuntimeError: If any element of `pis_dq` is not a plane.
+    """
+    pis_array = _as_vec8_array(pis_dq)
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off":
+            __check_batch(pis_array, _is_plane, "plane")
+    if ax is None:
+        ax = plt.gca()
+
+    with _stage("dq_algebra"):
+        n = pis_array[:, 1:4]
+        d = pis_array[:, 4]
+
+        # The rotations that align the z-axis with each normal, as in `__plane_grid`. The half-angle form avoids
+        # dividing by sin(phi), and a normal opposite to the z-axis is reached by rotating about the x-axis.
+        cos_half_phi = np.sqrt(np.clip((1.0 + n[:, 2]) / 2.0, 0.0, 1.0))
+        opposite = cos_half_phi < DQ_threshold
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v = np.cross(np.array([0.0, 0.0, 1.0]), n) / (2.0 * cos_half_phi[:, np.newaxis])
+        r = np.column_stack((cos_half_phi, v))
+        r[opposite] = (0.0, 1.0, 0.0, 0.0)
+        rotation_matrices = _quaternion_to_rotation_matrix(r)
+
+    with _stage("mesh"):
+        # The corners in the same order as the single quadrilateral `plot_surface` draws for a 2x2 grid
+        corners_x = np.array([-1.0, 1.0, 1.0, -1.0]) * (length_x / 2.0)
+        corners_y = np.array([-1.0, -1.0, 1.0, 1.0]) * (length_y / 2.0)
+        polygons = ((d[:, np.newaxis] * n)[:, np.newaxis, :]
+                    + corners_x[np.newaxis, :, np.newaxis] * rotation_matrices[:, np.newaxis, :, 0]
+                    + corners_y[np.newaxis, :, np.newaxis] * rotation_matrices[:, np.newaxis, :, 1])
+
+    with _stage("artists"):
+        facecolors = _shade_colors(color, polygons)
+        facecolors[:, 3] = alpha
+        planes = Poly3DCollection(polygons, facecolors=facecolors)
+        ax.add_collection3d(planes)
+
+    return planes
+
+
+def __plane_grid(pi_dq, length_x: float, length_y: float, validation: str):
+    """
+    This internal function computes the grids of the rectangle that represents the plane `pi_dq`.
+    :param pi_dq: The DQ representation of the plane.
+    :param length_x: The desired x-axis length.
+    :param length_y: The desired y-axis length.
+    :param validation: The resolved validation policy. With "strict", the pose of the plane is checked to be in the plane.
+    :return: The x-axis, y-axis, and z-axis grids of the plane.
+    :raises RuntimeError: If the pose of the plane is not in the plane.
+    """
+    # https://stackoverflow.com/questions/26989131/add-cylinder-to-plot
+    # I modified the code above to use dual quaternion algebra.
+    with _stage("dq_algebra"):
+        # For plotting, we need to align the z-axis of the plot to the normal of the plane.
+        n = P(pi_dq)
+        d = D(pi_dq)
+
+        # Find a rotation that aligns the origin's z-axis with the normal to the plane.
+        if not np.allclose(n.q, k_.q, atol=DQ_threshold):
+            phi: float = acos(dot(k_, n).q[0])
+            v: DQ = cross(k_, n) * (1.0 / sin(phi))
+            r: DQ = cos(phi / 2.0) + v * sin(phi / 2.0)
+        else:
+            r: DQ = DQ([1])
+
+        # The translation about z is after the normal is applied.
+        x_dq: DQ = r * (1 + 0.5*E_ * d * k_)
 
-    x_grid, y_grid = np.meshgrid(x, y)
-    z_grid = np.zeros(x_grid.shape)
+        # Sanity check: is the point in the plane?
+        p = translation(x_dq)
+        if validation == "strict" and not np.isclose(dot(p, n).q[0], d.q[0], atol=DQ_threshold):
+            raise RuntimeError(f"The point {p} is not in the plane. <p, n> = {dot(p, n).q[0]} != {d.q[0]}.")
 
-    x_grid_ad, y_grid_ad, z_grid_ad = __dq_adjoint_grid(x_dq, x_grid, y_grid, z_grid)
+    with _stage("mesh"):
+        # Cylindrical points start at zero
+        x = np.linspace(-length_x / 2.0, length_x / 2.0, 2)
+        y = np.linspace(-length_y / 2.0, length_y / 2.0, 2)
 
-    ax.plot_surface(x_grid_ad,
-                    y_grid_ad,
-                    z_grid_ad,
-                    alpha=alpha,
-                    color=color)
+        x_grid, y_grid = np.meshgrid(x, y)
+        z_grid = np.zeros(x_grid.shape)
 
+        return __pose_grid(x_dq, x_grid, y_grid, z_grid)
+
+@_profiled("serial_manipulator")
 def _plot_serial_manipulator(robot: DQ_SerialManipulator,
                              q: np.ndarray,
                              line_color: str = "k",
@@ -187,7 +560,10 @@ def _plot_serial_manipulator(robot: DQ_SerialManipulator,
                              cylinder_alpha: float = 0.8,
                              cylinder_radius: float = 0.02,
                              cylinder_height: float = 0.07,
-                             ax=None):
+                             resolution = None,
+                             validation = None,
+                             ax=None,
+                             handle: SerialManipulatorHandle = None):
     """
     Draw a serial manipulator at a given joint configuration q. Each joint transformation will be connected by a line
     with spec line_color and width linewidth.
@@ -197,138 +573,584 @@ def _plot_serial_manipulator(robot: DQ_SerialManipulator,
     :param line_width: The width is compatible with matplotlib.
     :param cylinder_color: A suitable color for the cylinder.
     :param cylinder_alpha: The alpha of the cylinder.
+    :param resolution: The mesh resolution of the cylinders, as a number of points or "auto". If None, the global
+        option "cylinder_resolution" is used.
+    :param validation: The validation policy or None to use the global option. The poses of the frames are checked
+        once, either one by one with "strict" or all at once with "once-per-batch", and not again by each artist.
     :param ax: Figure Axes or plt.gca() if None.
+    :param handle: If not None, the `SerialManipulatorHandle` returned by a previous call. Its artists are moved to
+        `q` in place, instead of drawing new ones, and the style arguments are ignored.
+    :return: The `SerialManipulatorHandle` holding the artists of the manipulator.
+    :raises RuntimeError: If the pose of any frame is not a unit dual quaternion.
     """
+    # Store pose information of the reference frame, of each joint, and of the end effector. The joint poses are
+    # calculated in a single forward sweep, or taken from the kinematics cache, and the last one is the same as
+    # robot.fkm(q).
+    with _stage("kinematics"):
+        x_ref = robot.get_reference_frame()
+        x_joints = _fkm_all_cached(robot, q)
+    x_eff = x_joints[-1]
+    x_frames = [x_ref] + x_joints + [x_eff]
+
+    # Check each frame only once, the joint cylinders share the poses of the frames
+    with _stage("validation"):
+        validation = _resolve_validation(validation)
+        if validation == "strict":
+            for x in x_frames:
+                if not is_unit(x):
+                    raise RuntimeError(f"The input x = {x} is not a unit dual quaternion.")
+        elif validation == "once-per-batch":
+            __check_batch(_as_vec8_array(x_frames), _is_unit, "unit dual quaternion")
+
+    with _stage("dq_algebra"):
+        t_plot = np.array([translation(x).q[1:4] for x in x_frames])
+
+    if handle is not None:
+        with _stage("artists"):
+            handle.line.set_data_3d(t_plot[:, 0], t_plot[:, 1], t_plot[:, 2])
+        _update_poses(handle.poses, x_frames, validation="off")
+        for cylinder, xi in zip(handle.cylinders, x_joints):
+            __update_cylinder(cylinder,
+                              xi,
+                              color=handle.cylinder_color,
+                              height_z=handle.cylinder_height,
+                              radius=handle.cylinder_radius,
+                              resolution=handle.cylinder_resolution)
+        handle.x_effector = x_eff
+        return handle
+
     if ax is None:
         ax = plt.gca()
 
-    x_plot = []
-    y_plot = []
-    z_plot = []
-
-    # Store pose information and draw reference frames of each joint
-    for i in range(0, robot.get_dim_configuration_space()):
-        xi = robot.fkm(q, i)
-        t = translation(xi)
-        x_plot.append(t.q[1])
-        y_plot.append(t.q[2])
-        z_plot.append(t.q[3])
-
-        __plot_revolute_joint(xi,
-                              color=cylinder_color,
-                              alpha=cylinder_alpha,
-                              height_z=cylinder_height,
-                              radius=cylinder_radius,
-                              ax=ax)
-        _plot_pose(xi, ax=ax)
-
-    # Draw the reference frame
-    x_ref = robot.get_reference_frame()
-    t_ref = translation(x_ref)
-    _plot_pose(x_ref, ax=ax)
-    # Draw line connecting reference frame to joint 0
-    ax.plot3D((t_ref.q[1], x_plot[0]),
-              (t_ref.q[2], y_plot[0]),
-              (t_ref.q[3], z_plot[0]),
-              line_color,
-              linewidth=line_width)
-
-    # Draw lines connecting the sequential reference frames
-    for i in range(0, len(x_plot) - 1):
-        ax.plot3D((x_plot[i], x_plot[i + 1]),
-                  (y_plot[i], y_plot[i + 1]),
-                  (z_plot[i], z_plot[i + 1]),
-                  color=line_color,
-                  linewidth=line_width)
-
-    # Draw end effector frame
-    x_eff = robot.fkm(q)
-    t_eff = translation(x_eff)
-    _plot_pose(x_eff, ax=ax)
-    # Draw line connecting last joint to end effector frame
-    ax.plot3D((t_eff.q[1], x_plot[-1]),
-              (t_eff.q[2], y_plot[-1]),
-              (t_eff.q[3], z_plot[-1]),
-              line_color,
-              linewidth=line_width)
-
-
-def _plot_pose(x: DQ, length: float = 0.1, ax=None):
+    # The same resolution is kept in the handle so that updates have the same number of vertices
+    resolution = _resolve_resolution(resolution,
+                                      option="cylinder_resolution",
+                                      size=max(2.0 * cylinder_radius, cylinder_height),
+                                      ax=ax)
+
+    # Draw the reference frames of each joint
+    cylinders = [__plot_revolute_joint(xi,
+                                       color=cylinder_color,
+                                       alpha=cylinder_alpha,
+                                       height_z=cylinder_height,
+                                       radius=cylinder_radius,
+                                       resolution=resolution,
+                                       ax=ax) for xi in x_joints]
+    poses = [_plot_pose(x, validation="off", ax=ax) for x in x_frames]
+
+    # Draw a line connecting the reference frame, the sequential joint frames, and the end effector frame
+    with _stage("artists"):
+        line, = ax.plot3D(t_plot[:, 0],
+                          t_plot[:, 1],
+                          t_plot[:, 2],
+                          line_color,
+                          linewidth=line_width)
+
+    return SerialManipulatorHandle(robot,
+                                   line=line,
+                                   poses=poses,
+                                   cylinders=cylinders,
+                                   cylinder_color=cylinder_color,
+                                   cylinder_radius=cylinder_radius,
+                                   cylinder_height=cylinder_height,
+                                   cylinder_resolution=resolution,
+                                   x_effector=x_eff)
+
+
+@_profiled("serial_manipulators")
+def _plot_serial_manipulators(robots_qs: list,
+                              line_color = "k",
+                              line_width = 3,
+                              cylinder_color = "b",
+                              cylinder_alpha = 0.8,
+                              cylinder_radius = 0.02,
+                              cylinder_height = 0.07,
+                              resolution = None,
+                              validation = None,
+                              ax=None,
+                              handle: SerialManipulatorsHandle = None):
+    """
+    Draw many serial manipulators, e.g. the robots of a workcell, with artists shared by all of them: a single
+    Line3DCollection for the lines connecting the frames, the batched frames of `_plot_poses`, and a single
+    Poly3DCollection for the joint cylinders. Each style argument is either one value for all robots or a sequence with
+    the value of each robot. The result looks the same as calling `_plot_serial_manipulator` for each robot, except for
+    the order in which overlapping artists of different robots are drawn.
+    :param robots_qs: A list of `(robot, q)` pairs, where `robot` is a concrete subclass of DQ_SerialManipulator and
+        `q` its joint configurations.
+    :param line_color: The color of the lines.
+    :param line_width: The width of the lines.
+    :param cylinder_color: The color of the cylinders.
+    :param cylinder_alpha: The alpha of the cylinders.
+    :param cylinder_radius: The radius of the cylinders.
+    :param cylinder_height: The height of the cylinders.
+    :param resolution: The mesh resolution of the cylinders, as a number of points or "auto". If None, the global
+        option "cylinder_resolution" is used.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", the poses of all
+        frames are checked at once.
+    :param ax: Figure Axes or plt.gca() if None.
+    :param handle: If not None, the `SerialManipulatorsHandle` returned by a previous call with the same robots. Its
+        artists are moved in place, instead of drawing new ones, and the style arguments are ignored.
+    :return: The `SerialManipulatorsHandle` holding the artists of the manipulators.
+    :raises RuntimeError: If the pose of any frame is not a unit dual quaternion or if a sequence of styles does not
+        have one style per robot.
+    """
+    n_robots = len(robots_qs)
+    if handle is not None and len(handle.robots) != n_robots:
+        raise RuntimeError(f"The handle has {len(handle.robots)} robots, not {n_robots}.")
+
+    # The frames of each robot are the same as in `_plot_serial_manipulator`: the reference frame, each joint, and the
+    # end effector.
+    with _stage("kinematics"):
+        x_joints = [_as_vec8_array(_fkm_all_cached(robot, q)) for robot, q in robots_qs]
+        x_frames = [np.vstack((robot.get_reference_frame().vec8(), x_joints_i, x_joints_i[-1]))
+                    for (robot, _), x_joints_i in zip(robots_qs, x_joints)]
+    n_joints = np.array([len(x_joints_i) for x_joints_i in x_joints])
+    x_joints = np.vstack(x_joints)
+    x_frames_array = np.vstack(x_frames)
+
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off":
+            __check_batch(x_frames_array, _is_unit, "unit dual quaternion")
+
+    with _stage("dq_algebra"):
+        t_frames = _translation(x_frames_array)
+        links = np.split(t_frames, np.cumsum([len(x_frames_i) for x_frames_i in x_frames])[:-1])
+
+    if handle is not None:
+        with _stage("artists"):
+            handle.links.set_segments(links)
+        __move_poses(handle.poses, x_frames_array, length=0.1)
+        with _stage("mesh"):
+            polygons = __cylinders_polygons(x_joints, handle.cylinder_scales, handle.cylinder_resolution)
+        with _stage("artists"):
+            handle.cylinders.set_verts(polygons)
+            handle.cylinders.set_facecolor(_shade_colors(handle.cylinder_colors, polygons))
+        return handle
+
+    if ax is None:
+        ax = plt.gca()
+
+    def per_robot(value, shape=()):
+        try:
+            return np.array(np.broadcast_to(value, (n_robots,) + shape))
+        except ValueError:
+            raise RuntimeError(f"Each style must be one value or a sequence of {n_robots} values, one per robot.") from None
+
+    def per_joint(value):
+        return np.repeat(per_robot(np.asarray(value, dtype=float)), n_joints)
+
+    cylinder_scales = np.column_stack((per_joint(cylinder_radius), per_joint(cylinder_radius), per_joint(cylinder_height)))
+    resolution = _resolve_resolution(resolution,
+                                      option="cylinder_resolution",
+                                      size=float(np.max(cylinder_scales * (2.0, 2.0, 1.0), initial=0.0)),
+                                      ax=ax)
+
+    with _stage("mesh"):
+        polygons = __cylinders_polygons(x_joints, cylinder_scales, resolution)
+
+    with _stage("artists"):
+        colors = per_robot(mcolors.to_rgba_array(cylinder_color), (4,))
+        colors[:, 3] = per_robot(np.asarray(cylinder_alpha, dtype=float))
+        polygons_per_joint = len(polygons) // max(len(x_joints), 1)
+        cylinder_colors = np.repeat(colors, n_joints * polygons_per_joint, axis=0)
+        cylinders = Poly3DCollection(polygons, facecolors=_shade_colors(cylinder_colors, polygons))
+        ax.add_collection3d(cylinders)
+
+    poses = _plot_poses(x_frames_array, validation="off", ax=ax)
+
+    # Draw a line connecting the reference frame, the sequential joint frames, and the end effector frame of each robot
+    with _stage("artists"):
+        links = Line3DCollection(links,
+                                 colors=per_robot(mcolors.to_rgba_array(line_color), (4,)),
+                                 linewidths=per_robot(np.asarray(line_width, dtype=float)))
+        ax.add_collection3d(links)
+
+    return SerialManipulatorsHandle(robots=[robot for robot, _ in robots_qs],
+                                    links=links,
+                                    poses=poses,
+                                    cylinders=cylinders,
+                                    cylinder_colors=cylinder_colors,
+                                    cylinder_scales=cylinder_scales,
+                                    cylinder_resolution=resolution)
+
+
+def __cylinders_polygons(xs: np.ndarray, scales: np.ndarray, resolution: int) -> np.ndarray:
+    """
+    This internal function computes the polygons of many cylinders at once from the cached unit cylinder.
+    :param xs: An array of shape (J, 8) with the pose of the centre of each cylinder.
+    :param scales: An array of shape (J, 3) with the radius, radius, and height of each cylinder.
+    :param resolution: the number of points of the mesh along each direction.
+    :return: An array of shape (J * M, 4, 3) with the M polygons of each cylinder.
+    """
+    unit_polygons = __surface_polygons(*__unit_cylinder_mesh(resolution))
+    rotation_matrices = _quaternion_to_rotation_matrix(xs[:, :4])
+    # The vertices of each cylinder are rotated at once as the rows of a matrix
+    vertices = (unit_polygons.reshape(1, -1, 3) * scales[:, np.newaxis, :]) @ rotation_matrices.swapaxes(1, 2)
+    vertices += _translation(xs)[:, np.newaxis, :]
+    return vertices.reshape(-1, 4, 3)
+
+
+def __move_poses(poses: tuple, xs: np.ndarray, length: float = 0.1):
+    """
+    This internal function moves the artists returned by `_plot_poses` to the poses `xs` without creating new artists.
+    :param poses: The artists returned by `_plot_poses`.
+    :param xs: An array of shape (N, 8) with the poses, already validated.
+    :param length: the length of each axis' line. Must be the same used in `_plot_poses`.
+    """
+    with _stage("dq_algebra"):
+        t = _translation(xs)
+        rotation_matrices = _quaternion_to_rotation_matrix(xs[:, :4])
+
+    with _stage("artists"):
+        centres, *arrows = poses
+        centres.set_data_3d(t[:, 0], t[:, 1], t[:, 2])
+        for i, arrow in enumerate(arrows):
+            arrow.set_segments(__quiver_segments(t, rotation_matrices[:, :, i], length))
+
+
+@_profiled("pose")
+def _plot_pose(x: DQ, length: float = 0.1, validation = None, ax=None):
     """
     Draw a reference frame at a given pose x.
     :param x: the pose as a unit DQ.
     :param length: the length of each axis' line. Has a default value.
+    :param validation: The validation policy or None to use the global option.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The artists of the centre marker and of the x-axis, y-axis, and z-axis arrows.
     :raises RuntimeError: If argument `x` is not a unit dual quaternion.
     """
-    if not is_unit(x):
-        raise RuntimeError(f"The input x = {x} is not a unit dual quaternion.")
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off" and not is_unit(x):
+            raise RuntimeError(f"The input x = {x} is not a unit dual quaternion.")
+    if ax is None:
+        ax = plt.gca()
+
+    with _stage("dq_algebra"):
+        t = translation(x)
+
+        i_prime = Ad(x, i_)
+        j_prime = Ad(x, j_)
+        k_prime = Ad(x, k_)
+
+    with _stage("artists"):
+        # Centre of the reference frame
+        centre, = ax.plot3D(t.q[1],
+                            t.q[2],
+                            t.q[3],
+                            "kx")
+
+        # x-axis arrow
+        x_arrow = ax.quiver(t.q[1], t.q[2], t.q[3],
+                            i_prime.q[1], i_prime.q[2], i_prime.q[3],
+                            length=length,
+                            color="r",
+                            normalize=True)
+
+        # y-axis arrow
+        y_arrow = ax.quiver(t.q[1], t.q[2], t.q[3],
+                            j_prime.q[1], j_prime.q[2], j_prime.q[3],
+                            length=length,
+                            color="g",
+                            normalize=True)
+
+        # z-axis arrow
+        z_arrow = ax.quiver(t.q[1], t.q[2], t.q[3],
+                            k_prime.q[1], k_prime.q[2], k_prime.q[3],
+                            length=length,
+                            color="b",
+                            normalize=True)
+
+    return centre, x_arrow, y_arrow, z_arrow
+
+
+@_profiled("poses")
+def _plot_poses(xs, length: float = 0.1, validation = None, ax=None):
+    """
+    Draw reference frames at many poses at once. The centres of all frames are drawn as a single artist and all axes
+    of the same color are drawn by a single quiver, instead of the four artists per pose of `_plot_pose`.
+    :param xs: the poses as a sequence of unit DQs or as an array of shape (N, 8).
+    :param length: the length of each axis' line. Has a default value.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", all poses are
+        checked at once.
+    :param ax: Figure Axes or plt.gca() if None.
+    :return: The artists of the centre markers and of the x-axis, y-axis, and z-axis arrows.
+    :raises RuntimeError: If any element of `xs` is not a unit dual quaternion.
+    """
+    xs_array = _as_vec8_array(xs)
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off":
+            __check_batch(xs_array, _is_unit, "unit dual quaternion")
     if ax is None:
         ax = plt.gca()
 
-    t = translation(x)
-
-    i_prime = Ad(x, i_)
-    j_prime = Ad(x, j_)
-    k_prime = Ad(x, k_)
-
-    # Centre of the reference frame
-    ax.plot3D(t.q[1],
-              t.q[2],
-              t.q[3],
-              "kx")
-
-    # x-axis arrow
-    ax.quiver(t.q[1], t.q[2], t.q[3],
-              i_prime.q[1], i_prime.q[2], i_prime.q[3],
-              length=length,
-              color="r",
-              normalize=True)
-
-    # y-axis arrow
-    ax.quiver(t.q[1], t.q[2], t.q[3],
-              j_prime.q[1], j_prime.q[2], j_prime.q[3],
-              length=length,
-              color="g",
-              normalize=True)
-
-    # z-axis arrow
-    ax.quiver(t.q[1], t.q[2], t.q[3],
-              k_prime.q[1], k_prime.q[2], k_prime.q[3],
-              length=length,
-              color="b",
-              normalize=True)
-
-def _plot_line(l_dq: DQ, color: str = "r", length: float = 10.0, ax=None):
+    with _stage("dq_algebra"):
+        t = _translation(xs_array)
+        # The columns of each rotation matrix are Ad(x, i_), Ad(x, j_), and Ad(x, k_)
+        rotation_matrices = _quaternion_to_rotation_matrix(xs_array[:, :4])
+        i_prime = rotation_matrices[:, :, 0]
+        j_prime = rotation_matrices[:, :, 1]
+        k_prime = rotation_matrices[:, :, 2]
+
+    with _stage("artists"):
+        # Centres of the reference frames
+        centres, = ax.plot3D(t[:, 0],
+                             t[:, 1],
+                             t[:, 2],
+                             "kx")
+
+        # x-axis arrows
+        x_arrows = ax.quiver(t[:, 0], t[:, 1], t[:, 2],
+                             i_prime[:, 0], i_prime[:, 1], i_prime[:, 2],
+                             length=length,
+                             color="r",
+                             normalize=True)
+
+        # y-axis arrows
+        y_arrows = ax.quiver(t[:, 0], t[:, 1], t[:, 2],
+                             j_prime[:, 0], j_prime[:, 1], j_prime[:, 2],
+                             length=length,
+                             color="g",
+                             normalize=True)
+
+        # z-axis arrows
+        z_arrows = ax.quiver(t[:, 0], t[:, 1], t[:, 2],
+                             k_prime[:, 0], k_prime[:, 1], k_prime[:, 2],
+                             length=length,
+                             color="b",
+                             normalize=True)
+
+    return centres, x_arrows, y_arrows, z_arrows
+
+
+@_profiled("poses_update")
+def _update_poses(poses: list, xs: list, length: float = 0.1, validation = None):
+    """
+    This internal function moves the artists returned by `_plot_pose` to the poses `xs` without creating new artists.
+    The arrows of all poses are computed at once.
+    :param poses: A list with the artists returned by `_plot_pose` for each pose.
+    :param xs: A list with the poses as unit DQs.
+    :param length: the length of each axis' line. Must be the same used in `_plot_pose`.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", all poses are
+        checked at once.
+    :raises RuntimeError: If any element of `xs` is not a unit dual quaternion.
+    """
+    xs_array = _as_vec8_array(xs)
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off":
+            __check_batch(xs_array, _is_unit, "unit dual quaternion")
+
+    with _stage("dq_algebra"):
+        t = _translation(xs_array)
+        rotation_matrices = _quaternion_to_rotation_matrix(xs_array[:, :4])
+
+    with _stage("artists"):
+        # The columns of each rotation matrix are Ad(x, i_), Ad(x, j_), and Ad(x, k_)
+        segments = __quiver_segments(np.repeat(t, 3, axis=0),
+                                     rotation_matrices.swapaxes(1, 2).reshape(-1, 3),
+                                     length)
+        shafts, positive_heads, negative_heads = np.split(segments, 3)
+
+        for i, (centre, *arrows) in enumerate(poses):
+            centre.set_data_3d(t[i, 0:1], t[i, 1:2], t[i, 2:3])
+            for j, arrow in enumerate(arrows):
+                k = 3 * i + j
+                arrow.set_segments([shafts[k], positive_heads[k], negative_heads[k]])
+
+@_profiled("line")
+def _plot_line(l_dq: DQ, color: str = "r", length: float = 10.0, validation = None, ax=None):
     """
     Draw a line representing the DQ l_dq.
     :param l_dq: the DQ representation of the line.
     :param color: the color.
     :param length: the length.
+    :param validation: The validation policy or None to use the global option.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The Line3D of the line.
     :raises RuntimeError: If argument `x` is not a line.
     """
-    if not is_line(l_dq):
-        raise RuntimeError(f"The input l_dq = {l_dq} is not a line.")
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off" and not is_line(l_dq):
+            raise RuntimeError(f"The input l_dq = {l_dq} is not a line.")
     if ax is None:
         ax = plt.gca()
 
-    # Decompose line
-    l = P(l_dq)
-    m = D(l_dq)
+    pl_negative, pl_positive = __line_endpoints(l_dq, length)
+
+    with _stage("artists"):
+        line, = ax.plot3D((pl_negative.q[1], pl_positive.q[1]),
+                          (pl_negative.q[2], pl_positive.q[2]),
+                          (pl_negative.q[3], pl_positive.q[3]),
+                          color) # It's important not to use the named `color` so that we accept strings such as `r-`.
+        return line
 
-    # This is always a point in the line. More specifically, the projection of 0i_ + 0j_ + 0k_ onto the line.
-    pl = cross(l, m)
 
-    pl_positive = pl + (length / 2.0) * l
-    pl_negative = pl - (length / 2.0) * l
+@_profiled("line_update")
+def _update_line(line, l_dq: DQ, length: float = 10.0, validation = None):
+    """
+    This internal function moves a line drawn by `_plot_line` to the line `l_dq` without creating a new artist.
+    :param line: The Line3D returned by `_plot_line`.
+    :param l_dq: the DQ representation of the line.
+    :param length: the length. Must be the same used in `_plot_line`.
+    :param validation: The validation policy or None to use the global option.
+    :raises RuntimeError: If argument `x` is not a line.
+    """
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off" and not is_line(l_dq):
+            raise RuntimeError(f"The input l_dq = {l_dq} is not a line.")
+
+    pl_negative, pl_positive = __line_endpoints(l_dq, length)
+
+    with _stage("artists"):
+        line.set_data_3d((pl_negative.q[1], pl_positive.q[1]),
+                         (pl_negative.q[2], pl_positive.q[2]),
+                         (pl_negative.q[3], pl_positive.q[3]))
+
+
+@_profiled("lines")
+def _plot_lines(ls_dq, color = "r", length: float = 10.0, validation = None, ax=None):
+    """
+    Draw many lines at once as a single Line3DCollection, instead of one artist per line of `_plot_line`. The
+    endpoints of all lines are computed at once.
+    :param ls_dq: the lines as a sequence of DQs or as an array of shape (N, 8).
+    :param color: the color or format string of all lines, e.g. "r-", or a sequence with the color of each line. Line
+        styles and markers of a format string are kept, markers being drawn as one additional artist. A format string
+        without color, e.g. "--", draws red lines.
+    :param length: the length of each line.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", all lines are
+        checked at once.
+    :param ax: Figure Axes or plt.gca() if None.
+    :return: The Line3DCollection of the lines and the Line3D of the markers, or None if there are no markers.
+    :raises RuntimeError: If any element of `ls_dq` is not a line.
+    """
+    ls_array = _as_vec8_array(ls_dq)
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off":
+            __check_batch(ls_array, _is_line, "line")
+    if ax is None:
+        ax = plt.gca()
+
+    with _stage("dq_algebra"):
+        # Decompose lines
+        l = ls_array[:, 1:4]
+        m = ls_array[:, 5:8]
+
+        # The projection of 0i_ + 0j_ + 0k_ onto each line, the same as cross(l, m) for pure quaternions.
+        pl = np.cross(l, m)
+
+        endpoints = np.stack((pl - (length / 2.0) * l, pl + (length / 2.0) * l), axis=1)
+
+    with _stage("artists"):
+        linestyle, marker, linewidth = "-", None, None
+        if isinstance(color, str):
+            # A color or a format string such as "r+-", as accepted by `_plot_line`
+            linestyle, marker, color = __parse_format(color)
+            if marker == "None":
+                marker = None
+            if linestyle is None:
+                linestyle = "-"
+            elif linestyle in ("None", " ", ""):
+                # Only markers, e.g. "r+"
+                linestyle, linewidth = "-", 0
+            if color is None:
+                color = "r"
+
+        lines = Line3DCollection(endpoints, colors=color, linestyles=linestyle, linewidths=linewidth)
+        ax.add_collection3d(lines)
+
+        markers = None
+        if marker is not None:
+            markers, = ax.plot3D(endpoints[:, :, 0].ravel(),
+                                 endpoints[:, :, 1].ravel(),
+                                 endpoints[:, :, 2].ravel(),
+                                 marker=marker,
+                                 linestyle="None",
+                                 color=color)
+
+    return lines, markers
+
+
+def __parse_format(fmt: str):
+    """
+    This internal function splits a format string of `plt.plot`, e.g. "r+-", into its linestyle, marker, and color,
+    with the same rules and results as matplotlib. A string that is a color as a whole, e.g. "k" or "#ff8000", is only
+    a color. Otherwise, each character is a linestyle, a marker, or a single-character color, and "C0", "C1", ... are
+    colors of the cycle.
+    :param fmt: The format string.
+    :return: The linestyle, marker, and color. The color is None if not in `fmt`. If `fmt` is a color as a whole, the
+        linestyle and marker are None. Otherwise, a missing linestyle or marker is "None", i.e. not drawn, except that
+        the default linestyle is used when neither is given.
+    :raises RuntimeError: If `fmt` is not a valid format string.
+    """
+    # The grayscale strings "0" and "1" are read as markers, as in matplotlib
+    if fmt not in ("0", "1") and mcolors.is_color_like(fmt):
+        return None, None, mcolors.to_rgba(fmt)
+
+    linestyle, marker, color = None, None, None
+    i = 0
+    while i < len(fmt):
+        c = fmt[i]
+        # The two-character linestyles first, e.g. "--" before "-"
+        if fmt[i:i + 2] in mlines.lineStyles or c in mlines.lineStyles:
+            if linestyle is not None:
+                raise RuntimeError(f"The format string {fmt} has two linestyles.")
+            linestyle = fmt[i:i + 2] if fmt[i:i + 2] in mlines.lineStyles else c
+            i += len(linestyle)
+        elif c in mlines.lineMarkers:
+            if marker is not None:
+                raise RuntimeError(f"The format string {fmt} has two markers.")
+            marker = c
+            i += 1
+        elif c in mcolors.get_named_colors_mapping():
+            if color is not None:
+                raise RuntimeError(f"The format string {fmt} has two colors.")
+            color = c
+            i += 1
+        elif c == "C":
+            cycle_color = re.match(r"C\d+", fmt[i:])
+            if not cycle_color:
+                raise RuntimeError(f"The format string {fmt} has a 'C' that is not followed by a number.")
+            color = mcolors.to_rgba(cycle_color[0])
+            i += len(cycle_color[0])
+        else:
+            raise RuntimeError(f"The format string {fmt} has the unrecognized character {c!r}.")
+
+    if linestyle is None and marker is None:
+        linestyle = matplotlib.rcParams["lines.linestyle"]
+    if linestyle is None:
+        linestyle = "None"
+    if marker is None:
+        marker = "None"
+    return linestyle, marker, color
 
-    ax.plot3D((pl_negative.q[1], pl_positive.q[1]),
-              (pl_negative.q[2], pl_positive.q[2]),
-              (pl_negative.q[3], pl_positive.q[3]),
-              color) # It's important not to use the named `color` so that we accept strings such as `r-`.
 
-def _plot_sphere(p: DQ, radius: float, color = 'b', alpha: float = 0.8, ax=None):
+def __line_endpoints(l_dq: DQ, length: float):
+    """
+    This internal function computes the endpoints of the segment that represents the line `l_dq`.
+    :param l_dq: the DQ representation of the line.
+    :param length: the length of the segment.
+    :return: The endpoints as pure quaternions.
+    """
+    with _stage("dq_algebra"):
+        # Decompose line
+        l = P(l_dq)
+        m = D(l_dq)
+
+        # This is always a point in the line. More specifically, the projection of 0i_ + 0j_ + 0k_ onto the line.
+        pl = cross(l, m)
+
+        pl_positive = pl + (length / 2.0) * l
+        pl_negative = pl - (length / 2.0) * l
+
+    return pl_negative, pl_positive
+
+@_profiled("sphere")
+def _plot_sphere(p: DQ,
+                 radius: float,
+                 color = 'b',
+                 alpha: float = 0.8,
+                 resolution = None,
+                 validation = None,
+                 ax=None):
     """
     Draw a sphere of a given `radius` centered at `p`, where `p` is a pure quaternion.
 
@@ -338,20 +1160,185 @@ def _plot_sphere(p: DQ, radius: float, color = 'b', alpha: float = 0.8, ax=None)
     :param radius: the radius of the sphere.
     :param color: the color of the sphere.
     :param alpha: the transparency of the sphere.
+    :param resolution: the number of points of the mesh along each direction, or "auto". If None, the global option
+        "sphere_resolution" is used.
+    :param validation: The validation policy or None to use the global option.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The Poly3DCollection of the sphere.
     :raises: RuntimeError: If `p` is not a pure quaternion.
     """
-    if (not is_quaternion(p)) or (not is_pure(p)):
-        raise RuntimeError(f"The input p = {p} is not a pure quaternion.")
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off" and ((not is_quaternion(p)) or (not is_pure(p))):
+            raise RuntimeError(f"The input p = {p} is not a pure quaternion.")
+    if ax is None:
+        ax = plt.gca()
+
+    with _stage("mesh"):
+        resolution = _resolve_resolution(resolution, option="sphere_resolution", size=2.0 * radius, ax=ax)
+    x_grid, y_grid, z_grid = __sphere_grid(p, radius, resolution)
+
+    with _stage("artists"):
+        return ax.plot_surface(x_grid,
+                               y_grid,
+                               z_grid,
+                               color=color,
+                               alpha=alpha)
+
+
+@_profiled("sphere_update")
+def _update_sphere(sphere, p: DQ, radius: float, color, resolution: int, validation = None):
+    """
+    This internal function moves a sphere drawn by `_plot_sphere` to the centre `p` without creating a new artist.
+    :param sphere: The Poly3DCollection returned by `_plot_sphere`.
+    :param p: the DQ representing the centre of the sphere.
+    :param radius: the radius of the sphere.
+    :param color: the color of the sphere, needed to update its shading.
+    :param resolution: the number of points of the mesh along each direction. Must be the same used in `_plot_sphere`.
+    :param validation: The validation policy or None to use the global option.
+    :raises: RuntimeError: If `p` is not a pure quaternion.
+    """
+    with _stage("validation"):
+        if _resolve_validation(validation) != "off" and ((not is_quaternion(p)) or (not is_pure(p))):
+            raise RuntimeError(f"The input p = {p} is not a pure quaternion.")
+
+    x_grid, y_grid, z_grid = __sphere_grid(p, radius, resolution)
+
+    with _stage("mesh"):
+        polygons = __surface_polygons(x_grid, y_grid, z_grid)
+
+    with _stage("artists"):
+        sphere.set_verts(polygons)
+        sphere.set_facecolor(_shade_colors(color, polygons))
+
+
+def __sphere_grid(p: DQ, radius: float, resolution: int):
+    """
+    This internal function computes the grids of a sphere from the cached unit sphere.
+    :param p: the DQ representing the centre of the sphere.
+    :param radius: the radius of the sphere.
+    :param resolution: the number of points of the mesh along each direction.
+    :return: The x-axis, y-axis, and z-axis grids of the sphere.
+    """
+    with _stage("mesh"):
+        x_unit, y_unit, z_unit = __unit_sphere_mesh(resolution)
+        return radius * x_unit + p.q[1], radius * y_unit + p.q[2], radius * z_unit + p.q[3]
+
+
+@_profiled("spheres")
+def _plot_spheres(ps,
+                  radius,
+                  color = 'b',
+                  alpha = 0.8,
+                  resolution = None,
+                  validation = None,
+                  ax=None):
+    """
+    Draw many spheres at once. Up to the global option "sphere_scatter_threshold" spheres, all meshes are copies of the
+    cached unit sphere, scaled and translated with NumPy, and are drawn as a single Poly3DCollection. Above it, each
+    sphere is drawn as a scatter marker whose area matches the radius for the current axes limits and view, so that
+    large sets are drawn in roughly constant time. The markers are not resized when the view changes.
+    :param ps: the centres as a sequence of pure quaternions, as an array of shape (N, 8), or as an array of shape
+        (N, 3).
+    :param radius: the radius of all spheres or a sequence with the radius of each sphere.
+    :param color: the color of all spheres or a sequence with the color of each sphere.
+    :param alpha: the transparency of all spheres or a sequence with the transparency of each sphere.
+    :param resolution: the number of points of the mesh along each direction, or "auto". If None, the global option
+        "sphere_resolution" is used.
+    :param validation: The validation policy or None to use the global option. Unless it is "off", all centres given as
+        DQs are checked at once.
+    :param ax: Figure Axes or plt.gca() if None.
+    :return: The Poly3DCollection of the spheres or, above the threshold, the Path3DCollection of the markers.
+    :raises RuntimeError: If any element of `ps` is not a pure quaternion.
+    """
+    if isinstance(ps, np.ndarray) and ps.ndim == 2 and ps.shape[1] == 3:
+        centres = np.asarray(ps, dtype=float)
+    else:
+        ps_array = _as_vec8_array(ps)
+        with _stage("validation"):
+            if _resolve_validation(validation) != "off":
+                __check_batch(ps_array, _is_pure_quaternion, "pure quaternion")
+        centres = ps_array[:, 1:4]
+    radii = np.broadcast_to(np.asarray(radius, dtype=float), (len(centres),))
     if ax is None:
         ax = plt.gca()
 
-    u, v = np.mgrid[0:2 * np.pi:50j, 0:np.pi:50j]
-    x = radius * np.cos(u) * np.sin(v)
-    y = radius * np.sin(u) * np.sin(v)
-    z = radius * np.cos(v)
+    # The same RGBA colors are used by the markers and the meshes, e.g. for a sequence mixing names and tuples
+    colors = np.array(np.broadcast_to(mcolors.to_rgba_array(color), (len(centres), 4)))
+    colors[:, 3] = alpha
+
+    if len(centres) > _options["sphere_scatter_threshold"]:
+        with _stage("artists"):
+            # The marker size is an area in points^2, so the radius is converted with the scale of the current view
+            sizes = (2.0 * radii * _points_per_data_unit(ax)) ** 2
+            return ax.scatter(centres[:, 0], centres[:, 1], centres[:, 2],
+                              s=sizes,
+                              color=colors,
+                              depthshade=False)
+
+    with _stage("mesh"):
+        resolution = _resolve_resolution(resolution,
+                                         option="sphere_resolution",
+                                         size=2.0 * float(np.max(radii, initial=0.0)),
+                                         ax=ax)
+        unit_polygons = __surface_polygons(*__unit_sphere_mesh(resolution))
+        polygons = (radii[:, np.newaxis, np.newaxis, np.newaxis] * unit_polygons[np.newaxis]
+                    + centres[:, np.newaxis, np.newaxis, :]).reshape(-1, 4, 3)
+
+    with _stage("artists"):
+        # Scaling and translating do not change the normals, so all spheres share the shading of the unit sphere
+        shade = _shade_colors("w", unit_polygons)[:, 0]
+        facecolors = np.repeat(colors[:, np.newaxis, :], len(unit_polygons), axis=1)
+        facecolors[:, :, :3] *= shade[np.newaxis, :, np.newaxis]
+
+        spheres = Poly3DCollection(polygons, facecolors=facecolors.reshape(-1, 4))
+        ax.add_collection3d(spheres)
+
+    return spheres
+
+
+def _points_per_data_unit(ax) -> float:
+    """
+    This internal function estimates how many typographic points one data unit spans on the screen, in the direction
+    of the screen parallel to the xy-plane, for the current axes limits and view.
+    :param ax: The 3D Axes.
+    :return: The number of points per data unit.
+    """
+    centre = np.array([np.mean(ax.get_xlim3d()), np.mean(ax.get_ylim3d()), np.mean(ax.get_zlim3d())])
+    span = max(np.ptp(ax.get_xlim3d()), np.ptp(ax.get_ylim3d()), np.ptp(ax.get_zlim3d()))
+    azimuth = np.deg2rad(ax.azim)
+    offset = centre + 0.5 * span * np.array([-np.sin(azimuth), np.cos(azimuth), 0.0])
+
+    # The position of the Axes in the figure is only final after the aspect is applied, which is otherwise only done
+    # when drawing
+    ax.apply_aspect()
+    projection = ax.get_proj()
+    screen = []
+    for point in (centre, offset):
+        x, y, _ = proj3d.proj_transform(point[0], point[1], point[2], projection)
+        screen.append(ax.transData.transform((x, y)))
+    pixels = np.linalg.norm(screen[1] - screen[0])
+    return pixels / (0.5 * span) * 72.0 / ax.figure.dpi
+
+
+@lru_cache(maxsize=_MESH_CACHE_SIZE)
+def __unit_sphere_mesh(resolution: int):
+    """
+    This internal function computes the grids of a sphere of unit radius centred at the origin. The result is cached,
+    so the grids are calculated only once for each resolution. See `mesh_cache_info`.
+    :param resolution: The number of points along the azimuth and along the inclination.
+    :return: The read-only x-axis, y-axis, and z-axis grids of the sphere.
+    """
+    u, v = np.mgrid[0:2 * np.pi:resolution * 1j, 0:np.pi:resolution * 1j]
+    sin_v = np.sin(v)
+    # sin(pi) is not exactly zero, and the polygons at the pole would get the shade of an arbitrary normal
+    sin_v[:, -1] = 0.0
+    x = np.cos(u) * sin_v
+    y = np.sin(u) * sin_v
+    z = np.cos(v)
 
-    ax.plot_surface(x - p.q[1], y - p.q[2], z - p.q[3], color=color, alpha=alpha)
+    for grid in (x, y, z):
+        grid.setflags(write=False)
+    return x, y, z
 
 
 def __plot_revolute_joint(x,
@@ -359,6 +1346,7 @@ def __plot_revolute_joint(x,
                           radius,
                           color,
                           alpha,
+                          resolution: int = 20,
                           ax=None):
     """
     This internal function is used to draw cylinders, for now, for DQ_SerialManipulators. The cylinder's height is through
@@ -368,14 +1356,17 @@ def __plot_revolute_joint(x,
     :param radius: the radius of the cylinder.
     :param color: the color of the cylinder.
     :param alpha: the transparency of the cylinder.
+    :param resolution: the number of points of the mesh along each direction.
     :param ax: Figure Axes or plt.gca() if None.
+    :return: The Poly3DCollection of the cylinder.
     """
-    __plot_cylinder(x,
-                    height_z=height_z,
-                    radius=radius,
-                    color=color,
-                    alpha=alpha,
-                    ax=ax)
+    return __plot_cylinder(x,
+                           height_z=height_z,
+                           radius=radius,
+                           color=color,
+                           alpha=alpha,
+                           resolution=resolution,
+                           ax=ax)
 
 
 def __dq_adjoint(x: DQ, t: DQ):
@@ -383,6 +1374,8 @@ def __dq_adjoint(x: DQ, t: DQ):
     This internal function currently does not seem to exist in the implementation of dqrobotics. It will be replaced
     when it's available.
     I'm basing this on (25) of https://faculty.sites.iastate.edu/jia/files/inline-files/dual-quaternion.pdf.
+    Its batched equivalent is `__dq_adjoint_points`, and this one is kept as the reference of the tests. The plots move
+    their surfaces with `__pose_grid`.
 
     :param x: A unit dual quaternion.
     :param t: A pure quaternion representing the point to be transformed.
@@ -398,10 +1391,27 @@ def __dq_adjoint(x: DQ, t: DQ):
     return D(conj(Adsharp(x, t_dq)))
 
 
+def __dq_adjoint_points(x: DQ, points: np.ndarray):
+    """
+    This internal function is the batched equivalent of `__dq_adjoint`. The rotation and translation are extracted
+    from `x` only once and then applied to all points with a single matrix operation.
+    Note that, as in `__dq_adjoint`, a point `p` is mapped to `t - r p r*`, where `r` and `t` are the rotation and
+    translation of `x`.
+    :param x: A unit dual quaternion.
+    :param points: An array of shape (N, 3) with the points to be transformed.
+    :return: An array of shape (N, 3) with the transformed points.
+    """
+    # `x` is not checked here, it is checked once by the plot function that receives it
+    rotation_matrix = _quaternion_to_rotation_matrix(rotation(x).q)
+    t = translation(x).q[1:4]
+
+    return t - points @ rotation_matrix.T
+
+
 def __dq_adjoint_grid(x: DQ, x_grid, y_grid, z_grid):
     """
-    This internal function runs `__dq_adjoint` through all elements of a grid so that calculations are simplified.
-    For instance, to move a cylinder or other surface around a plot.
+    This internal function applies `__dq_adjoint` to all elements of a grid so that calculations are simplified.
+    The grid is transformed at once by `__dq_adjoint_points`. Surfaces are moved with `__pose_grid` instead.
     :param x: A unit dual quaternion.
     :param x_grid: A suitable x-axis grid element.
     :param y_grid: A suitable y-axis grid element.
@@ -413,33 +1423,122 @@ def __dq_adjoint_grid(x: DQ, x_grid, y_grid, z_grid):
         raise RuntimeError("Shapes of arguments must be the same.")
 
     shape = x_grid.shape
-    rows, cols = shape
 
-    x_grid_ad = np.zeros(shape)
-    y_grid_ad = np.zeros(shape)
-    z_grid_ad = np.zeros(shape)
+    points = np.column_stack((np.ravel(x_grid), np.ravel(y_grid), np.ravel(z_grid)))
+    points_ad = __dq_adjoint_points(x, points)
+
+    return (points_ad[:, 0].reshape(shape),
+            points_ad[:, 1].reshape(shape),
+            points_ad[:, 2].reshape(shape))
+
+
+def __pose_grid(x: DQ, x_grid, y_grid, z_grid):
+    """
+    This internal function moves a grid given in the frame of the pose `x` to that pose, i.e., each point `p` is mapped
+    to `t + r p r*`, where `r` and `t` are the rotation and translation of `x`. This is the convention of the batched
+    plots, e.g. `__cylinders_polygons` and `_plot_planes`, whereas `__dq_adjoint_grid` maps `p` to `t - r p r*`. For the
+    symmetric surfaces drawn here both give the same surface, but only this one gives the same vertices.
+    :param x: A unit dual quaternion.
+    :param x_grid: A suitable x-axis grid element.
+    :param y_grid: A suitable y-axis grid element.
+    :param z_grid: A suitable z-axis grid element.
+    :return: The transformed grids by `x`.
+    """
+    # `x` is not checked here, it is checked once by the plot function that receives it
+    rotation_matrix = _quaternion_to_rotation_matrix(rotation(x).q)
+    points = np.stack((x_grid, y_grid, z_grid), axis=-1) @ rotation_matrix.T + translation(x).q[1:4]
+
+    return points[..., 0], points[..., 1], points[..., 2]
+
+
+def __cylinder_grid(x: DQ, height_z: float, radius: float, resolution: int = 20):
+    """
+    This internal function computes the grids of a cylinder at the pose `x`. The cylinder spans from -height_z/2 to
+    +height_z/2 along its z-axis.
+    :param x: a unit dual quaternion representing the pose of the centre of the cylinder.
+    :param height_z: the height of the cylinder.
+    :param radius: the radius of the cylinder.
+    :param resolution: the number of points of the mesh along each direction.
+    :return: The x-axis, y-axis, and z-axis grids of the cylinder.
+    """
+    x_unit, y_unit, z_unit = __unit_cylinder_mesh(resolution)
+
+    return __pose_grid(x, radius * x_unit, radius * y_unit, height_z * z_unit)
+
 
-    for i in range(0, rows):
-        for j in range(0, cols):
-            x_element = x_grid[i, j]
-            y_element = y_grid[i, j]
-            z_element = z_grid[i, j]
+@lru_cache(maxsize=_MESH_CACHE_SIZE)
+def __unit_cylinder_mesh(resolution: int):
+    """
+    This internal function computes the grids of a cylinder of unit radius and unit height, centred at the origin and
+    spanning from -1/2 to +1/2 along its z-axis. The result is cached, so the grids are calculated only once for each
+    resolution. See `mesh_cache_info`.
+    :param resolution: The number of points along the height and along the circumference.
+    :return: The read-only x-axis, y-axis, and z-axis grids of the cylinder.
+    """
+    # Cylindrical points start at zero
+    z = np.linspace(-0.5, 0.5, resolution)  # Draw half the cylinder
+    theta = np.linspace(0, 2 * np.pi, resolution)
+    theta_grid, z_grid = np.meshgrid(theta, z)
+    x_grid = np.cos(theta_grid)
+    y_grid = np.sin(theta_grid)
 
-            p = x_element*i_ + y_element*j_ + z_element*k_
-            p_prime = __dq_adjoint(x, p)
+    for grid in (x_grid, y_grid, z_grid):
+        grid.setflags(write=False)
+    return x_grid, y_grid, z_grid
 
-            x_grid_ad[i, j] = p_prime.q[1]
-            y_grid_ad[i, j] = p_prime.q[2]
-            z_grid_ad[i, j] = p_prime.q[3]
 
-    return x_grid_ad, y_grid_ad, z_grid_ad
+def _resolve_resolution(resolution, option: str, size: float, ax) -> int:
+    """
+    This internal function chooses the mesh resolution of an object. When `resolution` is "auto", the resolution is
+    proportional to the size of the object relative to the largest span of the axes limits, so that small objects in
+    crowded scenes use few polygons and large objects remain smooth.
+    :param resolution: A number of points, "auto", or None to use the global option.
+    :param option: The name of the global option, e.g. "sphere_resolution".
+    :param size: The largest dimension of the object.
+    :param ax: The Axes in which the object will be drawn.
+    :return: The number of points of the mesh along each direction.
+    :raises RuntimeError: If the resolution is not valid.
+    """
+    if resolution is None:
+        resolution = _options[option]
+    _check_resolution(resolution)
+    if resolution != "auto":
+        return int(resolution)
+
+    span = max(np.ptp(ax.get_xlim3d()), np.ptp(ax.get_ylim3d()), np.ptp(ax.get_zlim3d()))
+    return int(np.clip(np.ceil(_AUTO_RESOLUTION_MAX * size / span), _AUTO_RESOLUTION_MIN, _AUTO_RESOLUTION_MAX))
 
 
+def mesh_cache_info() -> dict:
+    """
+    Statistics of the cache of unit meshes used to draw spheres and cylinders, e.g., to confirm that the meshes are
+    reused in long animations.
+
+        info = dqp.mesh_cache_info()
+        print(info["cylinder"].hits, info["cylinder"].misses)
+
+    :return: A dict with the `functools` cache info, i.e., hits, misses, maxsize, and currsize, of the "sphere" and
+        "cylinder" meshes.
+    """
+    return {"sphere": __unit_sphere_mesh.cache_info(),
+            "cylinder": __unit_cylinder_mesh.cache_info()}
+
+
+def mesh_cache_clear():
+    """
+    Remove all unit meshes from the cache and reset its statistics.
+    """
+    __unit_sphere_mesh.cache_clear()
+    __unit_cylinder_mesh.cache_clear()
+
+
+@_profiled("cylinder")
 def __plot_cylinder(x,
                     height_z: float,
                     radius: float,
                     color: str,
                     alpha: float,
+                    resolution: int = 20,
                     ax=None):
     """
     Internal method to draw a cylinder. x is a unit dual quaternion that defines the centre of the cylinder. The cylinder
@@ -449,27 +1548,133 @@ def __plot_cylinder(x,
     :param radius: the radius of the cylinder.
     :param color: the color of the cylinder.
     :param alpha: the transparency of the cylinder.
+    :param resolution: the number of points of the mesh along each direction.
     :param ax: Figure Axes or plt.gca() if None.
-    :raises RuntimeError: If argument `x` is not a unit dual quaternion.
+    :return: The Poly3DCollection of the cylinder.
     """
-    if not is_unit(x):
-        raise RuntimeError("The argument x must be a unit dual quaternion.")
+    # `x` is not checked here, it is checked once by the plot function that receives it
     # https://stackoverflow.com/questions/26989131/add-cylinder-to-plot
     # I modified the code above to use dual quaternion algebra.
     if ax is None:
         ax = plt.gca()
 
-    # Cylindrical points start at zero
-    z = np.linspace(-height_z / 2.0, height_z / 2.0, 20)  # Draw half the cylinder
-    theta = np.linspace(0, 2 * np.pi, 20)
-    theta_grid, z_grid = np.meshgrid(theta, z)
-    x_grid = radius * np.cos(theta_grid)
-    y_grid = radius * np.sin(theta_grid)
+    with _stage("mesh"):
+        x_grid_ad, y_grid_ad, z_grid_ad = __cylinder_grid(x, height_z=height_z, radius=radius, resolution=resolution)
 
-    x_grid_ad, y_grid_ad, z_grid_ad = __dq_adjoint_grid(x, x_grid, y_grid, z_grid)
+    with _stage("artists"):
+        return ax.plot_surface(x_grid_ad,
+                               y_grid_ad,
+                               z_grid_ad,
+                               color=color,
+                               alpha=alpha)
 
-    ax.plot_surface(x_grid_ad,
-                    y_grid_ad,
-                    z_grid_ad,
-                    color=color,
-                    alpha=alpha)
\ No newline at end of file
+
+@_profiled("cylinder_update")
+def __update_cylinder(cylinder,
+                      x: DQ,
+                      height_z: float,
+                      radius: float,
+                      color,
+                      resolution: int = 20):
+    """
+    This internal function moves a cylinder drawn by `__plot_cylinder` to the pose `x` without creating a new artist.
+    :param cylinder: The Poly3DCollection returned by `__plot_cylinder`.
+    :param x: a unit dual quaternion representing the pose of the centre of the cylinder.
+    :param height_z: the height of the cylinder.
+    :param radius: the radius of the cylinder.
+    :param color: the color of the cylinder, needed to update its shading.
+    :param resolution: the number of points of the mesh along each direction. Must be the same used in
+        `__plot_cylinder`.
+    """
+    with _stage("mesh"):
+        polygons = __surface_polygons(*__cylinder_grid(x, height_z=height_z, radius=radius, resolution=resolution))
+
+    with _stage("artists"):
+        cylinder.set_verts(polygons)
+        cylinder.set_facecolor(_shade_colors(color, polygons))
+
+
+def __check_batch(xs: np.ndarray, is_valid, kind: str):
+    """
+    This internal function checks many DQs at once with a vectorized predicate of `_dq_array`.
+    :param xs: An array of shape (N, 8) with the DQs.
+    :param is_valid: The predicate, e.g. `_is_unit`.
+    :param kind: The description of a valid DQ used in the error message, e.g. "unit dual quaternion".
+    :raises RuntimeError: If any element of `xs` is not valid.
+    """
+    not_valid = np.flatnonzero(~is_valid(xs))
+    if len(not_valid) > 0:
+        raise RuntimeError(f"The input xs[{not_valid[0]}] = {DQ(xs[not_valid[0]])} is not a {kind}.")
+
+
+def __quiver_segments(origins, directions, length: float, arrow_length_ratio: float = 0.3):
+    """
+    This internal function computes the segments that `Axes3D.quiver` draws with `normalize=True`, so that existing
+    arrows can be moved with `set_segments`.
+    :param origins: An array of shape (N, 3) or (3,) with the tails of the arrows.
+    :param directions: An array of shape (N, 3) or (3,) with the directions of the arrows.
+    :param length: The length of the arrows.
+    :param arrow_length_ratio: The ratio of the arrow head with respect to the arrow, as in `Axes3D.quiver`.
+    :return: An array of shape (3N, 2, 3) with the shafts followed by both sides of the heads.
+    """
+    origins = np.atleast_2d(origins)
+    directions = np.atleast_2d(directions)
+    directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+    tips = origins + length * directions
+    shafts = np.stack((tips, origins), axis=1)
+
+    # Each side of the head is the direction rotated by +-15 degrees about an axis perpendicular to it
+    norm = np.linalg.norm(directions[:, :2], axis=1)
+    axes = np.zeros(directions.shape)
+    axes[:, 0] = np.divide(directions[:, 1], norm, where=norm != 0, out=np.zeros(norm.shape))
+    axes[:, 1] = np.divide(-directions[:, 0], norm, where=norm != 0, out=np.ones(norm.shape))
+    c = cos(radians(15))
+    s = sin(radians(15))
+    axes_cross_directions = np.cross(axes, directions)
+    axes_dot_directions = np.sum(axes * directions, axis=1, keepdims=True)
+
+    heads = []
+    for sign in (1.0, -1.0):
+        head_directions = (c * directions
+                           + sign * s * axes_cross_directions
+                           + (1 - c) * axes_dot_directions * axes)
+        heads.append(np.stack((tips, tips - arrow_length_ratio * length * head_directions), axis=1))
+
+    return np.concatenate([shafts] + heads)
+
+
+def __surface_polygons(x_grid, y_grid, z_grid):
+    """
+    This internal function computes the quadrilaterals that `Axes3D.plot_surface` draws for grids that are not
+    downsampled, so that existing surfaces can be moved with `set_verts`.
+    :param x_grid: A suitable x-axis grid element.
+    :param y_grid: A suitable y-axis grid element.
+    :param z_grid: A suitable z-axis grid element.
+    :return: An array of shape (M, 4, 3) with one quadrilateral per grid cell.
+    """
+    grid = np.stack((x_grid, y_grid, z_grid), axis=-1)
+    return np.stack((grid[:-1, :-1],
+                     grid[:-1, 1:],
+                     grid[1:, 1:],
+                     grid[1:, :-1]), axis=-2).reshape(-1, 4, 3)
+
+
+def _shade_colors(color, polygons: np.ndarray):
+    """
+    This internal function shades `color` for each polygon in the same way as `Axes3D.plot_surface`, so that moved
+    surfaces keep a consistent look.
+    :param color: The color of the surface or a sequence with the color of each polygon.
+    :param polygons: An array of shape (M, 4, 3) with the polygons of the surface.
+    :return: An array of shape (M, 4) with the RGBA color of each polygon.
+    """
+    normals = np.cross(polygons[:, 0] - polygons[:, 1], polygons[:, 1] - polygons[:, 2])
+    light_direction = mcolors.LightSource(azdeg=225, altdeg=19.4712).direction
+    with np.errstate(invalid="ignore"):
+        shade = (normals / np.linalg.norm(normals, axis=1, keepdims=True)) @ light_direction
+    shade[np.isnan(shade)] = 0
+
+    colors = np.array(np.broadcast_to(mcolors.to_rgba_array(color), (len(polygons), 4)))
+    # Map the shade from [-1, 1] to the fraction [0.3, 1] of the color
+    colors[:, :3] *= (0.3 + 0.7 * (shade[:, np.newaxis] + 1) / 2)
+    return colors
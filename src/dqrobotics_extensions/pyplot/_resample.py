@@ -0,0 +1,131 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import numpy as np
+
+# Timestamps closer than this, in seconds, are considered equal, e.g. to absorb the rounding of `np.arange`.
+_TIME_TOLERANCE = 1e-9
+
+
+def frame_times(times, fps: float) -> np.ndarray:
+    """
+    The times of the frames of a video with `fps` frames per second that plays the samples at `times` in real time.
+    The first frame is at the first sample and the last frame is at the last sample.
+    :param times: An array-like of shape (N,) with the non-decreasing timestamps of the samples, e.g. `stored_time`.
+    :param fps: The frames per second of the video.
+    :return: An array with the time of each frame.
+    :raises RuntimeError: If there are no samples, the timestamps decrease, or `fps` is not positive.
+    """
+    times = np.asarray(times, dtype=float).reshape(-1)
+    if len(times) == 0:
+        raise RuntimeError("At least one sample is needed.")
+    if np.any(np.diff(times) < 0):
+        raise RuntimeError("The timestamps of the samples must be non-decreasing.")
+    if fps <= 0:
+        raise RuntimeError(f"The fps must be positive, not {fps}.")
+
+    n_frames = int(np.ceil((times[-1] - times[0]) * fps - _TIME_TOLERANCE)) + 1
+    return np.minimum(times[0] + np.arange(n_frames) / fps, times[-1])
+
+
+def frame_indices(times, fps: float) -> np.ndarray:
+    """
+    Decimate samples to the frames of a video with `fps` frames per second, so that only the samples shown are
+    rendered and the video plays in real time. Each frame shows the latest sample at its time, see `frame_times`. For
+    instance, 101 samples 10 ms apart become 31 frames at 30 fps.
+
+        anim = FuncAnimation(fig,
+                             partial(animate_robot, robot=robot, stored_q=stored_q, stored_time=stored_time),
+                             frames=dqp.frame_indices(stored_time, fps=30),
+                             interval=1000 / 30)
+
+    `save_animation` does the same when given `times`.
+
+    :param times: An array-like of shape (N,) with the non-decreasing timestamps of the samples, e.g. `stored_time`.
+    :param fps: The frames per second of the video.
+    :return: An integer array with the index of the sample of each frame.
+    :raises RuntimeError: If there are no samples, the timestamps decrease, or `fps` is not positive.
+    """
+    times = np.asarray(times, dtype=float).reshape(-1)
+    return np.searchsorted(times, frame_times(times, fps) + _TIME_TOLERANCE, side="right") - 1
+
+
+def resample(times, values, fps: float, interpolate: bool = True):
+    """
+    Resample a trajectory at the frames of a video with `fps` frames per second, see `frame_times`. This is useful when
+    the samples are not evenly spaced, or are sparser than the frames, so that the motion is smooth in the video.
+
+        frame_time, frame_q = dqp.resample(stored_time, stored_q, fps=30)
+        frame_time, frame_x = dqp.resample(stored_time, stored_x, fps=30)
+
+    :param times: An array-like of shape (N,) with the non-decreasing timestamps of the samples.
+    :param values: An array-like of shape (N, ...), e.g. the joint configurations, or a sequence of N unit DQs.
+    :param fps: The frames per second of the video.
+    :param interpolate: If True, arrays are interpolated linearly and unit DQs as poses, see `_interpolate_pose`, so
+        lines and planes should not be interpolated. If False, each frame has the latest sample at its time, as in
+        `frame_indices`.
+    :return: A tuple with the times of the frames and the values at those times, either as an array or as a list of DQs.
+    :raises RuntimeError: If `values` does not have one value per timestamp, or see `frame_times`.
+    """
+    times = np.asarray(times, dtype=float).reshape(-1)
+    if len(values) != len(times):
+        raise RuntimeError(f"There must be one value per timestamp, not {len(values)} values for {len(times)}.")
+    frames = frame_times(times, fps)
+    indices = np.searchsorted(times, frames + _TIME_TOLERANCE, side="right") - 1
+
+    is_dq = len(values) > 0 and isinstance(values[0], DQ)
+    if not interpolate:
+        if is_dq:
+            return frames, [values[i] for i in indices]
+        return frames, np.asarray(values)[indices]
+
+    # The fraction of the way from the sample at `indices` to the next one
+    following = np.minimum(indices + 1, len(times) - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = (frames - times[indices]) / (times[following] - times[indices])
+    fractions = np.where(following > indices, np.clip(np.nan_to_num(fractions), 0.0, 1.0), 0.0)
+
+    if is_dq:
+        return frames, [_interpolate_pose(values[i], values[j], s) for i, j, s in zip(indices, following, fractions)]
+
+    values = np.asarray(values, dtype=float)
+    fractions = fractions.reshape((-1,) + (1,) * (values.ndim - 1))
+    return frames, (1.0 - fractions) * values[indices] + fractions * values[following]
+
+
+def _interpolate_pose(x0: DQ, x1: DQ, s: float) -> DQ:
+    """
+    Interpolate between two poses with the `log` and `exp` of dqrobotics, i.e. `x0 * exp(s * log(conj(x0) * x1))`.
+    The rotation is interpolated with slerp and the translation linearly.
+    :param x0: The pose at s=0.
+    :param x1: The pose at s=1.
+    :param s: The fraction of the way from `x0` to `x1`.
+    :return: The interpolated pose.
+    """
+    if s == 0.0:
+        return x0
+    if s == 1.0:
+        return x1
+    relative = conj(x0) * x1
+    # x and -x are the same pose, so the shortest of the two paths is taken
+    if relative.q[0] < 0:
+        relative = -1.0 * relative
+    return x0 * exp(s * log(relative))
@@ -0,0 +1,306 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import DQ
+from dqrobotics.robot_modeling import DQ_SerialManipulator
+
+from dqrobotics_extensions.pyplot._pyplot import (_plot_dq, _plot_serial_manipulator, _update_poses, _update_line,
+                                                  _update_plane, _update_sphere, _resolve_resolution)
+
+from matplotlib import pyplot as plt
+
+import numpy as np
+
+
+class _SceneObject:
+    """
+    An object registered in a `Scene`: what it is, the value it is drawn at, and its artists.
+    """
+    __slots__ = ("kind", "value", "artists", "options")
+
+    def __init__(self, kind: str, value: np.ndarray, artists, options: dict):
+        """
+        :param kind: One of "pose", "line", "plane", "sphere", or "serial_manipulator".
+        :param value: The vec8 of the DQ or the joint configurations drawn.
+        :param artists: The artists as returned by the plot function, or the `SerialManipulatorHandle`.
+        :param options: The keyword arguments needed to update the artists.
+        """
+        self.kind = kind
+        self.value = value
+        self.artists = artists
+        self.options = options
+
+
+class Scene:
+    """
+    Draws DQ primitives and manipulators once and then moves them by name. Only the objects whose value changed since
+    the last `flush` are updated, and their artists are changed in place instead of being drawn again. Objects that
+    did not change are not touched, so an animation frame costs only what actually moved.
+
+        scene = dqp.Scene(ax)
+        scene.add("target", x_target)
+        scene.add("wall", pi_wall, plane=True, scale=2.0)
+        scene.add("robot", robot, q=q)
+
+        def animate(n):
+            scene.update("robot", qs[n])
+            scene.update("target", xs[n])
+            return scene.flush()
+    """
+    def __init__(self, ax=None):
+        """
+        :param ax: Figure Axes or plt.gca() if None.
+        """
+        if ax is None:
+            ax = plt.gca()
+        self.ax = ax
+        self._objects = {}
+        self._dirty = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def names(self) -> list:
+        """
+        The names of the objects, in the order they were added.
+        """
+        return list(self._objects)
+
+    @property
+    def artists(self) -> list:
+        """
+        All artists of the scene, e.g., to be returned by the `init_func` of a `FuncAnimation` when `blit=True`.
+        """
+        return [artist for name in self._objects for artist in self._artists(name)]
+
+    def add(self, name: str, obj, **kwargs):
+        """
+        Draw an object and register it under `name`. The keyword arguments are the same as those of `plot`:
+
+            scene.add("x", x)                                  # A pose
+            scene.add("l", l_dq, line=True, color="r-")        # A line
+            scene.add("pi", pi_dq, plane=True, scale=1.0)      # A plane
+            scene.add("p", p, sphere=True, radius=0.1)         # A sphere
+            scene.add("robot", robot, q=q)                     # A DQ_SerialManipulator
+
+        :param name: The name of the object, used by `update`.
+        :param obj: A `DQ` or a `DQ_SerialManipulator`.
+        :param kwargs: The options of the plot, see `plot`.
+        :return: The artists drawn, or the `SerialManipulatorHandle` of a `DQ_SerialManipulator`.
+        :raises RuntimeError: If `name` is already in the scene or `obj` cannot be plotted.
+        """
+        if name in self._objects:
+            raise RuntimeError(f"The scene already has an object named {name}.")
+
+        if isinstance(obj, DQ_SerialManipulator):
+            if "q" not in kwargs:
+                raise RuntimeError(f"The joint configurations q of {name} are needed to plot a DQ_SerialManipulator.")
+            value = np.array(kwargs["q"], dtype=float)
+            handle = _plot_serial_manipulator(obj, ax=self.ax, **kwargs)
+            self._objects[name] = _SceneObject("serial_manipulator",
+                                               value,
+                                               handle,
+                                               {"validation": kwargs.get("validation")})
+            return handle
+        elif isinstance(obj, DQ):
+            options = {"scale": 0.1, "color": "r", "alpha": 0.8, **kwargs}
+            if kwargs.get("line") is not None:
+                kind = "line"
+            elif kwargs.get("plane") is not None:
+                kind = "plane"
+            elif kwargs.get("sphere") is not None:
+                kind = "sphere"
+                # The updates must use the same mesh, so "auto" or the global option is resolved once here
+                options["resolution"] = _resolve_resolution(options.get("resolution"),
+                                                            option="sphere_resolution",
+                                                            size=2.0 * options["radius"],
+                                                            ax=self.ax)
+            else:
+                kind = "pose"
+            artists = _plot_dq(obj, ax=self.ax, **options)
+            self._objects[name] = _SceneObject(kind, np.array(obj.vec8()), artists, options)
+            return artists
+        else:
+            raise RuntimeError(f"Scene.add not implemented yet for {obj}")
+
+    def update(self, name: str, value) -> bool:
+        """
+        Set the new value of an object. The artists are only changed by the next `flush`, and only if the value is
+        different from the one drawn. Updating an object many times between flushes costs a single redraw.
+        :param name: The name of the object.
+        :param value: The new `DQ` of a primitive, or its 8 coefficients as in `DQ.vec8()`, or the new joint
+            configurations of a `DQ_SerialManipulator`.
+        :return: True if the object is now marked to be redrawn, False if `value` is the one already drawn.
+        :raises RuntimeError: If the scene has no object named `name` or `value` does not have the size of the value
+            drawn.
+        """
+        scene_object = self.__get(name)
+        if isinstance(value, DQ):
+            value = np.array(value.vec8())
+        else:
+            value = np.array(value, dtype=float).reshape(-1)
+        if value.shape != scene_object.value.shape:
+            raise RuntimeError(f"The value of {name} must have {scene_object.value.size} elements, not {value.size}.")
+
+        if np.array_equal(value, scene_object.value):
+            # Back to the value drawn, so nothing needs to be done
+            self._dirty.pop(name, None)
+            return False
+        self._dirty[name] = value
+        return True
+
+    def kind(self, name: str) -> str:
+        """
+        The kind of an object, i.e., what its values are.
+        :param name: The name of the object.
+        :return: One of "pose", "line", "plane", "sphere", or "serial_manipulator".
+        :raises RuntimeError: If the scene has no object named `name`.
+        """
+        return self.__get(name).kind
+
+    @property
+    def dirty(self) -> list:
+        """
+        The names of the objects that will be redrawn by the next `flush`.
+        """
+        return list(self._dirty)
+
+    def flush(self) -> list:
+        """
+        Move the artists of all objects whose value changed since the last flush. Poses are updated at once.
+
+        Each object is updated on its own, so an invalid value, e.g., a DQ that is not a unit DQ, does not stop the other
+        objects from being moved. Such an object keeps the value it was drawn at, and its new value is discarded.
+        :return: The artists that were changed, e.g., to be returned by a `FuncAnimation` function when `blit=True`.
+        :raises RuntimeError: After all other objects are moved, if the new value of any object could not be drawn.
+        """
+        changed = []
+        failed = {}
+        poses = []
+        for name, value in list(self._dirty.items()):
+            scene_object = self._objects[name]
+            if scene_object.kind == "pose":
+                poses.append(name)
+                continue
+            try:
+                self.__update_artists(scene_object, value)
+            except RuntimeError as error:
+                failed[name] = error
+            else:
+                scene_object.value = value
+                changed.extend(self._artists(name))
+            del self._dirty[name]
+
+        # Poses of the same length are moved together, see `_update_poses`
+        by_options = {}
+        for name in poses:
+            options = self._objects[name].options
+            by_options.setdefault((options["scale"], options.get("validation")), []).append(name)
+        for (scale, validation), names in by_options.items():
+            try:
+                _update_poses([self._objects[name].artists for name in names],
+                              [DQ(self._dirty[name]) for name in names],
+                              length=scale,
+                              validation=validation)
+            except RuntimeError:
+                # `_update_poses` checks all poses before moving any, so the valid ones are now moved one by one
+                for name in names:
+                    try:
+                        _update_poses([self._objects[name].artists],
+                                      [DQ(self._dirty[name])],
+                                      length=scale,
+                                      validation=validation)
+                    except RuntimeError as error:
+                        failed[name] = error
+                        del self._dirty[name]
+            for name in names:
+                if name in self._dirty:
+                    self._objects[name].value = self._dirty.pop(name)
+                    changed.extend(self._artists(name))
+
+        if failed:
+            name, error = next(iter(failed.items()))
+            raise RuntimeError(f"The scene could not draw the new values of {list(failed)}. {name}: {error}") from error
+        return changed
+
+    def __update_artists(self, scene_object: _SceneObject, value: np.ndarray):
+        """
+        Move the artists of an object other than a pose to a new value, see `flush`.
+        :param scene_object: The object.
+        :param value: The new value.
+        :raises RuntimeError: If `value` is not valid for the object, in which case the artists are not changed.
+        """
+        options = scene_object.options
+        validation = options.get("validation")
+        if scene_object.kind == "serial_manipulator":
+            scene_object.artists.update(value, validation=validation)
+        elif scene_object.kind == "line":
+            _update_line(scene_object.artists, DQ(value), length=options["scale"], validation=validation)
+        elif scene_object.kind == "plane":
+            _update_plane(scene_object.artists,
+                          DQ(value),
+                          length_x=options["scale"],
+                          length_y=options["scale"],
+                          color=options["color"],
+                          validation=validation)
+        else:
+            _update_sphere(scene_object.artists,
+                           DQ(value),
+                           radius=options["radius"],
+                           color=options["color"],
+                           resolution=options["resolution"],
+                           validation=validation)
+
+    def remove(self, name: str):
+        """
+        Remove an object and its artists from the scene.
+        :param name: The name of the object.
+        :raises RuntimeError: If the scene has no object named `name`.
+        """
+        self.__get(name)
+        for artist in self._artists(name):
+            artist.remove()
+        del self._objects[name]
+        self._dirty.pop(name, None)
+
+    def _artists(self, name: str) -> list:
+        """
+        The artists of an object as a list.
+        :param name: The name of the object.
+        """
+        artists = self._objects[name].artists
+        if self._objects[name].kind == "serial_manipulator":
+            return artists.artists
+        elif self._objects[name].kind == "pose":
+            return list(artists)
+        return [artists]
+
+    def __get(self, name: str) -> _SceneObject:
+        """
+        :param name: The name of the object.
+        :return: The object registered under `name`.
+        :raises RuntimeError: If the scene has no object named `name`.
+        """
+        if name not in self._objects:
+            raise RuntimeError(f"The scene has no object named {name}.")
+        return self._objects[name]
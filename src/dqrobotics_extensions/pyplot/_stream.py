@@ -0,0 +1,340 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import os
+import selectors
+import socket
+import stat
+import struct
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+# Each message is a fixed-size header followed by `count` float64 values. The header is the robot id (uint32), the
+# kind of the values (uint8), the number of values (uint8), padding, and the timestamp (float64), so that the values
+# are aligned to 8 bytes.
+_HEADER = struct.Struct("<IBBxxd")
+# The kinds of values, i.e. joint configurations or the 8 coefficients of a DQ as in `DQ.vec8()`.
+_KIND_Q = 0
+_KIND_DQ = 1
+# The size of each read from a client.
+_RECEIVE_SIZE = 65536
+
+_StreamServerStats = namedtuple("StreamServerStats", ["clients", "received", "applied", "dropped", "invalid"])
+
+
+def encode_message(robot_id: int, value, time: float = 0.0) -> bytes:
+    """
+    Encode a message of the stream protocol of `StreamServer`.
+    :param robot_id: The id of the robot, from 0 to 2**32 - 1.
+    :param value: The joint configurations as an array-like, or a DQ, whose `vec8()` is sent.
+    :param time: The timestamp of the message.
+    :return: The message.
+    :raises RuntimeError: If there are more than 255 joint configurations.
+    """
+    if hasattr(value, "vec8"):
+        kind, values = _KIND_DQ, np.asarray(value.vec8(), dtype="<f8")
+    else:
+        kind, values = _KIND_Q, np.asarray(value, dtype="<f8").reshape(-1)
+    if len(values) > 255:
+        raise RuntimeError(f"A message holds at most 255 values, not {len(values)}.")
+    return _HEADER.pack(robot_id, kind, len(values), time) + values.tobytes()
+
+
+class StreamClient:
+    """
+    Send joint configurations or poses to a `StreamServer`, e.g. from a control loop in another process. This module
+    does not import `dqrobotics` or `matplotlib`, so clients stay light.
+
+        with dqp.StreamClient("/tmp/dqp.sock") as client:
+            for time in np.arange(0, time_final + tau, tau):
+                q = q + u * tau
+                client.send(0, q, time)
+    """
+    def __init__(self, address):
+        """
+        Connect to a server.
+        :param address: The path of a UNIX socket or a tuple (host, port) of a TCP socket.
+        """
+        self._socket = _new_socket(address)
+        self._socket.connect(address)
+        if self._socket.family != _unix_family():
+            # Messages are small, so they must be sent at once instead of waiting for more data
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def send(self, robot_id: int, value, time: float = 0.0):
+        """
+        Send a message, see `encode_message`.
+        :param robot_id: The id of the robot.
+        :param value: The joint configurations as an array-like, or a DQ.
+        :param time: The timestamp of the message.
+        """
+        self._socket.sendall(encode_message(robot_id, value, time))
+
+    def close(self):
+        """
+        Close the connection.
+        """
+        self._socket.close()
+
+
+class StreamServer:
+    """
+    Receive joint configurations and poses from other processes on the same machine and move the objects of a `Scene`.
+    A background thread accepts any number of clients and decodes their messages with `np.frombuffer`, without copying
+    the values. Only the latest message of each robot id is kept, so messages that arrive faster than the plot is drawn
+    are dropped instead of queued. The plotting thread calls `apply`, e.g. from a timer, to update the scene.
+
+        scene = dqp.Scene(ax)
+        scene.add(0, robot_a, q=q_a)
+        scene.add(1, robot_b, q=q_b)
+        scene.add(2, x_target)
+
+        server = dqp.StreamServer(scene, "/tmp/dqp.sock")
+        server.start()
+        anim = FuncAnimation(fig, lambda n: server.apply(), interval=33, cache_frame_data=False)
+        plt.show()
+        server.stop()
+
+    The robot id of each message is the name of the object in the scene, unless `names` maps it to another name. See
+    `encode_message` for the format of the messages.
+    """
+    def __init__(self, scene, address, names: dict = None):
+        """
+        Create the server and start listening. Messages are only received after `start`.
+        :param scene: The `Scene` whose objects are moved.
+        :param address: The path of a UNIX socket or a tuple (host, port) of a TCP socket. With port 0, a free port is
+            chosen, see `address`.
+        :param names: A dict from robot ids to the names of the objects in the scene, or None to use the ids as names.
+        """
+        self.scene = scene
+        self.names = {} if names is None else names
+
+        self._socket = _new_socket(address)
+        if isinstance(address, (str, bytes, os.PathLike)):
+            # A socket left by a previous server that was not stopped would otherwise make bind fail
+            if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                os.unlink(address)
+        else:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(address)
+        self._socket.listen()
+        self._socket.setblocking(False)
+        self.address = self._socket.getsockname()
+
+        # The latest message of each robot id as the tuple (sequence number, time, kind, values)
+        self._latest = {}
+        self._applied_sequence = {}
+        # The time of the latest message applied for each robot id, e.g. to be shown in the title
+        self.times = {}
+        # Each counter is only changed by one thread, either the receiving thread or the one calling `apply`
+        self._clients = 0
+        self._received = 0
+        self._undecodable = 0
+        self._applied = 0
+        self._dropped = 0
+        self._rejected = 0
+
+        self._thread = None
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Start receiving messages in a background thread.
+        :raises RuntimeError: If the server was already started.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The StreamServer was already started.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="StreamServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop receiving messages, close all connections, and remove the UNIX socket, if any.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._socket.fileno() != -1:
+            self._socket.close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def apply(self) -> list:
+        """
+        Update the scene with the latest message of each robot id received since the last call and flush it. This must
+        be called from the thread that draws the figure.
+        :return: The artists that were changed, see `Scene.flush`.
+        """
+        # Copying the dict is atomic, so the receiving thread can keep replacing its values
+        for robot_id, (sequence, time, kind, values) in dict(self._latest).items():
+            applied_sequence = self._applied_sequence.get(robot_id, 0)
+            if sequence == applied_sequence:
+                continue
+            self._applied_sequence[robot_id] = sequence
+            self._dropped += sequence - applied_sequence - 1
+
+            name = self.names.get(robot_id, robot_id)
+            # Checked before the scene is updated, because a value that cannot be drawn would make `flush` raise
+            if name not in self.scene or not _is_valid(self.scene.kind(name), kind, values):
+                self._rejected += 1
+                continue
+            try:
+                self.scene.update(name, values)
+            except RuntimeError:
+                # Of the wrong size, which must not stop the other robots from being drawn
+                self._rejected += 1
+                continue
+            self._applied += 1
+            self.times[robot_id] = time
+        return self.scene.flush()
+
+    @property
+    def stats(self):
+        """
+        The metrics of the server as a named tuple:
+
+        - clients: the number of clients connected.
+        - received: the number of messages received.
+        - applied: the number of messages applied to the scene.
+        - dropped: the number of messages replaced by a newer one of the same robot id before being applied.
+        - invalid: the number of messages that could not be decoded, or whose robot id is not in the scene, or whose
+          values are not of the kind or size of the object in the scene, e.g., a DQ sent to a manipulator or a pose
+          that is not a unit DQ.
+        """
+        return _StreamServerStats(self._clients,
+                                  self._received,
+                                  self._applied,
+                                  self._dropped,
+                                  self._undecodable + self._rejected)
+
+    def __run(self):
+        """
+        The loop of the background thread, see `start`.
+        """
+        selector = selectors.DefaultSelector()
+        selector.register(self._socket, selectors.EVENT_READ)
+        # The bytes of an incomplete message at the end of the last read of each client
+        pending = {}
+        try:
+            while not self._stop.is_set():
+                for key, _ in selector.select(timeout=0.05):
+                    if key.fileobj is self._socket:
+                        client, _ = self._socket.accept()
+                        client.setblocking(False)
+                        selector.register(client, selectors.EVENT_READ)
+                        pending[client] = b""
+                        self._clients += 1
+                        continue
+
+                    client = key.fileobj
+                    try:
+                        data = client.recv(_RECEIVE_SIZE)
+                    except (BlockingIOError, InterruptedError):
+                        continue
+                    except OSError:
+                        data = b""
+                    if not data:
+                        selector.unregister(client)
+                        client.close()
+                        del pending[client]
+                        self._clients -= 1
+                        continue
+                    pending[client] = self.__decode(pending[client] + data if pending[client] else data)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fileobj is not self._socket:
+                    key.fileobj.close()
+            selector.close()
+            self._clients = 0
+
+    def __decode(self, data: bytes) -> bytes:
+        """
+        Decode all complete messages in `data` and keep the latest of each robot id. The values are read-only views of
+        `data`, which is immutable, so they are kept without copying.
+        :param data: The bytes received.
+        :return: The bytes of an incomplete message at the end of `data`.
+        """
+        offset = 0
+        while len(data) - offset >= _HEADER.size:
+            robot_id, kind, count, time = _HEADER.unpack_from(data, offset)
+            end = offset + _HEADER.size + 8 * count
+            if end > len(data):
+                break
+            if kind == _KIND_Q or (kind == _KIND_DQ and count == 8):
+                values = np.frombuffer(data, dtype="<f8", count=count, offset=offset + _HEADER.size)
+                previous = self._latest.get(robot_id)
+                self._latest[robot_id] = (1 if previous is None else previous[0] + 1, time, kind, values)
+            else:
+                self._undecodable += 1
+            self._received += 1
+            offset = end
+        return data[offset:]
+
+
+def _is_valid(scene_kind: str, kind: int, values: np.ndarray) -> bool:
+    """
+    Whether the values of a message can be drawn by an object of a `Scene`.
+    :param scene_kind: The kind of the object, see `Scene.kind`.
+    :param kind: The kind of the values of the message.
+    :param values: The values of the message.
+    :return: True if a manipulator receives joint configurations or if a primitive receives a DQ of its kind.
+    """
+    if scene_kind == "serial_manipulator":
+        return kind == _KIND_Q
+    if kind != _KIND_DQ:
+        return False
+    # Only imported by the server, so that clients do not need dqrobotics
+    from dqrobotics_extensions.pyplot._dq_array import _is_unit, _is_line, _is_plane, _is_pure_quaternion
+    is_valid = {"pose": _is_unit, "line": _is_line, "plane": _is_plane, "sphere": _is_pure_quaternion}[scene_kind]
+    return bool(is_valid(values))
+
+
+def _unix_family():
+    """
+    :return: The address family of UNIX sockets, or None where they are not available.
+    """
+    return getattr(socket, "AF_UNIX", None)
+
+
+def _new_socket(address) -> socket.socket:
+    """
+    Create a stream socket for an address.
+    :param address: The path of a UNIX socket or a tuple (host, port) of a TCP socket.
+    :return: The socket.
+    """
+    if isinstance(address, (str, bytes, os.PathLike)):
+        return socket.socket(_unix_family(), socket.SOCK_STREAM)
+    return socket.socket(socket.AF_INET6 if ":" in address[0] else socket.AF_INET, socket.SOCK_STREAM)
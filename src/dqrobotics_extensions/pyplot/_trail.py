@@ -0,0 +1,252 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+from dqrobotics_extensions.pyplot._profiling import _stage
+
+from matplotlib import pyplot as plt
+
+import numpy as np
+
+# The initial capacity, in points, of the vertex buffer of a trail. It doubles whenever it is full.
+_INITIAL_CAPACITY = 256
+# The number of new points simplified at once when a trail has a tolerance.
+_SIMPLIFICATION_CHUNK = 128
+
+
+class Trail:
+    """
+    The path of a moving point, e.g. the end effector of a manipulator or the translation of a pose, drawn as a single
+    line. The points are appended to a vertex buffer that grows geometrically, so each new point costs the same
+    regardless of how long the trail is, instead of drawing all past poses in every frame.
+
+        trail = dqp.Trail(ax, color="m", tolerance=1e-3)
+
+        def animate(n):
+            handle.update(stored_q[n])
+            trail.append(handle.x_effector)
+            return handle.artists + trail.artists
+
+    Long trails can be kept cheap to draw with
+
+    - `stride`: only every `stride`-th point is kept, the most recent point always being drawn so that the trail
+      reaches the moving object.
+    - `tolerance`: the kept points are simplified with the Ramer-Douglas-Peucker algorithm, in chunks as they arrive,
+      so that no removed point is farther than `tolerance` from the drawn line.
+    - `max_points`: only the most recent `max_points` kept points are drawn, bounding the memory.
+    """
+    def __init__(self,
+                 ax=None,
+                 color = "k",
+                 stride: int = 1,
+                 tolerance: float = None,
+                 max_points: int = None,
+                 **kwargs):
+        """
+        Create the line of the trail, initially empty.
+        :param ax: Figure Axes or plt.gca() if None.
+        :param color: A suitable color for the line.
+        :param stride: Keep every `stride`-th point. All points are kept if 1.
+        :param tolerance: The maximum distance of a removed point to the line, or None to keep all points.
+        :param max_points: The maximum number of points kept, or None for no limit.
+        :param kwargs: Other arguments of the line, e.g. `linewidth`.
+        :raises RuntimeError: If `stride` or `max_points` is not a positive integer or `tolerance` is negative.
+        """
+        if stride < 1:
+            raise RuntimeError(f"The stride must be a positive integer, not {stride}.")
+        if tolerance is not None and tolerance < 0:
+            raise RuntimeError(f"The tolerance must be non-negative, not {tolerance}.")
+        if max_points is not None and max_points < 2:
+            raise RuntimeError(f"The max_points must be at least 2, not {max_points}.")
+        if ax is None:
+            ax = plt.gca()
+
+        self.stride = stride
+        self.tolerance = tolerance
+        self.max_points = max_points
+
+        self._buffer = np.empty((_INITIAL_CAPACITY, 3))
+        # The points drawn are `self._buffer[self._start:self._end]`
+        self._start = 0
+        self._end = 0
+        # The first point that was not simplified yet, see `tolerance`
+        self._anchor = 0
+        # Whether the last point is only drawn until the next one arrives, see `stride`
+        self._provisional = False
+        self._count = 0
+
+        self.line, = ax.plot3D([], [], [], color=color, **kwargs)
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def points(self) -> np.ndarray:
+        """
+        The points drawn, as a read-only view of shape (N, 3).
+        """
+        points = self._buffer[self._start:self._end]
+        points.flags.writeable = False
+        return points
+
+    @property
+    def artists(self) -> list:
+        """
+        The artists of the trail, e.g., to be returned by a `FuncAnimation` function when `blit=True`.
+        """
+        return [self.line]
+
+    def append(self, value):
+        """
+        Add a point at the end of the trail and update its line.
+        :param value: A unit DQ, whose translation is used, a pure quaternion, or an array-like with 3 coordinates. Pure
+            quaternions are taken as points, so the translation of a pose that is also a pure quaternion, e.g. `i_`,
+            must be given explicitly with `translation(x)`.
+        """
+        self.extend([value])
+
+    def extend(self, values):
+        """
+        Add many points at the end of the trail and update its line once.
+        :param values: A sequence of unit DQs, pure quaternions, or an array-like of shape (N, 3).
+        """
+        for value in values:
+            self.__add(_as_point(value))
+
+        with _stage("artists"):
+            points = self._buffer[self._start:self._end]
+            self.line.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+
+    def clear(self):
+        """
+        Remove all points of the trail.
+        """
+        self._start = self._end = self._anchor = self._count = 0
+        self._provisional = False
+        self.line.set_data_3d([], [], [])
+
+    def remove(self):
+        """
+        Remove the line of the trail from its Axes.
+        """
+        self.line.remove()
+
+    def __add(self, point: np.ndarray):
+        """
+        Add a point to the vertex buffer, applying the stride, the simplification, and the maximum number of points.
+        :param point: An array with 3 coordinates.
+        """
+        if self._provisional:
+            # The previous point was only kept to reach the moving object
+            self._end -= 1
+        self._provisional = self._count % self.stride != 0
+        self._count += 1
+
+        if self._end == len(self._buffer):
+            self.__make_room()
+        self._buffer[self._end] = point
+        self._end += 1
+
+        committed_end = self._end - 1 if self._provisional else self._end
+        if self.tolerance is not None and committed_end - self._anchor > _SIMPLIFICATION_CHUNK:
+            self.__simplify(committed_end)
+
+        if self.max_points is not None and len(self) > self.max_points:
+            self._start = self._end - self.max_points
+            self._anchor = max(self._anchor, self._start)
+
+    def __simplify(self, committed_end: int):
+        """
+        Simplify the points from the anchor to `committed_end` in place with `_rdp`. The last simplified point becomes
+        the anchor of the next chunk.
+        :param committed_end: The end of the points that are kept, excluding a provisional point.
+        """
+        with _stage("mesh"):
+            chunk = self._buffer[self._anchor:committed_end]
+            kept = chunk[_rdp(chunk, self.tolerance)]
+            # A provisional point after the chunk is moved along with it
+            tail = self._buffer[committed_end:self._end].copy()
+
+            self._buffer[self._anchor:self._anchor + len(kept)] = kept
+            self._anchor += len(kept) - 1
+            self._end = self._anchor + 1
+            self._buffer[self._end:self._end + len(tail)] = tail
+            self._end += len(tail)
+
+    def __make_room(self):
+        """
+        Make room for one more point at the end of the buffer, either by discarding the points that are no longer drawn
+        or by doubling the capacity.
+        """
+        if self._start > len(self._buffer) // 2:
+            n = self._end - self._start
+            self._buffer[:n] = self._buffer[self._start:self._end]
+            self._anchor -= self._start
+            self._start, self._end = 0, n
+        else:
+            buffer = np.empty((2 * len(self._buffer), 3))
+            buffer[:self._end] = self._buffer[:self._end]
+            self._buffer = buffer
+
+
+def _as_point(value) -> np.ndarray:
+    """
+    The coordinates of a point given as a DQ or as an array-like.
+    :param value: A unit DQ, whose translation is used, a pure quaternion, or an array-like with 3 coordinates.
+    :return: An array with 3 coordinates.
+    """
+    if isinstance(value, DQ):
+        if is_quaternion(value) and is_pure(value):
+            return value.q[1:4]
+        return translation(value).q[1:4]
+    return np.asarray(value, dtype=float).reshape(3)
+
+
+def _rdp(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm. The first and last points are always kept.
+    :param points: An array of shape (N, 3) with the points of the polyline.
+    :param tolerance: The maximum distance of a removed point to the simplified polyline.
+    :return: A boolean mask of shape (N,) with the points that are kept.
+    """
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    # The segments still to be checked, as the indices of their first and last points
+    segments = [(0, len(points) - 1)]
+    while segments:
+        first, last = segments.pop()
+        if last - first < 2:
+            continue
+        direction = points[last] - points[first]
+        offsets = points[first + 1:last] - points[first]
+        # The distance to the segment, not to the infinite line, so that a path going back on itself is not removed
+        squared_length = direction @ direction
+        if squared_length > 0:
+            fractions = np.clip(offsets @ direction / squared_length, 0.0, 1.0)
+        else:
+            fractions = np.zeros(len(offsets))
+        distances = np.linalg.norm(offsets - fractions[:, np.newaxis] * direction, axis=1)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            middle = first + 1 + farthest
+            keep[middle] = True
+            segments.append((first, middle))
+            segments.append((middle, last))
+    return keep
@@ -0,0 +1,183 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import os
+import struct
+
+import numpy as np
+
+# The file starts with a fixed-size header followed by one fixed-size record per sample. The header is
+# magic (8 bytes), version (uint32), dimension of q (uint32), number of poses per sample (uint32), and padding.
+_MAGIC = b"DQPTRAJ\0"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIII")
+_HEADER_SIZE = 64
+
+
+def _record_dtype(dim_q: int, n_poses: int) -> np.dtype:
+    """
+    The NumPy dtype of one sample of a trajectory file.
+    :param dim_q: The dimension of the joint configurations.
+    :param n_poses: The number of poses, as arrays of 8 coefficients, stored with each sample.
+    :return: The structured dtype with the fields "time", "q", and, if n_poses > 0, "poses".
+    """
+    fields = [("time", "<f8"), ("q", "<f8", (dim_q,))]
+    if n_poses > 0:
+        fields.append(("poses", "<f8", (n_poses, 8)))
+    return np.dtype(fields)
+
+
+class TrajectoryWriter:
+    """
+    Write a joint trajectory, sample by sample, into a file that can be read with `TrajectoryFile` without loading it
+    into memory. Each sample holds a timestamp, the joint configurations, and, optionally, a fixed number of poses, e.g.
+    the poses of all joints as given by `fkm_all`.
+
+        with dqp.TrajectoryWriter("log.dqtraj", dim_q=7) as writer:
+            for time in np.arange(0, time_final + tau, tau):
+                writer.append(time, q)
+                q = q + u * tau
+    """
+    def __init__(self, path: str, dim_q: int, n_poses: int = 0):
+        """
+        Create the file and write its header. An existing file is overwritten.
+        :param path: The path of the file.
+        :param dim_q: The dimension of the joint configurations.
+        :param n_poses: The number of poses stored with each sample.
+        """
+        self.dtype = _record_dtype(dim_q, n_poses)
+        self.dim_q = dim_q
+        self.n_poses = n_poses
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, dim_q, n_poses).ljust(_HEADER_SIZE, b"\0"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, time: float, q: np.ndarray, poses=None):
+        """
+        Write one sample at the end of the file.
+        :param time: The timestamp.
+        :param q: The joint configurations.
+        :param poses: If the file has poses, an array-like of shape (n_poses, 8).
+        """
+        self.extend([time], np.reshape(q, (1, self.dim_q)), None if poses is None else np.reshape(poses, (1, -1, 8)))
+
+    def extend(self, times: np.ndarray, qs: np.ndarray, poses: np.ndarray = None):
+        """
+        Write many samples at the end of the file.
+        :param times: An array-like of shape (N,) with the timestamps.
+        :param qs: An array-like of shape (N, dim_q) with the joint configurations.
+        :param poses: If the file has poses, an array-like of shape (N, n_poses, 8).
+        :raises RuntimeError: If the poses do not match the number of poses of the file.
+        """
+        if (poses is None) != (self.n_poses == 0):
+            raise RuntimeError(f"The file was created with n_poses={self.n_poses}.")
+
+        records = np.empty(len(times), dtype=self.dtype)
+        records["time"] = times
+        records["q"] = qs
+        if poses is not None:
+            records["poses"] = poses
+        self._file.write(records.tobytes())
+
+    def close(self):
+        """
+        Close the file.
+        """
+        self._file.close()
+
+
+class TrajectoryFile:
+    """
+    Read a trajectory file written by `TrajectoryWriter`. The samples are memory-mapped, so `times`, `q`, `poses`, and
+    their slices are views into the file and only the samples that are used are read from the disk. This allows
+    seeking and decimating long logs without loading them.
+
+        trajectory = dqp.TrajectoryFile("log.dqtraj")
+        q = trajectory.q[1000]  # The joint configurations of sample 1000
+        anim = dqp.animate_stream(trajectory.samples(step=10), robot=robot)  # Every 10th sample
+    """
+    def __init__(self, path: str):
+        """
+        Open the file.
+        :param path: The path of the file.
+        :raises RuntimeError: If the file is not a trajectory file or is shorter than its header.
+        """
+        with open(path, "rb") as file:
+            header = file.read(_HEADER_SIZE)
+        # An empty or truncated file cannot hold the header of a trajectory file
+        if len(header) < _HEADER_SIZE:
+            raise RuntimeError(f"The file {path} is too short to be a trajectory file.")
+        magic, version, dim_q, n_poses = _HEADER.unpack_from(header)
+        if magic != _MAGIC or version != _VERSION:
+            raise RuntimeError(f"The file {path} is not a trajectory file of version {_VERSION}.")
+
+        self.dim_q = dim_q
+        self.n_poses = n_poses
+        dtype = _record_dtype(dim_q, n_poses)
+
+        # The number of samples is given by the size of the file, so files that were not closed properly can be read
+        n_samples = (os.path.getsize(path) - _HEADER_SIZE) // dtype.itemsize
+        if n_samples > 0:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=_HEADER_SIZE, shape=(n_samples,))
+        else:
+            self.records = np.empty(0, dtype=dtype)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def times(self) -> np.ndarray:
+        """
+        The timestamps as an array of shape (N,).
+        """
+        return self.records["time"]
+
+    @property
+    def q(self) -> np.ndarray:
+        """
+        The joint configurations as an array of shape (N, dim_q).
+        """
+        return self.records["q"]
+
+    @property
+    def poses(self) -> np.ndarray:
+        """
+        The poses as an array of shape (N, n_poses, 8).
+        :raises RuntimeError: If the file has no poses.
+        """
+        if self.n_poses == 0:
+            raise RuntimeError("The trajectory file has no poses.")
+        return self.records["poses"]
+
+    def samples(self, start: int = 0, stop: int = None, step: int = 1):
+        """
+        Iterate over the samples as `(time, q)` tuples, e.g., for `animate_stream`.
+        :param start: The index of the first sample.
+        :param stop: The index after the last sample or the end of the file if None.
+        :param step: The step between samples, used to decimate the trajectory.
+        :return: A generator of `(time, q)` tuples.
+        """
+        for i in range(*slice(start, stop, step).indices(len(self))):
+            record = self.records[i]
+            yield float(record["time"]), np.array(record["q"])
@@ -0,0 +1,406 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import os
+import multiprocessing
+from math import ceil
+
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulator, DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH
+
+from dqrobotics_extensions.pyplot._kinematics import _DHParameters, _dh_parameters, _fkm_vec8, _PRISMATIC
+from dqrobotics_extensions.pyplot._dq_array import _translation
+from dqrobotics_extensions.pyplot._pyplot import _shade_colors, _points_per_data_unit
+from dqrobotics_extensions.pyplot._profiling import _stage, _profiled
+
+from matplotlib import pyplot as plt
+from matplotlib import colors as mcolors
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+import numpy as np
+
+# The robot model and the histogram of each worker process, set by `_initialize_worker`.
+_worker_state = {}
+
+
+class WorkspaceHistogram:
+    """
+    The number of points that fell into each voxel of a regular grid. Points are added in chunks and only the counts
+    are kept, so the memory depends on the number of voxels and not on the number of points. See `sample_workspace`.
+
+        histogram = dqp.WorkspaceHistogram(lower=[-1, -1, 0], upper=[1, 1, 1.5], bins=64)
+        histogram.add(points)
+    """
+    def __init__(self, lower, upper, bins=64):
+        """
+        Create an empty histogram.
+        :param lower: The lower corner of the grid, as an array-like with 3 coordinates.
+        :param upper: The upper corner of the grid, as an array-like with 3 coordinates.
+        :param bins: The number of voxels along each axis, either one integer or one integer per axis.
+        :raises RuntimeError: If `upper` is not larger than `lower` or `bins` is not positive along each axis.
+        """
+        self.lower = np.asarray(lower, dtype=float).reshape(3)
+        self.upper = np.asarray(upper, dtype=float).reshape(3)
+        self.bins = tuple(int(b) for b in np.broadcast_to(bins, (3,)))
+        if np.any(self.upper <= self.lower):
+            raise RuntimeError(f"The upper corner {self.upper} must be larger than the lower corner {self.lower}.")
+        if min(self.bins) < 1:
+            raise RuntimeError(f"The number of bins must be positive, not {self.bins}.")
+
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        # The number of points added that are outside the grid
+        self.outside = 0
+
+    @property
+    def voxel_size(self) -> np.ndarray:
+        """
+        The size of each voxel along each axis.
+        """
+        return (self.upper - self.lower) / self.bins
+
+    @property
+    def total(self) -> int:
+        """
+        The number of points added, including those outside the grid.
+        """
+        return int(self.counts.sum()) + self.outside
+
+    def add(self, points):
+        """
+        Count the points in their voxels. Points on the upper faces of the grid are counted in the last voxels, as
+        with `numpy.histogramdd`.
+        :param points: An array-like of shape (N, 3).
+        """
+        self._add_indices(*self._voxel_indices(points))
+
+    def occupied(self, min_count: int = 1):
+        """
+        The voxels with at least `min_count` points.
+        :param min_count: The minimum number of points of a voxel.
+        :return: A tuple with an integer array of shape (M, 3) with the indices of the voxels and an array of shape
+            (M,) with their counts.
+        """
+        indices = np.argwhere(self.counts >= max(min_count, 1))
+        return indices, self.counts[tuple(indices.T)]
+
+    def centres(self, indices: np.ndarray) -> np.ndarray:
+        """
+        The centres of voxels.
+        :param indices: An integer array of shape (M, 3) with the indices of the voxels, e.g. from `occupied`.
+        :return: An array of shape (M, 3) with the centres.
+        """
+        return self.lower + (indices + 0.5) * self.voxel_size
+
+    def _voxel_indices(self, points):
+        """
+        Find the voxel of each point.
+        :param points: An array-like of shape (N, 3).
+        :return: A tuple with the flat indices of the voxels of the points inside the grid and the number of points
+            outside the grid.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        inside = np.all((points >= self.lower) & (points <= self.upper), axis=1)
+        indices = ((points[inside] - self.lower) / self.voxel_size).astype(np.intp)
+        np.minimum(indices, np.array(self.bins) - 1, out=indices)
+        return np.ravel_multi_index(indices.T, self.bins), int(len(points) - np.count_nonzero(inside))
+
+    def _add_indices(self, flat_indices: np.ndarray, outside: int):
+        """
+        Count points from the output of `_voxel_indices`.
+        :param flat_indices: The flat indices of the voxels of the points inside the grid.
+        :param outside: The number of points outside the grid.
+        """
+        self.counts.reshape(-1)[:] += np.bincount(flat_indices, minlength=self.counts.size)
+        self.outside += outside
+
+
+def sample_workspace(robot: DQ_SerialManipulator,
+                     n_samples: int,
+                     lower_q=None,
+                     upper_q=None,
+                     bins=64,
+                     bounds=None,
+                     chunk_size: int = 100000,
+                     processes: int = 1,
+                     seed=None,
+                     start_method: str = None) -> WorkspaceHistogram:
+    """
+    Estimate the reachable workspace of a serial manipulator by sampling joint configurations uniformly within the joint
+    limits and counting the positions of the end effector in a `WorkspaceHistogram`. Millions of samples can be used
+    because they are evaluated in chunks of `chunk_size` and only the counts are kept.
+
+        histogram = dqp.sample_workspace(robot, 2_000_000, processes=None, seed=0)
+        dqp.plot_workspace(histogram)
+
+    For `DQ_SerialManipulatorDH` and `DQ_SerialManipulatorMDH`, each chunk is evaluated at once with NumPy, see
+    `fkm_all`. Other subclasses call `robot.fkm(q)` for each sample, which is much slower. With `processes`, the chunks
+    are split across a pool of processes started with the default method of `multiprocessing`. Other subclasses can only
+    be sent to the processes with the "fork" start method, which must then be given on platforms where it is not the
+    default, because `DQ_SerialManipulator` cannot be pickled.
+
+    Each chunk has its own random generator spawned from `seed`, so the histogram only depends on `seed`, `n_samples`,
+    and `chunk_size`, and not on the number of processes.
+
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param n_samples: The number of joint configurations sampled.
+    :param lower_q: The lower joint limits. If None, revolute joints are sampled from -pi.
+    :param upper_q: The upper joint limits. If None, revolute joints are sampled up to pi.
+    :param bins: The number of voxels along each axis, either one integer or one integer per axis.
+    :param bounds: A tuple (lower, upper) with the corners of the grid. If None, the grid is the cube enclosing all
+        positions the end effector could reach, which is only known for `DQ_SerialManipulatorDH` and
+        `DQ_SerialManipulatorMDH`.
+    :param chunk_size: The number of samples evaluated at once.
+    :param processes: The number of worker processes, `os.cpu_count()` if None, or 1 to sample in this process.
+    :param seed: The seed of `numpy.random.SeedSequence`.
+    :param start_method: The `multiprocessing` start method or None for its default.
+    :return: The histogram of the positions of the end effector.
+    :raises RuntimeError: If the joint limits or the bounds are needed but not given, or the robot cannot be sent to
+        the worker processes.
+    """
+    if isinstance(robot, (DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH)):
+        model = _dh_parameters(robot)
+    else:
+        model = robot
+    lower_q, upper_q = _joint_limits(robot, lower_q, upper_q)
+
+    if bounds is None:
+        if not isinstance(model, _DHParameters):
+            raise RuntimeError(f"The bounds of the workspace of {type(robot).__name__} must be given.")
+        bounds = _reach_bounds(model, lower_q, upper_q)
+    histogram = WorkspaceHistogram(bounds[0], bounds[1], bins)
+
+    chunk_size = max(1, int(chunk_size))
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    tasks = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or len(tasks) <= 1:
+        for size, chunk_seed in tasks:
+            histogram._add_indices(*histogram._voxel_indices(_sample_points(model, lower_q, upper_q, size, chunk_seed)))
+        return histogram
+
+    context = multiprocessing.get_context(start_method)
+    if context.get_start_method() != "fork" and not isinstance(model, _DHParameters):
+        raise RuntimeError(f"A {type(robot).__name__} can only be sampled in worker processes with the 'fork' start "
+                           f"method, not '{context.get_start_method()}'.")
+
+    with context.Pool(min(processes, len(tasks)),
+                      initializer=_initialize_worker,
+                      initargs=(model, lower_q, upper_q, histogram.lower, histogram.upper, histogram.bins)) as pool:
+        # Only the voxel indices of each chunk are sent back, which is much less than the counts of the whole grid
+        for result in pool.imap_unordered(_sample_chunk, tasks, chunksize=max(1, ceil(len(tasks) / (4 * processes)))):
+            histogram._add_indices(*result)
+    return histogram
+
+
+@_profiled("workspace")
+def plot_workspace(histogram: WorkspaceHistogram,
+                   style: str = "voxels",
+                   min_count: int = 1,
+                   cmap="viridis",
+                   norm=None,
+                   alpha: float = 0.8,
+                   size: float = None,
+                   ax=None):
+    """
+    Draw the occupied voxels of a `WorkspaceHistogram` coloured by the number of points in each of them, as a single
+    artist.
+
+        histogram = dqp.sample_workspace(robot, 1_000_000)
+        dqp.plot_workspace(histogram, style="points", min_count=10)
+
+    - "voxels": the voxels are drawn as cubes in one `Poly3DCollection`. Only the faces between an occupied and an
+      empty voxel are drawn, so the inside of the workspace costs nothing.
+    - "points": the centres of the voxels are drawn as a point cloud with one `scatter`. This is much cheaper for large
+      grids. The markers can be added to a colorbar, e.g. `plt.colorbar(artist)`.
+
+    :param histogram: The histogram, e.g. from `sample_workspace`.
+    :param style: Either "voxels" or "points".
+    :param min_count: The minimum number of points of a voxel to be drawn.
+    :param cmap: A matplotlib colormap or its name.
+    :param norm: A `matplotlib.colors.Normalize` of the counts, or None for a logarithmic scale from `min_count` to
+        the largest count.
+    :param alpha: The alpha of the voxels or points.
+    :param size: The size of the markers of "points", as in `scatter`. If None, each marker is about as wide as a voxel
+        for the current axes limits and view.
+    :param ax: Figure Axes or plt.gca() if None.
+    :return: The `Poly3DCollection` of "voxels" or the `PathCollection` of "points".
+    :raises RuntimeError: If the style is not valid.
+    """
+    if style not in ("voxels", "points"):
+        raise RuntimeError(f"The style must be 'voxels' or 'points', not {style}.")
+    if ax is None:
+        ax = plt.gca()
+
+    indices, counts = histogram.occupied(min_count)
+    if norm is None:
+        norm = mcolors.LogNorm(vmin=max(min_count, 1), vmax=max(counts.max(initial=1), max(min_count, 1) + 1))
+    cmap = plt.get_cmap(cmap)
+
+    if style == "points":
+        with _stage("artists"):
+            centres = histogram.centres(indices)
+            if size is None:
+                size = (np.min(histogram.voxel_size) * _points_per_data_unit(ax)) ** 2
+            return ax.scatter(centres[:, 0], centres[:, 1], centres[:, 2],
+                              c=counts,
+                              cmap=cmap,
+                              norm=norm,
+                              s=size,
+                              alpha=alpha,
+                              depthshade=False,
+                              edgecolors="none")
+
+    with _stage("mesh"):
+        polygons, face_counts = _voxel_faces(histogram, indices, counts)
+    with _stage("artists"):
+        facecolors = _shade_colors(cmap(norm(face_counts)), polygons)
+        facecolors[:, 3] = alpha
+        voxels = Poly3DCollection(polygons, facecolors=facecolors, edgecolors="none")
+        ax.add_collection3d(voxels)
+    return voxels
+
+
+def _voxel_faces(histogram: WorkspaceHistogram, indices: np.ndarray, counts: np.ndarray):
+    """
+    The faces of occupied voxels that are next to an empty voxel or on the boundary of the grid.
+    :param histogram: The histogram.
+    :param indices: An integer array of shape (M, 3) with the indices of the occupied voxels.
+    :param counts: An array of shape (M,) with their counts.
+    :return: A tuple with an array of shape (F, 4, 3) with the faces and an array of shape (F,) with the count of the
+        voxel of each face.
+    """
+    occupied = np.zeros(histogram.bins, dtype=bool)
+    occupied[tuple(indices.T)] = True
+    grid_counts = np.zeros(histogram.bins, dtype=np.int64)
+    grid_counts[tuple(indices.T)] = counts
+    padded = np.pad(occupied, 1)
+
+    polygons = []
+    face_counts = []
+    for axis in range(0, 3):
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        # The corners of the face at the origin of the voxel with the normal towards +axis, see `_shade_colors`
+        corners = np.zeros((4, 3))
+        corners[[1, 2], u] = 1.0
+        corners[[2, 3], v] = 1.0
+        for side in (-1, 1):
+            neighbours = np.roll(padded, -side, axis=axis)[1:-1, 1:-1, 1:-1]
+            exposed = np.argwhere(occupied & ~neighbours)
+            face = corners.copy()
+            if side == 1:
+                face[:, axis] = 1.0
+            else:
+                # Reversed so that the normal points towards -axis
+                face = face[::-1]
+            polygons.append(exposed[:, np.newaxis, :] + face)
+            face_counts.append(grid_counts[tuple(exposed.T)])
+
+    polygons = histogram.lower + np.concatenate(polygons) * histogram.voxel_size
+    return polygons, np.concatenate(face_counts)
+
+
+def _joint_limits(robot: DQ_SerialManipulator, lower_q, upper_q):
+    """
+    The joint limits used to sample a robot.
+    :param robot: A concrete subclass of DQ_SerialManipulator.
+    :param lower_q: The lower joint limits or None.
+    :param upper_q: The upper joint limits or None.
+    :return: A tuple with the lower and upper joint limits as arrays.
+    :raises RuntimeError: If a limit is None for a robot that is not only revolute or the limits have the wrong size.
+    """
+    n = robot.get_dim_configuration_space()
+    if lower_q is None or upper_q is None:
+        if isinstance(robot, (DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH)):
+            revolute = np.array(robot.get_types()) != _PRISMATIC
+        else:
+            revolute = np.zeros(n, dtype=bool)
+        if not np.all(revolute):
+            raise RuntimeError("The joint limits lower_q and upper_q must be given unless all joints are revolute.")
+    lower_q = np.full(n, -np.pi) if lower_q is None else np.asarray(lower_q, dtype=float).reshape(-1)
+    upper_q = np.full(n, np.pi) if upper_q is None else np.asarray(upper_q, dtype=float).reshape(-1)
+    if len(lower_q) != n or len(upper_q) != n:
+        raise RuntimeError(f"The joint limits must have {n} values, not {len(lower_q)} and {len(upper_q)}.")
+    return lower_q, upper_q
+
+
+def _reach_bounds(parameters: _DHParameters, lower_q: np.ndarray, upper_q: np.ndarray):
+    """
+    The cube enclosing all positions the end effector of a `DQ_SerialManipulatorDH` or `DQ_SerialManipulatorMDH` could
+    reach, centred at its reference frame. Each link moves the next frame by at most the norm of its (a, d).
+    :param parameters: The parameters of the robot as given by `_dh_parameters`.
+    :param lower_q: The lower joint limits.
+    :param upper_q: The upper joint limits.
+    :return: A tuple with the lower and upper corners of the cube.
+    """
+    prismatic = parameters.types == _PRISMATIC
+    d = np.where(prismatic,
+                 np.maximum(np.abs(parameters.ds + lower_q), np.abs(parameters.ds + upper_q)),
+                 np.abs(parameters.ds))
+    radius = np.sum(np.hypot(parameters.as_, d)) + np.linalg.norm(_translation(parameters.effector))
+    # A small margin so that the positions at the full reach are inside the grid
+    radius = 1.01 * radius + 1e-9
+    centre = _translation(parameters.reference_frame)
+    return centre - radius, centre + radius
+
+
+def _sample_points(model, lower_q: np.ndarray, upper_q: np.ndarray, size: int, seed) -> np.ndarray:
+    """
+    Sample joint configurations and calculate the positions of the end effector.
+    :param model: The `_DHParameters` of the robot or, for other robots, the `DQ_SerialManipulator` itself.
+    :param lower_q: The lower joint limits.
+    :param upper_q: The upper joint limits.
+    :param size: The number of samples.
+    :param seed: The seed of the random generator.
+    :return: An array of shape (size, 3) with the positions.
+    """
+    qs = np.random.default_rng(seed).uniform(lower_q, upper_q, size=(size, len(lower_q)))
+    with _stage("kinematics"):
+        if isinstance(model, _DHParameters):
+            return _translation(_fkm_vec8(model, qs))
+        return np.array([translation(model.fkm(q)).q[1:4] for q in qs]).reshape(-1, 3)
+
+
+def _initialize_worker(model, lower_q: np.ndarray, upper_q: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                       bins: tuple):
+    """
+    Store the robot and an empty histogram in a worker process of `sample_workspace`.
+    :param model: The `_DHParameters` of the robot or, for other robots, the `DQ_SerialManipulator` itself.
+    :param lower_q: The lower joint limits.
+    :param upper_q: The upper joint limits.
+    :param lower: The lower corner of the grid.
+    :param upper: The upper corner of the grid.
+    :param bins: The number of voxels along each axis.
+    """
+    _worker_state["model"] = model
+    _worker_state["limits"] = (lower_q, upper_q)
+    _worker_state["histogram"] = WorkspaceHistogram(lower, upper, bins)
+
+
+def _sample_chunk(task: tuple):
+    """
+    Sample a chunk in a worker process of `sample_workspace`.
+    :param task: A tuple with the number of samples and the seed of the chunk.
+    :return: The output of `WorkspaceHistogram._voxel_indices` for the positions of the end effector.
+    """
+    size, seed = task
+    lower_q, upper_q = _worker_state["limits"]
+    points = _sample_points(_worker_state["model"], lower_q, upper_q, size, seed)
+    return _worker_state["histogram"]._voxel_indices(points)
@@ -90,7 +90,9 @@ def main():
                               robot=robot,
                               stored_q=stored_q,
                               stored_time=stored_time),
-                      frames=len(stored_q))
+                      # Only the samples shown at 30 fps are drawn, so the animation plays in real time
+                      frames=dqp.frame_indices(stored_time, fps=30),
+                      interval=1000 / 30)
 
     plt.show()
 
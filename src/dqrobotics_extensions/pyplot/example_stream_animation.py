@@ -0,0 +1,72 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import numpy as np
+
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+from dqrobotics.utils.DQ_Math import deg2rad
+
+# Adding the prefix `dqp` to help users differentiate from `plt`
+import dqrobotics_extensions.pyplot as dqp
+
+import matplotlib.pyplot as plt
+
+def simulation(tau: float, time_final: float):
+    """
+    Move the robot, yielding each sample instead of storing it.
+    :param tau: The sampling time.
+    :param time_final: The simulation time.
+    :return: A generator of `(time, q)` samples.
+    """
+    # Initial joint values [rad]
+    q = deg2rad([0, 45, 0, -45, 0, 45, 0])
+
+    # Translation controller loop.
+    for time in np.arange(0, time_final + tau, tau):
+        # Send the sample to the animation
+        yield time, q
+
+        # A joint-space velocity
+        u = np.ones(7)
+
+        # Move the robot
+        q = q + u * tau
+
+def main():
+
+    # Define the robot
+    robot = KukaLw4Robot.kinematics()
+
+    # Set up the plot
+    fig = plt.figure()
+    ax = plt.axes(projection='3d')
+    ax.set(xlabel='x [m]', xlim=[-1.0, 0.0],
+           ylabel='y [m]', ylim=[-0.5, 0.5],
+           zlabel='z [m]', zlim=[0, 0.5])
+
+    # The samples are drawn as they are generated, keeping only the last 50 positions of the end effector
+    anim = dqp.animate_stream(simulation(tau=0.01, time_final=10),
+                              robot=robot,
+                              trail_length=50)
+
+    plt.show()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -27,7 +27,6 @@ from dqrobotics.utils.DQ_Math import deg2rad
 from ._utils import _set_plot_labels, _set_plot_limits
 
 from matplotlib import pyplot as plt
-import matplotlib.animation as anm # Matplotlib animation
 from functools import partial # Need to call functions correctly for matplotlib animations
 
 import numpy as np
@@ -35,48 +34,70 @@ import numpy as np
 from math import pi, cos, sin
 
 
-def output_moving_manipulators():
+def _robots():
     """
-    Calculate and visualize multiple moving primitives represented as DQs.
+    Define the robots. They are created again in each process that renders frames, because a `DQ_SerialManipulator`
+    cannot be sent to other processes.
+    :return: The tuple of robots.
     """
-
-    # Animation function
-    def animate_robots(n, robots, stored_qs, stored_time):
-        """
-        Create an animation function compatible with `plt`.
-        Adapted from https://marinholab.github.io/OpenExecutableBooksRobotics//lesson-dq8-optimization-based-robot-control.
-        :param n: The frame number, necessary for `pyplot`.
-        :param robots: The `DQ_SerialManipulator` tuple instance to plot.
-        :param stored_qs: The sequence of joint configurations.
-        :param stored_time: The sequence of timepoints to plot in the title.
-        """
-        plt.cla()
-        _set_plot_limits(-0, 1.0)
-        _set_plot_labels()
-        plt.title(f'Joint control time={stored_time[n]:.2f} s out of {stored_time[-1]:.2f} s')
-
-        R1, R2 = robots
-        dqp.plot(R1, q=stored_qs[n][0],
-                 line_color='r',
-                 line_width=5,
-                 cylinder_color="k",
-                 cylinder_alpha=0.9,
-                 cylinder_radius=0.035,
-                 cylinder_height=0.1)
-        dqp.plot(R2, q=stored_qs[n][1],
-                 line_color='b',
-                 cylinder_color="c",
-                 cylinder_alpha=0.3)
-
-    # Define the robots
     R1 = KukaLw4Robot.kinematics()
     R1.set_reference_frame(cos(pi/2) + k_*sin(pi/2))
     R2 = KukaLw4Robot.kinematics()
     R2.set_reference_frame(1 + 0.5*E_*(0.75*i_ + 0.75*j_))
+    return R1, R2
+
+
+# Animation function, defined at module level so that it can be sent to the processes of `dqp.save_animation`
+def _animate_robots(n, stored_qs, stored_time, scenes):
+    """
+    Create an animation function compatible with `plt`.
+    Adapted from https://marinholab.github.io/OpenExecutableBooksRobotics//lesson-dq8-optimization-based-robot-control.
+    :param n: The frame number, necessary for `pyplot`.
+    :param stored_qs: The sequence of joint configurations.
+    :param stored_time: The sequence of timepoints to plot in the title.
+    :param scenes: The `dqp.Scene` of each Axes, filled in the first frame drawn in each Axes.
+    """
+    # The robots are drawn once in the Axes of each process and only moved afterwards, see `dqp.Scene`
+    ax = plt.gca()
+    if ax not in scenes:
+        _set_plot_limits(-0, 1.0)
+        _set_plot_labels()
+
+        R1, R2 = _robots()
+        # Calculate the poses of both trajectories at once
+        dqp.fkm_cache_precompute(R1, [q1 for q1, _ in stored_qs])
+        dqp.fkm_cache_precompute(R2, [q2 for _, q2 in stored_qs])
+
+        scene = dqp.Scene(ax)
+        scene.add("R1", R1, q=stored_qs[n][0],
+                  line_color='r',
+                  line_width=5,
+                  cylinder_color="k",
+                  cylinder_alpha=0.9,
+                  cylinder_radius=0.035,
+                  cylinder_height=0.1)
+        scene.add("R2", R2, q=stored_qs[n][1],
+                  line_color='b',
+                  cylinder_color="c",
+                  cylinder_alpha=0.3)
+        scenes[ax] = scene
+    else:
+        scene = scenes[ax]
+        scene.update("R1", stored_qs[n][0])
+        scene.update("R2", stored_qs[n][1])
+        scene.flush()
+
+    plt.title(f'Joint control time={stored_time[n]:.2f} s out of {stored_time[-1]:.2f} s')
+
+
+def output_moving_manipulators():
+    """
+    Calculate and visualize multiple moving primitives represented as DQs.
+    """
 
     # Sampling time [s]
     tau = 0.01
-    # Simulation time [s]
+    # Simulation time [s], which is also the length of the video because it plays in real time
     time_final = 1
     # Initial joint values [rad]
     q1 = deg2rad([0, 45, 0, -45, 0, 45, 0])
@@ -100,15 +121,14 @@ def output_moving_manipulators():
         q1 = q1 + u1 * tau
         q2 = q2 + u2 * tau
 
-    # Set up the plot
-    fig = plt.figure(dpi=200, figsize=(12, 10))
-    plt.axes(projection='3d')
-
-    anim = anm.FuncAnimation(fig,
-                             partial(animate_robots,
-                                     robots=(R1, R2),
-                                     stored_qs=stored_qs,
-                                     stored_time=stored_time),
-                             frames=len(stored_qs))
-
-    anim.save("output_moving_manipulators.mp4")
\ No newline at end of file
+    # Render the frames in parallel and save the animation
+    dqp.save_animation("output_moving_manipulators.mp4",
+                       partial(_animate_robots,
+                               stored_qs=stored_qs,
+                               stored_time=stored_time,
+                               scenes={}),
+                       frames=len(stored_qs),
+                       # Only the samples shown in a real-time video are rendered, see `dqp.frame_indices`
+                       times=stored_time,
+                       fps=30,
+                       figure_kwargs=dict(dpi=200, figsize=(12, 10)))
\ No newline at end of file
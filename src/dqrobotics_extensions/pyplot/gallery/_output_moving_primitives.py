@@ -24,13 +24,55 @@ import dqrobotics_extensions.pyplot as dqp
 from ._utils import _set_plot_labels, _set_plot_limits
 
 from matplotlib import pyplot as plt
-import matplotlib.animation as anm # Matplotlib animation
 from functools import partial # Need to call functions correctly for matplotlib animations
 
 from math import sin, cos
 import numpy as np
 
 
+# Animation function, defined at module level so that it can be sent to the processes of `dqp.save_animation`
+def _animate_plot(n, stored_x, stored_l_dq, stored_pi_dq, stored_time, scenes):
+    """
+    Create an animation function compatible with `plt`.
+    :param n: The frame number, necessary for `pyplot`.
+    :param stored_x: The sequence of poses, each as the 8 coefficients of a DQ so that it can be sent to other processes.
+    :param stored_l_dq: The sequence of lists of lines, in the same format.
+    :param stored_pi_dq: The sequence of lists of planes, in the same format.
+    :param stored_time: The sequence of timepoints to plot in the title.
+    :param scenes: The `dqp.Scene` of each Axes, filled in the first frame drawn in each Axes.
+    """
+    # The primitives are drawn once in the Axes of each process and only moved afterwards, see `dqp.Scene`
+    ax = plt.gca()
+    if ax not in scenes:
+        _set_plot_limits()
+        _set_plot_labels()
+
+        line_colors = ['r+-', 'k.-', 'g+-', 'c-.']
+        plane_colors = ['r', 'k', 'g', 'c']
+
+        scene = dqp.Scene(ax)
+        scene.add("x", DQ(stored_x[n]))
+        for line_counter in range(len(stored_l_dq[n])):
+            l_dq = stored_l_dq[n][line_counter]
+            scene.add(f"line{line_counter}", DQ(l_dq), line=True, scale=1,
+                      color=line_colors[line_counter % len(line_colors)])
+        for plane_counter in range(len(stored_pi_dq[n])):
+            pi_dq = stored_pi_dq[n][plane_counter]
+            scene.add(f"plane{plane_counter}", DQ(pi_dq), plane=True, scale=1,
+                      color=plane_colors[plane_counter % len(plane_colors)], alpha=0.2)
+        scenes[ax] = scene
+    else:
+        scene = scenes[ax]
+        scene.update("x", stored_x[n])
+        for line_counter in range(len(stored_l_dq[n])):
+            scene.update(f"line{line_counter}", stored_l_dq[n][line_counter])
+        for plane_counter in range(len(stored_pi_dq[n])):
+            scene.update(f"plane{plane_counter}", stored_pi_dq[n][plane_counter])
+        scene.flush()
+
+    plt.title(f'Animation time={stored_time[n]:.2f} s out of {stored_time[-1]:.2f} s')
+
+
 def output_moving_primitives():
     """
     Calculate and visualize multiple moving primitives represented as DQs.
@@ -38,7 +80,7 @@ def output_moving_primitives():
 
     # Sampling time [s]
     tau = 0.01
-    # Simulation time [s]
+    # Simulation time [s], which is also the length of the video because it plays in real time
     time_final = 1
     # Store the plotted variables
     stored_x = []
@@ -57,10 +99,10 @@ def output_moving_primitives():
         ls_dq = [Ad(x, l_dq_init) for l_dq_init in ls_dq_init]
         pis_dq = [Adsharp(x, pi_dq_init) for pi_dq_init in pis_dq_init]
 
-        # Store data for posterior animation
-        stored_x.append(x)
-        stored_l_dq.append(ls_dq)
-        stored_pi_dq.append(pis_dq)
+        # Store data for posterior animation, as arrays that can be sent to the processes rendering the frames
+        stored_x.append(x.vec8())
+        stored_l_dq.append([l_dq.vec8() for l_dq in ls_dq])
+        stored_pi_dq.append([pi_dq.vec8() for pi_dq in pis_dq])
         stored_time.append(time)
 
         # Move x
@@ -68,35 +110,16 @@ def output_moving_primitives():
         t = 0.1*(i_ + j_ + k_) * sin(time)
         x = r + 0.5 * E_ * t * r
 
-    def animate_plot(n, stored_x, stored_l_dq, stored_pi_dq, stored_time):
-
-        plt.cla()
-        _set_plot_limits()
-        _set_plot_labels()
-        plt.title(f'Animation time={stored_time[n]:.2f} s out of {stored_time[-1]:.2f} s')
-
-        dqp.plot(stored_x[n])
-
-        line_colors = ['r+-', 'k.-', 'g+-', 'c-.']
-        plane_colors = ['r', 'k', 'g', 'c']
-
-        for line_counter in range(len(stored_l_dq[n])):
-            l_dq = stored_l_dq[n][line_counter]
-            dqp.plot(l_dq, line=True, scale=1, color=line_colors[line_counter % len(line_colors)])
-        for plane_counter in range(len(stored_pi_dq[n])):
-            pi_dq = stored_pi_dq[n][plane_counter]
-            dqp.plot(pi_dq, plane=True, scale=1, color=plane_colors[plane_counter % len(plane_colors)], alpha=0.2)
-
-    # Set up the plot
-    fig = plt.figure(dpi=200, figsize=(12, 10))
-    plt.axes(projection='3d')
-
-    anim = anm.FuncAnimation(fig,
-                      partial(animate_plot,
-                              stored_x=stored_x,
-                              stored_l_dq=stored_l_dq,
-                              stored_pi_dq=stored_pi_dq,
-                              stored_time=stored_time),
-                      frames=len(stored_x))
-
-    anim.save("output_moving_primitives.mp4")
\ No newline at end of file
+    # Render the frames in parallel and save the animation
+    dqp.save_animation("output_moving_primitives.mp4",
+                       partial(_animate_plot,
+                               stored_x=stored_x,
+                               stored_l_dq=stored_l_dq,
+                               stored_pi_dq=stored_pi_dq,
+                               stored_time=stored_time,
+                               scenes={}),
+                       frames=len(stored_x),
+                       # Only the samples shown in a real-time video are rendered, see `dqp.frame_indices`
+                       times=stored_time,
+                       fps=30,
+                       figure_kwargs=dict(dpi=200, figsize=(12, 10)))
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import numpy as np
+import pytest
+
+
+def _random_unit_dq(rng: np.random.Generator) -> DQ:
+    """
+    :param rng: The random number generator.
+    :return: A unit DQ with a random rotation and a random translation.
+    """
+    r = normalize(DQ(rng.standard_normal(4)))
+    t = DQ(np.concatenate(([0.0], rng.uniform(-1.0, 1.0, 3))))
+    return r + 0.5 * E_ * t * r
+
+
+@pytest.fixture
+def random_unit_dq():
+    """
+    A function that draws a random unit DQ from a `np.random.Generator`.
+    """
+    return _random_unit_dq
+
+
+@pytest.fixture(autouse=True)
+def restore_options():
+    """
+    Restore the global options after each test, and start each test with an empty kinematics cache.
+    """
+    import dqrobotics_extensions.pyplot as dqp
+    options = dqp.get_options()
+    dqp.fkm_cache_invalidate()
+    yield
+    dqp.set_options(**options)
+
+
+@pytest.fixture
+def ax():
+    """
+    A 3D Axes of a new figure, closed after the test.
+    """
+    from matplotlib import pyplot as plt
+    fig = plt.figure()
+    yield fig.add_subplot(projection="3d")
+    plt.close(fig)
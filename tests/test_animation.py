@@ -0,0 +1,78 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+
+from matplotlib import animation as anm
+
+import numpy as np
+from PIL import Image
+
+
+def _samples(n: int, consumed: list):
+    """
+    Yield `n` samples of the joint configurations of a KukaLw4Robot, counting those consumed.
+    """
+    for i in range(n):
+        consumed.append(i)
+        yield 0.1 * i, np.full(7, 0.1 * i)
+
+
+def test_animate_stream_draws_the_first_sample_on_init(ax):
+    robot = KukaLw4Robot.kinematics()
+    consumed = []
+    anim = dqp.animate_stream(_samples(5, consumed), robot=robot, ax=ax)
+    assert consumed == [0]
+    assert not anim._repeat
+
+    anim._init_draw()
+    assert consumed == [0]
+    assert ax.get_title() == "time=0.00 s"
+    lines = len(ax.lines)
+
+    # The first frame is the first sample again, which does not create artists nor consume another sample
+    anim._draw_next_frame(next(anim.new_frame_seq()), blit=False)
+    assert consumed == [0]
+    assert len(ax.lines) == lines
+    assert ax.get_title() == "time=0.00 s"
+
+
+def test_animate_stream_saves_every_sample_once(ax, tmp_path):
+    robot = KukaLw4Robot.kinematics()
+    consumed = []
+    anim = dqp.animate_stream(_samples(4, consumed), robot=robot, ax=ax, trail_length=10, save_count=4)
+    anim.save(tmp_path / "stream.gif", writer=anm.PillowWriter(fps=10))
+    assert consumed == [0, 1, 2, 3]
+    assert ax.get_title() == "time=0.30 s"
+    with Image.open(tmp_path / "stream.gif") as image:
+        assert image.n_frames == 4
+
+    # The trail has one point per sample, also for the first sample drawn on init and as the first frame
+    trail = ax.lines[-1].get_data_3d()
+    expected = np.array([translation(robot.fkm(np.full(7, 0.1 * i))).vec3() for i in range(4)])
+    np.testing.assert_allclose(np.transpose(trail), expected, atol=1e-12)
+
+
+def test_animate_stream_of_no_samples(ax):
+    anim = dqp.animate_stream(iter(()), ax=ax)
+    anim._init_draw()
+    assert ax.get_title() == ""
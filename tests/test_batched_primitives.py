@@ -0,0 +1,157 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import dqrobotics_extensions.pyplot as dqp
+from dqrobotics_extensions.pyplot import _pyplot
+
+from matplotlib import colors as mcolors
+from matplotlib.collections import PathCollection
+import numpy as np
+import pytest
+
+# The module-level functions with two leading underscores are not name-mangled outside of classes.
+_unit_sphere_mesh = getattr(_pyplot, "__unit_sphere_mesh")
+
+_N = 6
+_COLORS = ["r", "g", "b", "#ff8000", "k", (0.2, 0.4, 0.6)]
+_ALPHAS = [0.1, 0.3, 0.5, 0.7, 0.9, 1.0]
+
+
+def _random_plane(rng) -> DQ:
+    n = normalize(DQ(np.concatenate(([0.0], rng.standard_normal(3)))))
+    return n + E_ * rng.uniform(-1.0, 1.0)
+
+
+def _random_point(rng) -> DQ:
+    return DQ(np.concatenate(([0.0], rng.uniform(-1.0, 1.0, 3))))
+
+
+def _faces_and_colors(collections) -> tuple:
+    """
+    :return: The polygons and the RGBA face colors of Poly3DCollections, concatenated in order.
+    """
+    # The 3D data of the collections is only exposed through these attributes of mplot3d. `get_facecolor` would return
+    # the colors sorted by depth in the last projection.
+    faces = np.concatenate([np.asarray(collection._faces) for collection in collections])
+    colors = []
+    for collection in collections:
+        collection_colors = np.array(collection._facecolor3d)
+        if collection.get_alpha() is not None:
+            collection_colors[:, 3] = collection.get_alpha()
+        colors.append(collection_colors)
+    return faces, np.concatenate(colors)
+
+
+def _sorted_segments(segments) -> np.ndarray:
+    """
+    :return: The segments of a quiver in a fixed order. A quiver of many arrows groups the shafts and the heads of all
+        arrows, instead of the shaft and the heads of each arrow.
+    """
+    segments = np.asarray(segments).reshape(-1, 6)
+    return segments[np.lexsort(segments.T[::-1])]
+
+
+def _pose_data(poses) -> list:
+    centres, *arrows = poses
+    return [np.array(centres.get_data_3d()).T] + [np.asarray(arrow._segments3d) for arrow in arrows]
+
+
+def test_poses_match_single_poses(ax, random_unit_dq):
+    rng = np.random.default_rng(0)
+    xs = [random_unit_dq(rng) for _ in range(_N)]
+    batch = _pose_data(_pyplot._plot_poses(xs, length=0.2, ax=ax))
+    singles = [_pose_data(_pyplot._plot_pose(x, length=0.2, ax=ax)) for x in xs]
+
+    np.testing.assert_allclose(batch[0], np.concatenate([single[0] for single in singles]), atol=1e-12)
+    for i in range(1, 4):
+        np.testing.assert_allclose(_sorted_segments(batch[i]),
+                                   _sorted_segments(np.concatenate([single[i] for single in singles])),
+                                   atol=1e-12)
+    # The arrays of vec8 give the same frames as the DQs
+    for data, expected in zip(_pose_data(_pyplot._plot_poses(np.array([x.vec8() for x in xs]), length=0.2, ax=ax)),
+                              batch):
+        np.testing.assert_allclose(data, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("color, alpha", [("c", 0.4), (_COLORS, _ALPHAS)], ids=["shared style", "per-item style"])
+def test_planes_match_single_planes(ax, color, alpha):
+    rng = np.random.default_rng(1)
+    planes = [_random_plane(rng) for _ in range(_N)]
+    batch = _pyplot._plot_planes(planes, length_x=0.5, length_y=0.3, color=color, alpha=alpha, ax=ax)
+    colors, alphas = (value if isinstance(value, list) else [value] * _N for value in (color, alpha))
+    singles = [_pyplot._plot_plane(plane, length_x=0.5, length_y=0.3, color=c, alpha=a, ax=ax)
+               for plane, c, a in zip(planes, colors, alphas)]
+
+    for data, expected in zip(_faces_and_colors([batch]), _faces_and_colors(singles)):
+        np.testing.assert_allclose(data, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("color, alpha", [("c", 0.4), (_COLORS, _ALPHAS)], ids=["shared style", "per-item style"])
+def test_spheres_match_single_spheres(ax, color, alpha):
+    rng = np.random.default_rng(2)
+    points = [_random_point(rng) for _ in range(_N)]
+    radii = rng.uniform(0.05, 0.2, _N)
+    batch = _pyplot._plot_spheres(points, radius=radii, color=color, alpha=alpha, resolution=8, ax=ax)
+    colors, alphas = (value if isinstance(value, list) else [value] * _N for value in (color, alpha))
+    singles = [_pyplot._plot_sphere(p, radius=r, color=c, alpha=a, resolution=8, ax=ax)
+               for p, r, c, a in zip(points, radii, colors, alphas)]
+
+    for data, expected in zip(_faces_and_colors([batch]), _faces_and_colors(singles)):
+        np.testing.assert_allclose(data, expected, atol=1e-12)
+
+    # The centres can also be given as an array of shape (N, 3)
+    centres = np.array([p.q[1:4] for p in points])
+    batch_centres = _pyplot._plot_spheres(centres, radius=radii, color=color, alpha=alpha, resolution=8, ax=ax)
+    np.testing.assert_allclose(batch_centres._faces, batch._faces, atol=1e-12)
+
+
+def test_spheres_above_the_threshold_are_markers(ax):
+    rng = np.random.default_rng(3)
+    centres = rng.uniform(-1.0, 1.0, (_N, 3))
+    radii = rng.uniform(0.05, 0.2, _N)
+
+    dqp.set_options(sphere_scatter_threshold=_N)
+    meshes = _pyplot._plot_spheres(centres, radius=radii, color=_COLORS, alpha=_ALPHAS, resolution=8, ax=ax)
+    assert len(meshes._faces) == _N * 7 * 7
+
+    dqp.set_options(sphere_scatter_threshold=_N - 1)
+    markers = _pyplot._plot_spheres(centres, radius=radii, color=_COLORS, alpha=_ALPHAS, ax=ax)
+    np.testing.assert_allclose(np.column_stack(markers._offsets3d), centres)
+    # The area of each marker is proportional to the square of its radius
+    sizes = markers.get_sizes()
+    np.testing.assert_allclose(sizes / sizes[0], (radii / radii[0]) ** 2)
+    expected_colors = mcolors.to_rgba_array(_COLORS)
+    expected_colors[:, 3] = _ALPHAS
+    # The colors before they are sorted by depth, see `Path3DCollection.get_facecolor`
+    np.testing.assert_allclose(PathCollection.get_facecolor(markers), expected_colors)
+
+
+def test_sphere_meshes_are_cached(ax):
+    dqp.mesh_cache_clear()
+    mesh = _unit_sphere_mesh(8)
+    assert _unit_sphere_mesh(8) is mesh
+    assert _unit_sphere_mesh(9) is not mesh
+    assert all(not grid.flags.writeable for grid in mesh)
+
+    _pyplot._plot_spheres(np.zeros((2, 3)), radius=0.1, resolution=8, ax=ax)
+    _pyplot._plot_sphere(i_, radius=0.1, resolution=8, ax=ax)
+    info = dqp.mesh_cache_info()["sphere"]
+    assert (info.hits, info.misses, info.currsize) == (3, 2, 2)
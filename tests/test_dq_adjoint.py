@@ -0,0 +1,103 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+from dqrobotics_extensions.pyplot import _pyplot
+
+import numpy as np
+import pytest
+
+# The module-level functions with two leading underscores are not name-mangled outside of classes.
+_dq_adjoint = getattr(_pyplot, "__dq_adjoint")
+_dq_adjoint_grid = getattr(_pyplot, "__dq_adjoint_grid")
+_cylinder_grid = getattr(_pyplot, "__cylinder_grid")
+_unit_sphere_mesh = getattr(_pyplot, "__unit_sphere_mesh")
+_unit_cylinder_mesh = getattr(_pyplot, "__unit_cylinder_mesh")
+_cylinders_polygons = getattr(_pyplot, "__cylinders_polygons")
+_surface_polygons = getattr(_pyplot, "__surface_polygons")
+
+
+def _per_point_adjoint_grid(x: DQ, x_grid, y_grid, z_grid):
+    """
+    The original implementation of `__dq_adjoint_grid`, calling `__dq_adjoint` for each point.
+    """
+    x_grid_ad = np.zeros(x_grid.shape)
+    y_grid_ad = np.zeros(x_grid.shape)
+    z_grid_ad = np.zeros(x_grid.shape)
+    for index in np.ndindex(x_grid.shape):
+        p = x_grid[index] * i_ + y_grid[index] * j_ + z_grid[index] * k_
+        p_prime = _dq_adjoint(x, p)
+        x_grid_ad[index], y_grid_ad[index], z_grid_ad[index] = p_prime.q[1:4]
+    return x_grid_ad, y_grid_ad, z_grid_ad
+
+
+def _plane_local_grid(length_x: float, length_y: float):
+    x_grid, y_grid = np.meshgrid(np.linspace(-length_x / 2.0, length_x / 2.0, 2),
+                                 np.linspace(-length_y / 2.0, length_y / 2.0, 2))
+    return x_grid, y_grid, np.zeros(x_grid.shape)
+
+
+def _sphere_local_grid(radius: float):
+    return tuple(radius * grid for grid in _unit_sphere_mesh(10))
+
+
+def _cylinder_local_grid(radius: float, height_z: float):
+    x_unit, y_unit, z_unit = _unit_cylinder_mesh(10)
+    return radius * x_unit, radius * y_unit, height_z * z_unit
+
+
+@pytest.mark.parametrize("local_grid", [_plane_local_grid(1.0, 2.0),
+                                        _sphere_local_grid(0.3),
+                                        _cylinder_local_grid(0.02, 0.07)],
+                         ids=["plane", "sphere", "cylinder"])
+def test_dq_adjoint_grid_matches_per_point(local_grid, random_unit_dq):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        x = random_unit_dq(rng)
+        expected = _per_point_adjoint_grid(x, *local_grid)
+        for grid, expected_grid in zip(_dq_adjoint_grid(x, *local_grid), expected):
+            assert grid.shape == expected_grid.shape
+            np.testing.assert_allclose(grid, expected_grid, atol=1e-12)
+
+
+def test_cylinder_grid_matches_per_point(random_unit_dq):
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        x = random_unit_dq(rng)
+        # The cylinder maps a point p to t + r p r*, that is, `__dq_adjoint` of -p
+        expected = _per_point_adjoint_grid(x, *(-grid for grid in _cylinder_local_grid(0.02, 0.07)))
+        for grid, expected_grid in zip(_cylinder_grid(x, height_z=0.07, radius=0.02, resolution=10), expected):
+            np.testing.assert_allclose(grid, expected_grid, atol=1e-12)
+
+
+def test_dq_adjoint_grid_rejects_different_shapes():
+    with pytest.raises(RuntimeError):
+        _dq_adjoint_grid(DQ([1]), np.zeros((2, 2)), np.zeros((2, 3)), np.zeros((2, 2)))
+
+
+def test_cylinder_grid_matches_batched_cylinders(random_unit_dq):
+    rng = np.random.default_rng(2)
+    xs = [random_unit_dq(rng) for _ in range(5)]
+    scales = np.array([[0.02, 0.02, 0.07], [0.03, 0.03, 0.1], [0.02, 0.02, 0.07], [0.01, 0.01, 0.2], [0.05, 0.05, 0.05]])
+
+    polygons = _cylinders_polygons(np.array([x.vec8() for x in xs]), scales, 10)
+    expected = [_surface_polygons(*_cylinder_grid(x, height_z=height_z, radius=radius, resolution=10))
+                for x, (radius, _, height_z) in zip(xs, scales)]
+    np.testing.assert_allclose(polygons, np.concatenate(expected), atol=1e-12)
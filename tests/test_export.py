@@ -0,0 +1,101 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import shutil
+import subprocess
+
+import dqrobotics_extensions.pyplot as dqp
+
+import matplotlib
+from matplotlib import pyplot as plt
+
+import numpy as np
+import pytest
+
+_FFMPEG = matplotlib.rcParams["animation.ffmpeg_path"]
+pytestmark = pytest.mark.skipif(shutil.which(_FFMPEG) is None, reason="ffmpeg is not available.")
+
+_N_FRAMES = 12
+_SIZE = 32
+
+
+def _draw_gray(n):
+    """
+    Fill the frame `n` with a gray level that increases with `n`. It is defined at module level so that it can be sent
+    to the worker processes with any start method.
+    """
+    level = n / (_N_FRAMES - 1)
+    plt.gcf().set_facecolor((level, level, level))
+    plt.gca().set_visible(False)
+
+
+def _frame_levels(filename) -> np.ndarray:
+    """
+    Decode a video into the mean gray level of each frame, from 0 to 1.
+    """
+    raw = subprocess.run([_FFMPEG, "-loglevel", "error", "-i", str(filename), "-f", "rawvideo", "-pix_fmt", "gray", "-"],
+                         capture_output=True,
+                         check=True).stdout
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, _SIZE * _SIZE).mean(axis=1) / 255.0
+
+
+@pytest.mark.parametrize("start_method", [None, "spawn"])
+def test_frames_are_written_in_order(tmp_path, start_method):
+    filename = tmp_path / "order.mp4"
+    # Single-frame chunks on two workers, so that the frames are rendered interleaved
+    dqp.save_animation(str(filename),
+                       _draw_gray,
+                       frames=_N_FRAMES,
+                       figure_kwargs=dict(figsize=(1, 1), dpi=_SIZE),
+                       processes=2,
+                       chunksize=1,
+                       start_method=start_method)
+
+    levels = _frame_levels(filename)
+    assert len(levels) == _N_FRAMES
+    np.testing.assert_allclose(levels, np.linspace(0.0, 1.0, _N_FRAMES), atol=0.05)
+
+
+def test_times_select_the_frames_shown(tmp_path):
+    filename = tmp_path / "times.mp4"
+    # 12 samples 0.1 s apart become the frames at 0, 0.2, ..., 1.0 s and the last sample at 1.1 s
+    dqp.save_animation(str(filename),
+                       _draw_gray,
+                       frames=_N_FRAMES,
+                       times=0.1 * np.arange(_N_FRAMES),
+                       fps=5,
+                       figure_kwargs=dict(figsize=(1, 1), dpi=_SIZE),
+                       processes=1)
+
+    levels = _frame_levels(filename)
+    np.testing.assert_allclose(levels, np.array([0, 2, 4, 6, 8, 10, 11]) / (_N_FRAMES - 1), atol=0.05)
+
+
+@pytest.mark.parametrize("filename, codec, message", [("video.mp4", "no_such_codec", "no_such_codec"),
+                                                      ("missing/directory/video.mp4", "h264", "video.mp4")])
+def test_ffmpeg_failure_raises_with_its_messages(tmp_path, filename, codec, message):
+    with pytest.raises(RuntimeError, match="ffmpeg failed") as error:
+        dqp.save_animation(str(tmp_path / filename),
+                           _draw_gray,
+                           frames=_N_FRAMES,
+                           figure_kwargs=dict(figsize=(1, 1), dpi=_SIZE),
+                           processes=2,
+                           chunksize=1,
+                           codec=codec)
+    assert message in str(error.value)
@@ -0,0 +1,69 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH, DQ_SerialManipulatorDenso
+
+from dqrobotics_extensions.pyplot import fkm_all
+
+import numpy as np
+import pytest
+
+
+def _random_dh_matrix(rng: np.random.Generator, n: int) -> np.ndarray:
+    """
+    :param rng: The random number generator.
+    :param n: The number of joints.
+    :return: A (modified) DH matrix with random theta, d, a, and alpha, and both revolute and prismatic joints.
+    """
+    types = np.array([0, 1] * (n // 2) + [0] * (n % 2), dtype=float)
+    rng.shuffle(types)
+    return np.vstack((rng.uniform(-np.pi, np.pi, n),
+                      rng.uniform(-0.5, 0.5, n),
+                      rng.uniform(-0.5, 0.5, n),
+                      rng.uniform(-np.pi, np.pi, n),
+                      types))
+
+
+def _assert_same_as_fkm(robot, q):
+    x_joints = fkm_all(robot, q)
+    assert len(x_joints) == robot.get_dim_configuration_space()
+    for i, x in enumerate(x_joints):
+        np.testing.assert_allclose(x.vec8(), robot.fkm(q, i).vec8(), atol=1e-12)
+    np.testing.assert_allclose(x_joints[-1].vec8(), robot.fkm(q).vec8(), atol=1e-12)
+
+
+@pytest.mark.parametrize("robot_type", [DQ_SerialManipulatorDH, DQ_SerialManipulatorMDH], ids=["DH", "MDH"])
+def test_fkm_all_matches_fkm(robot_type, random_unit_dq):
+    rng = np.random.default_rng(0)
+    for n in (1, 4, 7):
+        robot = robot_type(_random_dh_matrix(rng, n))
+        robot.set_reference_frame(random_unit_dq(rng))
+        robot.set_effector(random_unit_dq(rng))
+        for _ in range(5):
+            _assert_same_as_fkm(robot, rng.uniform(-np.pi, np.pi, n))
+
+
+def test_fkm_all_falls_back_to_fkm(random_unit_dq):
+    rng = np.random.default_rng(1)
+    robot = DQ_SerialManipulatorDenso(rng.uniform(-0.5, 0.5, (6, 5)))
+    robot.set_reference_frame(random_unit_dq(rng))
+    robot.set_effector(random_unit_dq(rng))
+    for _ in range(5):
+        _assert_same_as_fkm(robot, rng.uniform(-np.pi, np.pi, 5))
@@ -0,0 +1,99 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import gc
+
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+from dqrobotics_extensions.pyplot._kinematics import _fkm_all_cached
+
+import numpy as np
+
+
+def _assert_same_as_fkm(robot, q, x_joints):
+    for i, x in enumerate(x_joints):
+        np.testing.assert_allclose(x.vec8(), robot.fkm(q, i).vec8(), atol=1e-12)
+
+
+def test_equal_q_is_a_hit():
+    robot = KukaLw4Robot.kinematics()
+    q = np.linspace(-1.0, 1.0, 7)
+    _fkm_all_cached(robot, q)
+    x_joints = _fkm_all_cached(robot, q.copy())
+    info = dqp.fkm_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    _assert_same_as_fkm(robot, q, x_joints)
+
+
+def test_reference_frame_and_effector_are_misses(random_unit_dq):
+    rng = np.random.default_rng(0)
+    robot = KukaLw4Robot.kinematics()
+    q = np.linspace(-1.0, 1.0, 7)
+    _fkm_all_cached(robot, q)
+
+    robot.set_reference_frame(random_unit_dq(rng))
+    _assert_same_as_fkm(robot, q, _fkm_all_cached(robot, q))
+    robot.set_effector(random_unit_dq(rng))
+    _assert_same_as_fkm(robot, q, _fkm_all_cached(robot, q))
+    assert dqp.fkm_cache_info().misses == 3
+
+
+def test_invalidate_removes_only_that_robot():
+    robot_a = KukaLw4Robot.kinematics()
+    robot_b = KukaLw4Robot.kinematics()
+    dqp.fkm_cache_precompute(robot_a, np.zeros((3, 7)) + np.arange(3)[:, None])
+    dqp.fkm_cache_precompute(robot_b, np.zeros((2, 7)))
+    assert dqp.fkm_cache_info().currsize == 4
+
+    dqp.fkm_cache_invalidate(robot_a)
+    assert dqp.fkm_cache_info().currsize == 1
+    dqp.fkm_cache_invalidate()
+    assert dqp.fkm_cache_info() == (0, 0, dqp.get_options()["fkm_cache_size"], 0)
+
+
+def test_size_zero_disables_the_cache():
+    robot = KukaLw4Robot.kinematics()
+    qs = np.zeros((50, 7)) + np.linspace(0.0, 1.0, 50)[:, None]
+    dqp.fkm_cache_precompute(robot, qs)
+    assert dqp.fkm_cache_info().currsize == 50
+
+    dqp.set_options(fkm_cache_size=10)
+    assert dqp.fkm_cache_info().currsize == 10
+
+    dqp.set_options(fkm_cache_size=0)
+    assert dqp.fkm_cache_info().currsize == 0
+    for q in qs[:4]:
+        _assert_same_as_fkm(robot, q, _fkm_all_cached(robot, q))
+    dqp.fkm_cache_precompute(robot, qs)
+    info = dqp.fkm_cache_info()
+    assert (info.hits, info.currsize) == (0, 0)
+
+
+def test_garbage_collected_robot_is_removed():
+    robot = KukaLw4Robot.kinematics()
+    other = KukaLw4Robot.kinematics()
+    dqp.fkm_cache_precompute(robot, np.zeros((3, 7)) + np.arange(3)[:, None])
+    _fkm_all_cached(other, np.zeros(7))
+    assert dqp.fkm_cache_info().currsize == 4
+
+    del robot
+    gc.collect()
+    assert dqp.fkm_cache_info().currsize == 1
@@ -0,0 +1,77 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+from dqrobotics_extensions.pyplot import _pyplot
+
+from matplotlib import colors as mcolors
+from matplotlib.axes._base import _process_plot_format
+import numpy as np
+import pytest
+
+# The module-level functions with two leading underscores are not name-mangled outside of classes.
+_parse_format = getattr(_pyplot, "__parse_format")
+
+
+@pytest.mark.parametrize("fmt", ["r+-", "C1--", "k:", "#ff8000", "red", "tab:blue", "0.5", "r", "+", "--", "-.", "ro",
+                                 "o--r", "C12", "g^:", "1", "w,"])
+def test_parse_format_matches_matplotlib(fmt):
+    assert _parse_format(fmt) == _process_plot_format(fmt)
+
+
+@pytest.mark.parametrize("fmt", ["rr", "r--:", "C", "Cx", "q", "++", "red-", "0"])
+def test_invalid_format_raises(fmt):
+    with pytest.raises(ValueError):
+        _process_plot_format(fmt)
+    with pytest.raises(RuntimeError, match="format string"):
+        _parse_format(fmt)
+
+
+@pytest.mark.parametrize("fmt, linestyle, linewidth, marker", [("r+-", "solid", 1.5, "+"),
+                                                               ("C1--", "dashed", 1.5, None),
+                                                               ("k:", "dotted", 1.5, None),
+                                                               ("#ff8000", "solid", 1.5, None),
+                                                               ("gx", "solid", 0.0, "x")])
+def test_plot_lines_use_the_format(ax, fmt, linestyle, linewidth, marker):
+    ls_dq = [i_, j_ + E_ * k_]
+    lines, markers = _pyplot._plot_lines(ls_dq, color=fmt, length=1.0, ax=ax)
+    _, expected_marker, expected_color = _process_plot_format(fmt)
+    if expected_color is None:
+        expected_color = "r"
+
+    np.testing.assert_allclose(lines.get_color()[0], mcolors.to_rgba(expected_color))
+    assert lines.get_linewidth()[0] == pytest.approx(linewidth)
+    assert _dashes_name(lines) == linestyle
+    if marker is None:
+        assert markers is None
+    else:
+        assert markers.get_marker() == expected_marker
+        assert markers.get_linestyle() == "None"
+        assert len(markers.get_data_3d()[0]) == 4
+
+
+def _dashes_name(collection) -> str:
+    """
+    :return: "solid", "dashed", or "dotted" from the dash pattern of a collection.
+    """
+    offset, dashes = collection.get_dashes()[0]
+    if dashes is None:
+        return "solid"
+    return "dashed" if dashes[0] > dashes[1] else "dotted"
@@ -0,0 +1,162 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+
+from matplotlib import pyplot as plt
+import numpy as np
+import pytest
+
+
+def _line_data(line) -> np.ndarray:
+    return np.array(line.get_data_3d())
+
+
+def _segments(collection) -> np.ndarray:
+    # The 3D data of the collections is only exposed through these attributes of mplot3d
+    return np.asarray(collection._segments3d)
+
+
+def _faces(collection) -> np.ndarray:
+    return np.asarray(collection._faces)
+
+
+def _face_colors(collection) -> np.ndarray:
+    # `get_facecolor` returns the colors sorted by depth in the last projection
+    return np.asarray(collection._facecolor3d)
+
+
+def _handle_data(handle: dqp.SerialManipulatorHandle) -> list:
+    """
+    :return: The vertex data of all artists of the handle, in a fixed order.
+    """
+    data = [_line_data(handle.line)]
+    for centre, *arrows in handle.poses:
+        data.append(_line_data(centre))
+        data.extend(_segments(arrow) for arrow in arrows)
+    for cylinder in handle.cylinders:
+        data.append(_faces(cylinder))
+        data.append(_face_colors(cylinder))
+    return data
+
+
+@pytest.fixture
+def robot(random_unit_dq):
+    robot = KukaLw4Robot.kinematics()
+    # The arrowheads of axes that are exactly vertical are turned by the round-off errors of the poses, so no axis of
+    # the reference frame is left aligned with the z-axis
+    robot.set_reference_frame(random_unit_dq(np.random.default_rng(1)))
+    return robot
+
+
+@pytest.mark.parametrize("validation", ["strict", "once-per-batch", "off"])
+def test_update_matches_new_plot(ax, robot, validation):
+    rng = np.random.default_rng(0)
+    handle = dqp.plot(robot, q=rng.uniform(-np.pi, np.pi, 7), ax=ax, validation=validation)
+    for _ in range(3):
+        q = rng.uniform(-np.pi, np.pi, 7)
+        assert handle.update(q, validation=validation) is handle
+
+        figure = plt.figure()
+        expected = dqp.plot(robot, q=q, ax=figure.add_subplot(projection="3d"))
+        plt.close(figure)
+
+        for data, expected_data in zip(_handle_data(handle), _handle_data(expected), strict=True):
+            np.testing.assert_allclose(data, expected_data, atol=1e-12)
+
+
+def test_update_does_not_create_artists(ax, robot):
+    handle = dqp.plot(robot, q=np.zeros(7), ax=ax)
+    n_artists = len(ax.get_children())
+    handle.update(np.ones(7))
+    assert len(ax.get_children()) == n_artists
+    assert all(artist.axes is ax for artist in handle.artists)
+
+    handle.remove()
+    assert all(artist.axes is None for artist in handle.artists)
+
+
+def _batch_handle_data(handle: dqp.SerialManipulatorsHandle) -> list:
+    """
+    :return: The vertex data of all artists of the handle, in a fixed order.
+    """
+    centres, *arrows = handle.poses
+    return ([_segments(handle.links), _line_data(centres)] + [_segments(arrow) for arrow in arrows] +
+            [_faces(handle.cylinders), _face_colors(handle.cylinders)])
+
+
+@pytest.fixture
+def robots(robot, random_unit_dq):
+    other = KukaLw4Robot.kinematics()
+    other.set_reference_frame(random_unit_dq(np.random.default_rng(2)))
+    return [robot, other]
+
+
+@pytest.mark.parametrize("validation", ["strict", "once-per-batch", "off"])
+def test_batch_update_matches_new_batch_plot(ax, robots, validation):
+    rng = np.random.default_rng(3)
+    style = dict(line_color=["r", "b"], cylinder_color=["k", "c"], cylinder_alpha=[0.9, 0.3], cylinder_radius=0.035)
+    handle = dqp.plot([(robot, rng.uniform(-np.pi, np.pi, 7)) for robot in robots], ax=ax, **style)
+    for _ in range(3):
+        qs = rng.uniform(-np.pi, np.pi, (2, 7))
+        assert handle.update(list(qs), validation=validation) is handle
+
+        figure = plt.figure()
+        expected = dqp.plot([[robot, q] for robot, q in zip(robots, qs)], ax=figure.add_subplot(projection="3d"), **style)
+        plt.close(figure)
+
+        for data, expected_data in zip(_batch_handle_data(handle), _batch_handle_data(expected), strict=True):
+            np.testing.assert_allclose(data, expected_data, atol=1e-12)
+
+
+def test_batch_plot_matches_single_plots(ax, robots):
+    rng = np.random.default_rng(4)
+    qs = rng.uniform(-np.pi, np.pi, (2, 7))
+    handle = dqp.plot(list(zip(robots, qs)), ax=ax, cylinder_color=["k", "c"], cylinder_alpha=[0.9, 0.3])
+    singles = [dqp.plot(robot, q=q, ax=ax, cylinder_color=color, cylinder_alpha=alpha)
+               for robot, q, color, alpha in zip(robots, qs, ["k", "c"], [0.9, 0.3])]
+
+    np.testing.assert_allclose(_segments(handle.links), [_line_data(single.line).T for single in singles], atol=1e-12)
+    # Both draw the cylinders with the same vertices and shading
+    cylinders = [cylinder for single in singles for cylinder in single.cylinders]
+    np.testing.assert_allclose(_faces(handle.cylinders), np.concatenate([_faces(c) for c in cylinders]), atol=1e-12)
+    np.testing.assert_allclose(_face_colors(handle.cylinders),
+                               np.concatenate([_face_colors(c) for c in cylinders]),
+                               atol=1e-12)
+
+
+@pytest.mark.parametrize("entries", [lambda robot, q: [(robot, q), robot],
+                                     lambda robot, q: [(robot,)],
+                                     lambda robot, q: [(robot, q, q)],
+                                     lambda robot, q: [[robot, q], (q, robot)]],
+                         ids=["bare robot", "missing q", "extra element", "swapped pair"])
+def test_malformed_pairs_raise(ax, robot, entries):
+    with pytest.raises(RuntimeError, match="pairs"):
+        dqp.plot(entries(robot, np.zeros(7)), ax=ax)
+
+
+def test_batch_plot_rejects_mismatched_styles_and_handles(ax, robots):
+    with pytest.raises(RuntimeError, match="one per robot"):
+        dqp.plot([(robot, np.zeros(7)) for robot in robots], line_color=["r", "g", "b"], ax=ax)
+
+    handle = dqp.plot([(robot, np.zeros(7)) for robot in robots], ax=ax)
+    with pytest.raises(RuntimeError, match="robots"):
+        handle.update([np.zeros(7)])
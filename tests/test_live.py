@@ -0,0 +1,100 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+import pytest
+
+
+def _assert_drawn(view, q):
+    np.testing.assert_allclose(view.handle.x_effector.vec8(), view.robot.fkm(q).vec8(), atol=1e-12)
+
+
+def test_live_view_counts_dropped_samples(ax):
+    robot = KukaLw4Robot.kinematics()
+    view = dqp.LiveView(robot, ax=ax)
+    assert not view.render()
+
+    # Only the latest of many samples published between two renders is drawn
+    for i in range(5):
+        view.publish(np.full(7, 0.1 * i), 0.01 * i)
+    assert view.render()
+    assert not view.render()
+    _assert_drawn(view, np.full(7, 0.4))
+    stats = view.stats
+    assert (stats.published, stats.rendered, stats.dropped_samples) == (5, 1, 4)
+
+    view.publish(np.full(7, 0.5))
+    assert view.render()
+    for i in range(3):
+        view.publish(np.full(7, 0.6 + 0.1 * i))
+    assert view.render()
+    _assert_drawn(view, np.full(7, 0.8))
+    stats = view.stats
+    assert (stats.published, stats.rendered, stats.dropped_samples) == (9, 3, 6)
+
+
+def test_live_view_copies_published_configurations(ax):
+    view = dqp.LiveView(KukaLw4Robot.kinematics(), ax=ax)
+    q = np.zeros(7)
+    view.publish(q)
+    q[:] = 1.0
+    view.render()
+    _assert_drawn(view, np.zeros(7))
+
+
+@pytest.mark.parametrize("validation", [None, "off", "strict", "once-per-batch"])
+def test_live_view_forwards_validation(ax, validation):
+    view = dqp.LiveView(KukaLw4Robot.kinematics(), ax=ax, validation=validation)
+    view.publish(np.zeros(7))
+    view.render()
+
+    calls = []
+    update = view.handle.update
+    view.handle.update = lambda q, validation=None: calls.append(validation) or update(q, validation=validation)
+    view.publish(np.full(7, 0.1))
+    view.render()
+    assert calls == [validation]
+
+
+def test_live_view_of_poses(ax):
+    view = dqp.LiveView(ax=ax, length=0.2)
+    view.publish(DQ([1]))
+    view.render()
+    x = normalize(1 + k_) * (1 + 0.5 * E_ * i_)
+    view.publish(x, 0.5)
+    assert view.render()
+    assert ax.get_title() == "time=0.50 s"
+    assert view.stats.rendered == 2
+
+
+def test_live_view_rejects_invalid_options(ax):
+    with pytest.raises(RuntimeError):
+        dqp.LiveView(ax=ax, fps=0)
+    view = dqp.LiveView(KukaLw4Robot.kinematics(), ax=ax)
+    view.start()
+    try:
+        with pytest.raises(RuntimeError):
+            view.start()
+    finally:
+        view.stop()
@@ -0,0 +1,91 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+import pytest
+
+
+def test_frame_indices_decimate_to_real_time():
+    # 101 samples 10 ms apart, with the rounding errors of np.arange
+    times = np.arange(0, 1 + 0.01, 0.01)
+    indices = dqp.frame_indices(times, fps=30)
+
+    assert len(indices) == 31
+    assert indices[0] == 0 and indices[-1] == 100
+    # Each frame shows the latest sample at its time
+    frames = dqp.frame_times(times, fps=30)
+    assert np.all(times[indices] <= frames + 1e-9)
+    assert np.all(times[np.minimum(indices + 1, 100)][:-1] > frames[:-1] - 1e-9)
+
+
+def test_sparse_samples_repeat_in_frames():
+    indices = dqp.frame_indices([0.0, 0.5, 1.0], fps=4)
+    np.testing.assert_array_equal(indices, [0, 0, 1, 1, 2])
+
+
+@pytest.mark.parametrize("times, fps", [([], 30), ([0.0, 0.2, 0.1], 30), ([0.0, 1.0], 0)],
+                         ids=["empty", "decreasing", "fps"])
+def test_invalid_inputs_raise(times, fps):
+    with pytest.raises(RuntimeError):
+        dqp.frame_indices(times, fps)
+
+
+def test_resample_interpolates_arrays():
+    times = [0.0, 0.1, 0.4]
+    qs = np.array([[0.0, 1.0], [1.0, 1.0], [4.0, -2.0]])
+    frame_time, frame_q = dqp.resample(times, qs, fps=10)
+
+    np.testing.assert_allclose(frame_time, [0.0, 0.1, 0.2, 0.3, 0.4])
+    np.testing.assert_allclose(frame_q, [[0, 1], [1, 1], [2, 0], [3, -1], [4, -2]], atol=1e-12)
+
+
+def test_resample_poses_are_unit_and_match_the_endpoints(random_unit_dq):
+    rng = np.random.default_rng(0)
+    times = np.sort(rng.uniform(0.0, 1.0, 12))
+    xs = [random_unit_dq(rng) for _ in times]
+    frame_time, frame_x = dqp.resample(times, xs, fps=30)
+
+    assert len(frame_x) == len(frame_time)
+    for x in frame_x:
+        assert is_unit(x)
+    np.testing.assert_allclose(frame_x[0].vec8(), xs[0].vec8(), atol=1e-12)
+    np.testing.assert_allclose(frame_x[-1].vec8(), xs[-1].vec8(), atol=1e-12)
+
+    # A frame at the time of a sample is that sample, and the other frames are between the two samples around them
+    for t, x in zip(frame_time, frame_x):
+        i = np.searchsorted(times, t, side="right") - 1
+        j = min(i + 1, len(times) - 1)
+        p, p0, p1 = (translation(y).q[1:4] for y in (x, xs[i], xs[j]))
+        s = 0.0 if j == i else (t - times[i]) / (times[j] - times[i])
+        np.testing.assert_allclose(p, (1 - s) * p0 + s * p1, atol=1e-9)
+
+
+def test_resample_without_interpolation_takes_the_latest_sample(random_unit_dq):
+    rng = np.random.default_rng(1)
+    times = np.arange(0, 1 + 0.01, 0.01)
+    xs = [random_unit_dq(rng) for _ in times]
+    _, frame_x = dqp.resample(times, xs, fps=30, interpolate=False)
+    assert frame_x == [xs[i] for i in dqp.frame_indices(times, fps=30)]
+
+    with pytest.raises(RuntimeError):
+        dqp.resample(times, xs[:-1], fps=30)
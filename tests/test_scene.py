@@ -0,0 +1,109 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+import pytest
+
+_NOT_UNIT = DQ([2, 0, 0, 0, 0, 0, 0, 0])
+
+
+def _centre(scene: dqp.Scene, name: str) -> np.ndarray:
+    """
+    :return: The position of the centre marker of a pose in the scene.
+    """
+    centre, *_ = scene._objects[name].artists
+    return np.ravel(centre.get_data_3d())
+
+
+@pytest.fixture
+def scene(ax, random_unit_dq):
+    rng = np.random.default_rng(0)
+    scene = dqp.Scene(ax)
+    for name in ("x1", "x2", "x3"):
+        scene.add(name, random_unit_dq(rng))
+    scene.add("l", k_, line=True)
+    scene.add("robot", KukaLw4Robot.kinematics(), q=np.zeros(7))
+    return scene
+
+
+@pytest.mark.parametrize("invalid", ["x2", "l"])
+def test_flush_moves_the_valid_objects(scene, random_unit_dq, invalid):
+    rng = np.random.default_rng(1)
+    old_values = {name: scene._objects[name].value.copy() for name in scene.names}
+    new_values = {"x1": random_unit_dq(rng), "x2": random_unit_dq(rng), "x3": random_unit_dq(rng), "l": i_,
+                  "robot": np.ones(7)}
+    new_values[invalid] = _NOT_UNIT
+    for name, value in new_values.items():
+        assert scene.update(name, value)
+
+    with pytest.raises(RuntimeError, match=f"'{invalid}'"):
+        scene.flush()
+
+    assert scene.dirty == []
+    for name, value in new_values.items():
+        if name == invalid:
+            np.testing.assert_array_equal(scene._objects[name].value, old_values[name])
+        elif isinstance(value, DQ):
+            np.testing.assert_array_equal(scene._objects[name].value, value.vec8())
+        else:
+            np.testing.assert_array_equal(scene._objects[name].value, value)
+    for name in ("x1", "x2", "x3"):
+        expected = old_values[name] if name == invalid else new_values[name].vec8()
+        np.testing.assert_allclose(_centre(scene, name), translation(DQ(expected)).q[1:4], atol=1e-12)
+    np.testing.assert_allclose(scene._objects["robot"].artists.x_effector.vec8(),
+                               KukaLw4Robot.kinematics().fkm(np.ones(7)).vec8(),
+                               atol=1e-12)
+
+    # The scene is still usable, the next flush has nothing left to do
+    assert scene.flush() == []
+
+
+def test_flush_changes_only_the_dirty_objects(scene, random_unit_dq):
+    x = random_unit_dq(np.random.default_rng(2))
+    scene.update("x1", x)
+    scene.update("x2", x)
+    scene.update("x2", scene._objects["x2"].value)
+
+    changed = scene.flush()
+    assert changed == scene._artists("x1")
+    np.testing.assert_allclose(_centre(scene, "x1"), translation(x).q[1:4], atol=1e-12)
+
+
+def test_update_back_to_the_drawn_value_is_clean(scene, random_unit_dq):
+    drawn = scene._objects["x1"].value.copy()
+    assert scene.update("x1", random_unit_dq(np.random.default_rng(3)))
+    assert scene.dirty == ["x1"]
+    assert not scene.update("x1", DQ(drawn))
+    assert scene.dirty == []
+    assert not scene.update("robot", np.zeros(7))
+    assert scene.flush() == []
+
+
+def test_update_rejects_unknown_names_and_sizes(scene):
+    with pytest.raises(RuntimeError, match="no object named"):
+        scene.update("missing", i_)
+    with pytest.raises(RuntimeError, match="7 elements"):
+        scene.update("robot", np.zeros(6))
+    with pytest.raises(RuntimeError, match="already has"):
+        scene.add("x1", DQ([1]))
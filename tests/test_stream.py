@@ -0,0 +1,105 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+import os
+import socket
+import time
+
+from dqrobotics import *
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+from dqrobotics_extensions.pyplot._stream import encode_message
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def address(request, tmp_path):
+    if request.param == "tcp":
+        return "127.0.0.1", 0
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("UNIX sockets are not available.")
+    return str(tmp_path / "dqp.sock")
+
+
+def _wait_received(server, n: int, timeout: float = 5.0):
+    """
+    Wait until the receiving thread of `server` decoded `n` messages.
+    """
+    deadline = time.monotonic() + timeout
+    while server.stats.received < n:
+        assert time.monotonic() < deadline, f"Only {server.stats.received} of {n} messages were received."
+        time.sleep(0.01)
+
+
+def test_stream_end_to_end(ax, address):
+    robot = KukaLw4Robot.kinematics()
+    scene = dqp.Scene(ax)
+    scene.add(0, robot, q=np.zeros(7))
+    scene.add(1, DQ([1]))
+
+    q_a, q_b, q_c = np.full(7, 0.1), np.full(7, 0.2), np.full(7, 0.3)
+    x_1 = 1 + 0.5 * E_ * i_
+    x_2 = normalize(1 + k_) * (1 + 0.5 * E_ * j_)
+
+    server = dqp.StreamServer(scene, address)
+    server.start()
+    try:
+        with dqp.StreamClient(server.address) as client:
+            # Many messages of the same robot between two calls of `apply`, only the latest is drawn
+            for q in (q_a, q_b, q_c):
+                client.send(0, q, 0.1)
+            client.send(1, x_1, 0.1)
+            _wait_received(server, 4)
+
+            # A message split across two sends of another client
+            message = encode_message(1, x_2, 0.2)
+            with socket.socket(socket.AF_INET if isinstance(server.address, tuple) else socket.AF_UNIX) as raw:
+                raw.connect(server.address)
+                raw.sendall(message[:13])
+                time.sleep(0.05)
+                raw.sendall(message[13:])
+                _wait_received(server, 5)
+
+            assert len(server.apply()) > 0
+            stats = server.stats
+            assert (stats.received, stats.applied, stats.dropped, stats.invalid) == (5, 2, 3, 0)
+            np.testing.assert_array_equal(scene._objects[0].value, q_c)
+            np.testing.assert_allclose(scene._objects[1].value, x_2.vec8())
+            assert server.times == {0: 0.1, 1: 0.2}
+
+            # A DQ sent to a manipulator, a pose that is not a unit DQ, and a robot id that is not in the scene
+            client.send(0, x_1)
+            client.send(1, 2.0 * x_1)
+            client.send(7, q_a)
+            _wait_received(server, 8)
+
+            assert server.apply() == []
+            stats = server.stats
+            assert (stats.received, stats.applied, stats.dropped, stats.invalid) == (8, 2, 3, 3)
+            np.testing.assert_array_equal(scene._objects[0].value, q_c)
+            np.testing.assert_allclose(scene._objects[1].value, x_2.vec8())
+            assert scene.dirty == []
+    finally:
+        server.stop()
+
+    if isinstance(address, str):
+        assert not os.path.exists(address)
@@ -0,0 +1,113 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+import pytest
+
+
+def _random_walk(n: int, seed: int) -> np.ndarray:
+    """
+    A path that often goes back on itself, with steps of very different sizes.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.standard_normal((n, 3)) * rng.choice([1e-4, 1e-2, 1e-1], size=(n, 1))
+    return np.cumsum(steps, axis=0)
+
+
+def _distances_to_polyline(points: np.ndarray, polyline: np.ndarray) -> np.ndarray:
+    """
+    :return: The distance of each point to the closest segment of the polyline.
+    """
+    first, last = polyline[:-1], polyline[1:]
+    direction = last - first
+    offsets = points[:, np.newaxis, :] - first[np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = np.nan_to_num(np.einsum("psk,sk->ps", offsets, direction) / np.sum(direction ** 2, axis=1))
+    fractions = np.clip(fractions, 0.0, 1.0)
+    return np.min(np.linalg.norm(offsets - fractions[..., np.newaxis] * direction, axis=2), axis=1)
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 1e-3, 5e-2])
+def test_removed_points_are_within_tolerance(ax, tolerance):
+    path = _random_walk(1000, seed=0)
+    trail = dqp.Trail(ax, tolerance=tolerance)
+    for i, point in enumerate(path):
+        trail.append(point)
+        # The trail always reaches the latest point
+        np.testing.assert_array_equal(trail.points[-1], point)
+
+    assert len(trail) < len(path) if tolerance > 0 else len(trail) <= len(path)
+    np.testing.assert_array_equal(trail.points[0], path[0])
+    assert np.all(_distances_to_polyline(path, trail.points) <= tolerance + 1e-12)
+    np.testing.assert_array_equal(np.array(trail.line.get_data_3d()).T, trail.points)
+
+
+def test_path_going_back_keeps_its_turning_point(ax):
+    # Along the x-axis from 0 to 3 and back to 1, so all points are on the line through the first and last points
+    x = np.concatenate((np.linspace(0.0, 3.0, 150), np.linspace(3.0, 1.0, 200)[1:]))
+    path = np.column_stack((x, np.zeros_like(x), np.zeros_like(x)))
+    trail = dqp.Trail(ax, tolerance=1e-3)
+    trail.extend(path)
+
+    assert np.all(_distances_to_polyline(path, trail.points) <= 1e-3)
+    assert np.max(trail.points[:, 0]) == 3.0
+
+
+@pytest.mark.parametrize("stride, tolerance, max_points", [(1, None, 50), (3, None, 50), (4, 1e-2, 20), (7, None, None)])
+def test_last_point_is_the_latest_and_length_is_bounded(ax, stride, tolerance, max_points):
+    path = _random_walk(600, seed=1)
+    trail = dqp.Trail(ax, stride=stride, tolerance=tolerance, max_points=max_points)
+    for i, point in enumerate(path):
+        trail.append(point)
+        np.testing.assert_array_equal(trail.points[-1], point)
+        if max_points is not None:
+            assert len(trail) <= max_points
+
+    if tolerance is None:
+        # Every stride-th point is kept, the last one being drawn until the next point arrives
+        expected = path[::stride]
+        if (len(path) - 1) % stride:
+            expected = np.vstack((expected, path[-1]))
+        if max_points is not None:
+            expected = expected[-max_points:]
+        np.testing.assert_array_equal(trail.points, expected)
+
+
+def test_append_accepts_poses_points_and_arrays(ax, random_unit_dq):
+    x = random_unit_dq(np.random.default_rng(2))
+    trail = dqp.Trail(ax)
+    trail.append(x)
+    trail.append(0.1 * i_ + 0.2 * j_)
+    trail.extend([[1.0, 2.0, 3.0], (4, 5, 6)])
+    np.testing.assert_allclose(trail.points, [translation(x).q[1:4], [0.1, 0.2, 0.0], [1, 2, 3], [4, 5, 6]])
+
+    trail.clear()
+    assert len(trail) == 0
+    trail.append(i_)
+    np.testing.assert_array_equal(trail.points, [[1.0, 0.0, 0.0]])
+
+
+@pytest.mark.parametrize("kwargs", [dict(stride=0), dict(tolerance=-1.0), dict(max_points=1)])
+def test_invalid_options_raise(ax, kwargs):
+    with pytest.raises(RuntimeError):
+        dqp.Trail(ax, **kwargs)
@@ -0,0 +1,102 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics_extensions.pyplot import TrajectoryWriter, TrajectoryFile
+
+import numpy as np
+import pytest
+
+
+def _write(path, n_samples: int, dim_q: int = 3, n_poses: int = 2):
+    """
+    Write a trajectory with known values, half of it sample by sample and half at once.
+    :return: The times, joint configurations, and poses that were written.
+    """
+    rng = np.random.default_rng(0)
+    times = 0.01 * np.arange(n_samples)
+    qs = rng.uniform(-np.pi, np.pi, (n_samples, dim_q))
+    poses = rng.uniform(-1.0, 1.0, (n_samples, n_poses, 8))
+    half = n_samples // 2
+    with TrajectoryWriter(str(path), dim_q=dim_q, n_poses=n_poses) as writer:
+        for i in range(half):
+            writer.append(times[i], qs[i], poses[i])
+        writer.extend(times[half:], qs[half:], poses[half:])
+    return times, qs, poses
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "log.dqtraj"
+    times, qs, poses = _write(path, 25)
+
+    trajectory = TrajectoryFile(str(path))
+    assert len(trajectory) == 25
+    assert (trajectory.dim_q, trajectory.n_poses) == (3, 2)
+    np.testing.assert_array_equal(trajectory.times, times)
+    np.testing.assert_array_equal(trajectory.q, qs)
+    np.testing.assert_array_equal(trajectory.poses, poses)
+
+    samples = list(trajectory.samples(start=3, step=5))
+    assert [time for time, _ in samples] == list(times[3::5])
+    for (_, q), expected_q in zip(samples, qs[3::5]):
+        np.testing.assert_array_equal(q, expected_q)
+
+
+def test_file_without_poses(tmp_path):
+    path = tmp_path / "log.dqtraj"
+    with TrajectoryWriter(str(path), dim_q=2) as writer:
+        writer.append(0.0, [1.0, 2.0])
+        with pytest.raises(RuntimeError):
+            writer.append(0.1, [1.0, 2.0], np.zeros((1, 8)))
+
+    trajectory = TrajectoryFile(str(path))
+    np.testing.assert_array_equal(trajectory.q, [[1.0, 2.0]])
+    with pytest.raises(RuntimeError):
+        _ = trajectory.poses
+
+
+def test_truncated_last_sample_is_ignored(tmp_path):
+    path = tmp_path / "log.dqtraj"
+    times, qs, _ = _write(path, 10)
+    # As if the writer was killed while writing the last sample
+    with open(path, "r+b") as file:
+        file.truncate(path.stat().st_size - 5)
+
+    trajectory = TrajectoryFile(str(path))
+    assert len(trajectory) == 9
+    np.testing.assert_array_equal(trajectory.times, times[:9])
+    np.testing.assert_array_equal(trajectory.q, qs[:9])
+
+
+def test_empty_trajectory(tmp_path):
+    path = tmp_path / "log.dqtraj"
+    TrajectoryWriter(str(path), dim_q=7).close()
+
+    trajectory = TrajectoryFile(str(path))
+    assert len(trajectory) == 0
+    assert trajectory.q.shape == (0, 7)
+    assert list(trajectory.samples()) == []
+
+
+@pytest.mark.parametrize("content", [b"", b"DQPTRAJ\0", b"not a trajectory file".ljust(64, b"\0")],
+                         ids=["empty", "short", "wrong magic"])
+def test_invalid_file_raises(tmp_path, content):
+    path = tmp_path / "log.dqtraj"
+    path.write_bytes(content)
+    with pytest.raises(RuntimeError, match="trajectory file"):
+        TrajectoryFile(str(path))
@@ -0,0 +1,130 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+
+import dqrobotics_extensions.pyplot as dqp
+from dqrobotics_extensions.pyplot._dq_array import _is_unit, _is_line, _is_plane, _is_pure_quaternion
+
+import numpy as np
+import pytest
+
+_CHECKING_POLICIES = ["strict", "once-per-batch"]
+
+
+def _unit(rng) -> DQ:
+    r = normalize(DQ(rng.standard_normal(4)))
+    return r + 0.5 * E_ * DQ(np.concatenate(([0.0], rng.uniform(-1.0, 1.0, 3)))) * r
+
+
+def _line(rng) -> DQ:
+    l = normalize(DQ(np.concatenate(([0.0], rng.standard_normal(3)))))
+    p = DQ(np.concatenate(([0.0], rng.uniform(-1.0, 1.0, 3))))
+    return l + E_ * cross(p, l)
+
+
+def _plane(rng) -> DQ:
+    n = normalize(DQ(np.concatenate(([0.0], rng.standard_normal(3)))))
+    return n + E_ * rng.uniform(-1.0, 1.0)
+
+
+def _point(rng) -> DQ:
+    return DQ(np.concatenate(([0.0], rng.uniform(-1.0, 1.0, 3))))
+
+
+# For each kind of primitive, the keyword arguments of `plot`, a function drawing a valid DQ, and an invalid DQ
+_KINDS = {
+    "pose": (dict(), _unit, DQ([2, 0, 0, 0, 0, 0, 0, 0])),
+    "line": (dict(line=True), _line, k_ + E_ * 0.5),
+    "plane": (dict(plane=True), _plane, k_ + E_ * i_),
+    "sphere": (dict(sphere=True, radius=0.1, resolution=5), _point, 1 + i_),
+}
+
+
+def _inputs(kind: str, invalid_index=None) -> list:
+    """
+    :return: Five DQs of a kind, the one at `invalid_index` being invalid.
+    """
+    _, valid, invalid = _KINDS[kind]
+    rng = np.random.default_rng(0)
+    return [invalid if i == invalid_index else valid(rng) for i in range(5)]
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+@pytest.mark.parametrize("policy", _CHECKING_POLICIES + ["off"])
+def test_valid_inputs_are_accepted(ax, kind, policy):
+    kwargs, _, _ = _KINDS[kind]
+    dqs = _inputs(kind)
+    dqp.plot(dqs[0], validation=policy, ax=ax, **kwargs)
+    dqp.plot(dqs, validation=policy, ax=ax, **kwargs)
+    dqp.plot(np.array([x.vec8() for x in dqs]), validation=policy, ax=ax, **kwargs)
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+@pytest.mark.parametrize("policy", _CHECKING_POLICIES)
+@pytest.mark.parametrize("global_option", [False, True], ids=["argument", "option"])
+def test_checking_policies_reject_the_same_inputs(ax, kind, policy, global_option):
+    kwargs, _, invalid = _KINDS[kind]
+    if global_option:
+        dqp.set_options(validation=policy)
+    else:
+        kwargs = dict(kwargs, validation=policy)
+    n_artists = len(ax.get_children())
+
+    with pytest.raises(RuntimeError):
+        dqp.plot(invalid, ax=ax, **kwargs)
+    # A single invalid DQ in a sequence or an array stops the whole plot before anything is drawn
+    for invalid_index in (0, 2, 4):
+        dqs = _inputs(kind, invalid_index)
+        with pytest.raises(RuntimeError):
+            dqp.plot(dqs, ax=ax, **kwargs)
+        with pytest.raises(RuntimeError):
+            dqp.plot(np.array([x.vec8() for x in dqs]), ax=ax, **kwargs)
+    assert len(ax.get_children()) == n_artists
+
+
+@pytest.mark.parametrize("kind", _KINDS)
+def test_off_does_not_check(ax, kind):
+    kwargs, _, _ = _KINDS[kind]
+    # The batched plots compute with NumPy, so invalid inputs are drawn, if incorrectly. A single invalid DQ may still be
+    # rejected by dqrobotics itself, e.g., by `translation`.
+    dqp.plot(_inputs(kind, 2), validation="off", ax=ax, **kwargs)
+
+
+@pytest.mark.parametrize("is_valid, is_valid_batch, valid", [(is_unit, _is_unit, _unit),
+                                                             (is_line, _is_line, _line),
+                                                             (is_plane, _is_plane, _plane),
+                                                             (lambda x: is_pure(x) and is_quaternion(x),
+                                                              _is_pure_quaternion,
+                                                              _point)],
+                         ids=["unit", "line", "plane", "pure quaternion"])
+def test_batch_predicates_match_dqrobotics(is_valid, is_valid_batch, valid):
+    rng = np.random.default_rng(1)
+    xs = []
+    for _ in range(20):
+        x = valid(rng).vec8()
+        xs.append(x)
+        # Perturbations well below and well above the threshold of dqrobotics
+        for size in (1e-3 * DQ_threshold, 1e3 * DQ_threshold, 1e-3):
+            xs.append(x + size * rng.standard_normal(8))
+            perturbed = x.copy()
+            perturbed[rng.integers(8)] += size
+            xs.append(perturbed)
+    xs = np.array(xs)
+    np.testing.assert_array_equal(is_valid_batch(xs), [is_valid(DQ(x)) for x in xs])
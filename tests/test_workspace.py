@@ -0,0 +1,93 @@
+"""
+Copyright (C) 2025 Murilo Marques Marinho (www.murilomarinho.info)
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+Author: Murilo M. Marinho
+"""
+from dqrobotics import *
+from dqrobotics.robot_modeling import DQ_SerialManipulatorDenso
+from dqrobotics.robots import KukaLw4Robot
+
+import dqrobotics_extensions.pyplot as dqp
+
+import numpy as np
+import pytest
+
+
+def _expected_positions(robot, n_samples: int, chunk_size: int, seed) -> np.ndarray:
+    """
+    The positions of the end effector sampled by `sample_workspace`, calculated with `robot.fkm`: one random generator
+    per chunk spawned from `seed`, and joint configurations uniform in [-pi, pi].
+    """
+    n = robot.get_dim_configuration_space()
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    positions = []
+    for size, chunk_seed in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))):
+        qs = np.random.default_rng(chunk_seed).uniform(np.full(n, -np.pi), np.full(n, np.pi), size=(size, n))
+        positions.extend(translation(robot.fkm(q)).q[1:4] for q in qs)
+    return np.array(positions)
+
+
+@pytest.fixture
+def robot(random_unit_dq):
+    robot = KukaLw4Robot.kinematics()
+    robot.set_reference_frame(random_unit_dq(np.random.default_rng(0)))
+    return robot
+
+
+def test_histogram_matches_histogramdd(robot):
+    histogram = dqp.sample_workspace(robot, 2000, bins=(6, 7, 8), chunk_size=300, seed=1)
+
+    positions = _expected_positions(robot, 2000, 300, seed=1)
+    expected, _ = np.histogramdd(positions, bins=histogram.bins, range=list(zip(histogram.lower, histogram.upper)))
+    assert histogram.total == 2000
+    assert histogram.outside == 0
+    np.testing.assert_array_equal(histogram.counts, expected)
+
+
+@pytest.mark.parametrize("start_method", [None, "spawn"])
+def test_processes_do_not_change_the_histogram(robot, start_method):
+    kwargs = dict(n_samples=3000, bins=8, chunk_size=500, seed=2)
+    histogram = dqp.sample_workspace(robot, processes=1, **kwargs)
+    histogram_parallel = dqp.sample_workspace(robot, processes=2, start_method=start_method, **kwargs)
+
+    assert histogram_parallel.total == histogram.total == 3000
+    np.testing.assert_array_equal(histogram_parallel.counts, histogram.counts)
+
+
+def test_other_robots_need_limits_bounds_and_fork():
+    robot = DQ_SerialManipulatorDenso(np.random.default_rng(3).uniform(-0.5, 0.5, (6, 3)))
+    limits = dict(lower_q=np.full(3, -np.pi), upper_q=np.full(3, np.pi))
+    with pytest.raises(RuntimeError, match="joint limits"):
+        dqp.sample_workspace(robot, 10)
+    with pytest.raises(RuntimeError, match="bounds"):
+        dqp.sample_workspace(robot, 10, **limits)
+
+    bounds = ([-2, -2, -2], [2, 2, 2])
+    histogram = dqp.sample_workspace(robot, 100, bounds=bounds, chunk_size=50, seed=4, **limits)
+    expected, _ = np.histogramdd(_expected_positions(robot, 100, 50, seed=4), bins=64, range=list(zip(*bounds)))
+    np.testing.assert_array_equal(histogram.counts, expected)
+    with pytest.raises(RuntimeError, match="'spawn'"):
+        dqp.sample_workspace(robot, 100, bounds=bounds, chunk_size=50, processes=2, start_method="spawn", **limits)
+
+
+def test_points_outside_the_grid_are_counted():
+    histogram = dqp.WorkspaceHistogram(lower=[0, 0, 0], upper=[1, 2, 3], bins=(2, 2, 3))
+    histogram.add([[0.25, 0.5, 0.5], [1.0, 2.0, 3.0], [1.0, 2.0, 3.1], [-0.1, 0.0, 0.0]])
+    assert histogram.total == 4
+    assert histogram.outside == 2
+    # Points on the upper faces are counted in the last voxels
+    assert histogram.counts[0, 0, 0] == 1 and histogram.counts[1, 1, 2] == 1